@@ -12,8 +12,10 @@ Keyword arguments for the callback are not supported; this is a
 conscious design decision, leaving the door open for keyword arguments
 to modify the meaning of the API call itself.
 """
+import bisect
 import collections
 import concurrent.futures
+import functools
 import heapq
 import inspect
 import itertools
@@ -37,6 +39,13 @@ from .log import logger
 __all__ = ['BaseEventLoop']
 _MIN_SCHEDULED_TIMER_HANDLES = 100
 _MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
+_TIMER_WHEEL_RESOLUTION = 1.0
+CALLBACK_HISTOGRAM_BOUNDS = 0.001, 0.01, 0.1, 1.0
+LoopStats = collections.namedtuple('LoopStats', ['iterations',
+    'iteration_time', 'max_iteration_time', 'max_ready', 'callbacks',
+    'callback_histogram', 'timers'])
+ResolverStats = collections.namedtuple('ResolverStats', ['hits', 'misses',
+    'coalesced', 'errors', 'entries'])
 _FATAL_ERROR_IGNORE = (BrokenPipeError, ConnectionResetError,
     ConnectionAbortedError)
 
@@ -187,6 +196,93 @@ class Server(events.AbstractServer):
         yield from waiter
 
 
+class _StatsCounters:
+    """Counters updated by BaseEventLoop._run_once() while stats are
+    enabled."""
+
+    def __init__(self):
+        self.iterations = 0
+        self.iteration_time = 0.0
+        self.max_iteration_time = 0.0
+        self.max_ready = 0
+        self.callbacks = 0
+        self.callback_histogram = [0] * (len(CALLBACK_HISTOGRAM_BOUNDS) + 1)
+
+
+def _copy_addrinfo_result(waiter, fut):
+    if waiter.cancelled():
+        return
+    if fut.cancelled():
+        waiter.cancel()
+        return
+    exc = fut.exception()
+    if exc is not None:
+        waiter.set_exception(exc)
+    else:
+        waiter.set_result(list(fut.result()))
+
+
+class _ResolverCache:
+    """Cache of getaddrinfo() results used by BaseEventLoop.getaddrinfo().
+
+    Results are kept for ttl seconds, at most maxsize of them, evicting
+    the least recently used first.  Concurrent lookups of the same
+    arguments share a single call to the underlying resolver; failed
+    lookups are not cached.
+    """
+
+    def __init__(self, loop, resolve, ttl, maxsize):
+        self._loop = loop
+        self._resolve = resolve
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def getaddrinfo(self, key):
+        loop = self._loop
+        waiter = loop.create_future()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, infos = entry
+            if expires > loop.time():
+                self.hits += 1
+                self._entries.move_to_end(key)
+                waiter.set_result(list(infos))
+                return waiter
+            del self._entries[key]
+        fut = self._pending.get(key)
+        if fut is None:
+            self.misses += 1
+            fut = self._resolve(*key)
+            self._pending[key] = fut
+            fut.add_done_callback(functools.partial(self._store, key))
+        else:
+            self.coalesced += 1
+        fut.add_done_callback(functools.partial(_copy_addrinfo_result,
+            waiter))
+        return waiter
+
+    def _store(self, key, fut):
+        if self._pending.get(key) is fut:
+            del self._pending[key]
+        if fut.cancelled() or fut.exception() is not None:
+            self.errors += 1
+            return
+        self._entries[key] = self._loop.time() + self._ttl, tuple(fut.
+            result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
@@ -195,6 +291,12 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = {}
+        self._timer_wheel_keys = []
+        self._timer_wheel_count = 0
+        self._timer_wheel_limit = None
+        self._stats = None
+        self._resolver_cache = None
         self._default_executor = None
         self._internal_fds = 0
         self._thread_id = None
@@ -413,6 +515,13 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        for bucket in self._timer_wheel.values():
+            for handle in bucket.values():
+                handle._wheel_key = None
+                handle._scheduled = False
+        self._timer_wheel.clear()
+        self._timer_wheel_keys.clear()
+        self._timer_wheel_count = 0
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
@@ -476,10 +585,51 @@ class BaseEventLoop(events.AbstractEventLoop):
         timer = events.TimerHandle(when, callback, args, self)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        key = int(when // _TIMER_WHEEL_RESOLUTION)
+        limit = self._timer_wheel_limit
+        if limit is None or key <= limit:
+            heapq.heappush(self._scheduled, timer)
+        else:
+            bucket = self._timer_wheel.get(key)
+            if bucket is None:
+                bucket = self._timer_wheel[key] = {}
+                heapq.heappush(self._timer_wheel_keys, key)
+            bucket[id(timer)] = timer
+            timer._wheel_key = key
+            self._timer_wheel_count += 1
         timer._scheduled = True
         return timer
 
+    def _advance_timer_wheel(self, now):
+        """Move the timers due before the end of the next slot from the
+        timer wheel to _scheduled.
+
+        call_at() only puts timers due by then in the _scheduled heap.
+        Later timers go into a per-slot dict of the timer wheel, where
+        adding and cancelling them is O(1) and they do not slow down the
+        heap operations of _run_once().
+        """
+        limit = self._timer_wheel_limit = int(now // _TIMER_WHEEL_RESOLUTION
+            ) + 1
+        keys = self._timer_wheel_keys
+        while keys and keys[0] <= limit:
+            bucket = self._timer_wheel.pop(heapq.heappop(keys), None)
+            if bucket:
+                self._timer_wheel_count -= len(bucket)
+                for handle in bucket.values():
+                    handle._wheel_key = None
+                    heapq.heappush(self._scheduled, handle)
+
+    def _next_timer_wheel_wakeup(self):
+        """Return when _run_once() has to move timers from the timer
+        wheel to _scheduled, or None."""
+        keys = self._timer_wheel_keys
+        while keys and keys[0] not in self._timer_wheel:
+            heapq.heappop(keys)
+        if not keys:
+            return None
+        return (keys[0] - 1) * _TIMER_WHEEL_RESOLUTION
+
     def call_soon(self, callback, *args):
         """Arrange for a callback to be called as soon as possible.
 
@@ -581,6 +731,12 @@ class BaseEventLoop(events.AbstractEventLoop):
         return addrinfo
 
     def getaddrinfo(self, host, port, *, family=0, type=0, proto=0, flags=0):
+        if self._resolver_cache is not None:
+            return self._resolver_cache.getaddrinfo((host, port, family,
+                type, proto, flags))
+        return self._getaddrinfo(host, port, family, type, proto, flags)
+
+    def _getaddrinfo(self, host, port, family, type, proto, flags):
         if self._debug:
             return self.run_in_executor(None, self._getaddrinfo_debug, host,
                 port, family, type, proto, flags)
@@ -1140,7 +1296,17 @@ class BaseEventLoop(events.AbstractEventLoop):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            key = handle._wheel_key
+            if key is None:
+                self._timer_cancelled_count += 1
+            else:
+                bucket = self._timer_wheel[key]
+                del bucket[id(handle)]
+                if not bucket:
+                    del self._timer_wheel[key]
+                self._timer_wheel_count -= 1
+                handle._wheel_key = None
+                handle._scheduled = False
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1170,9 +1336,13 @@ class BaseEventLoop(events.AbstractEventLoop):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
-            when = self._scheduled[0]._when
-            timeout = max(0, when - self.time())
+        else:
+            when = self._next_timer_wheel_wakeup()
+            if self._scheduled:
+                if when is None or self._scheduled[0]._when < when:
+                    when = self._scheduled[0]._when
+            if when is not None:
+                timeout = max(0, when - self.time())
         if self._debug and timeout != 0:
             t0 = self.time()
             event_list = self._selector.select(timeout)
@@ -1194,7 +1364,9 @@ class BaseEventLoop(events.AbstractEventLoop):
         else:
             event_list = self._selector.select(timeout)
         self._process_events(event_list)
-        end_time = self.time() + self._clock_resolution
+        now = self.time()
+        end_time = now + self._clock_resolution
+        self._advance_timer_wheel(end_time)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1203,6 +1375,15 @@ class BaseEventLoop(events.AbstractEventLoop):
             handle._scheduled = False
             self._ready.append(handle)
         ntodo = len(self._ready)
+        stats = self._stats
+        if stats is not None:
+            self._run_ready_with_stats(ntodo, stats)
+            stats.iterations += 1
+            stats.max_ready = max(stats.max_ready, ntodo)
+            dt = self.time() - now
+            stats.iteration_time += dt
+            stats.max_iteration_time = max(stats.max_iteration_time, dt)
+            return
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
@@ -1222,6 +1403,25 @@ class BaseEventLoop(events.AbstractEventLoop):
                 handle._run()
         handle = None
 
+    def _run_ready_with_stats(self, ntodo, stats):
+        histogram = stats.callback_histogram
+        for i in range(ntodo):
+            handle = self._ready.popleft()
+            if handle._cancelled:
+                continue
+            self._current_handle = handle
+            try:
+                t0 = self.time()
+                handle._run()
+                dt = self.time() - t0
+            finally:
+                self._current_handle = None
+            stats.callbacks += 1
+            histogram[bisect.bisect_right(CALLBACK_HISTOGRAM_BOUNDS, dt)] += 1
+            if self._debug and dt >= self.slow_callback_duration:
+                logger.warning('Executing %s took %.3f seconds',
+                    _format_handle(handle), dt)
+
     def _set_coroutine_wrapper(self, enabled):
         try:
             set_wrapper = sys.set_coroutine_wrapper
@@ -1252,6 +1452,65 @@ class BaseEventLoop(events.AbstractEventLoop):
     def get_debug(self):
         return self._debug
 
+    def set_stats_enabled(self, enabled):
+        """Start or stop collecting the statistics returned by get_stats().
+
+        Enabling resets the statistics.
+        """
+        self._stats = _StatsCounters() if enabled else None
+
+    def get_stats(self):
+        """Return a LoopStats tuple, or None if stats are not enabled.
+
+        iterations, iteration_time and max_iteration_time count the loop
+        iterations and the seconds they spent outside of the selector,
+        max_ready is the longest ready queue processed in an iteration,
+        callbacks is the number of callbacks run and callback_histogram
+        the number of callbacks per duration range, split at the bounds in
+        CALLBACK_HISTOGRAM_BOUNDS.  timers is the number of scheduled
+        timers, including cancelled ones not removed yet.
+        """
+        stats = self._stats
+        if stats is None:
+            return None
+        return LoopStats(stats.iterations, stats.iteration_time, stats.
+            max_iteration_time, stats.max_ready, stats.callbacks, tuple(
+            stats.callback_histogram), len(self._scheduled) + self.
+            _timer_wheel_count)
+
+    def set_resolver_cache(self, ttl, maxsize=1024):
+        """Cache the results of getaddrinfo() for ttl seconds.
+
+        At most maxsize results are kept, and concurrent lookups of the
+        same address share a single call to socket.getaddrinfo().  This
+        also applies to the lookups made by create_connection(),
+        create_server() and create_datagram_endpoint().  A ttl of None
+        disables the cache and discards its contents.
+        """
+        if ttl is None:
+            self._resolver_cache = None
+            return
+        if ttl < 0:
+            raise ValueError('ttl must be a non-negative number')
+        if maxsize <= 0:
+            raise ValueError('maxsize must be a positive integer')
+        self._resolver_cache = _ResolverCache(self, self._getaddrinfo, ttl,
+            maxsize)
+
+    def get_resolver_stats(self):
+        """Return a ResolverStats tuple, or None if the cache is disabled.
+
+        hits and misses count the lookups answered from the cache and
+        those passed to the resolver, coalesced the lookups which waited
+        for an identical lookup already in progress, errors the failed
+        lookups and entries the number of cached results.
+        """
+        cache = self._resolver_cache
+        if cache is None:
+            return None
+        return ResolverStats(cache.hits, cache.misses, cache.coalesced,
+            cache.errors, len(cache))
+
     def set_debug(self, enabled):
         self._debug = enabled
         if self.is_running():
@@ -125,7 +125,7 @@ class Handle:
 
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
-    __slots__ = ['_scheduled', '_when']
+    __slots__ = ['_scheduled', '_when', '_wheel_key']
 
     def __init__(self, when, callback, args, loop):
         assert when is not None
@@ -134,6 +134,7 @@ class TimerHandle(Handle):
             del self._source_traceback[-1]
         self._when = when
         self._scheduled = False
+        self._wheel_key = None
 
     def _repr_info(self):
         info = super()._repr_info()
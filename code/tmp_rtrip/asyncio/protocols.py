@@ -1,6 +1,6 @@
 """Abstract Protocol class."""
-__all__ = ['BaseProtocol', 'Protocol', 'DatagramProtocol', 'SubprocessProtocol'
-    ]
+__all__ = ['BaseProtocol', 'Protocol', 'BufferedProtocol',
+    'DatagramProtocol', 'SubprocessProtocol']
 
 
 class BaseProtocol:
@@ -99,6 +99,67 @@ class Protocol(BaseProtocol):
         """
 
 
+class BufferedProtocol(BaseProtocol):
+    """Interface for stream protocol with manual control of the receive
+    buffer.
+
+    Transports that support it receive data directly into the buffer
+    returned by get_buffer(), avoiding the allocation of a bytes object
+    per read.  Other transports call data_received(), which copies the
+    data into buffers obtained from get_buffer().
+
+    State machine of calls:
+
+      start -> CM [-> GB [-> BU?]]* [-> ER?] -> CL -> end
+
+    * CM: connection_made()
+    * GB: get_buffer()
+    * BU: buffer_updated()
+    * ER: eof_received()
+    * CL: connection_lost()
+    """
+
+    def get_buffer(self, sizehint):
+        """Called to allocate a new receive buffer.
+
+        sizehint is the recommended minimal size for the returned
+        buffer, or -1 if there is no recommendation.  The method must
+        return a non-empty writable buffer, such as a bytearray or a
+        memoryview of one.
+        """
+        raise NotImplementedError
+
+    def buffer_updated(self, nbytes):
+        """Called when the buffer was updated with the received data.
+
+        nbytes is the number of bytes written to the start of the buffer
+        returned by the last get_buffer() call.
+        """
+        raise NotImplementedError
+
+    def data_received(self, data):
+        """Feed data received by a transport that does not call
+        get_buffer() to get_buffer() and buffer_updated()."""
+        data = memoryview(data)
+        while data:
+            buf = memoryview(self.get_buffer(len(data))).cast('B')
+            if not buf:
+                raise RuntimeError('get_buffer() returned an empty buffer')
+            n = min(len(buf), len(data))
+            buf[:n] = data[:n]
+            buf.release()
+            self.buffer_updated(n)
+            data = data[n:]
+
+    def eof_received(self):
+        """Called when the other end calls write_eof() or equivalent.
+
+        If this returns a false value (including None), the transport
+        will close itself.  If it returns a true value, closing the
+        transport is up to the protocol.
+        """
+
+
 class DatagramProtocol(BaseProtocol):
     """Interface for datagram protocol."""
 
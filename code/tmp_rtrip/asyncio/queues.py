@@ -6,6 +6,8 @@ from . import compat
 from . import events
 from . import locks
 from .coroutines import coroutine
+QueueStats = collections.namedtuple('QueueStats', ['size', 'peak_size',
+    'puts', 'gets', 'getters', 'putters', 'put_wait_time', 'get_wait_time'])
 
 
 class QueueEmpty(Exception):
@@ -22,6 +24,11 @@ class QueueFull(Exception):
     pass
 
 
+def _release_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class Queue:
     """A queue, useful for coordinating producer and consumer coroutines.
 
@@ -45,6 +52,11 @@ class Queue:
         self._unfinished_tasks = 0
         self._finished = locks.Event(loop=self._loop)
         self._finished.set()
+        self._peak_size = 0
+        self._puts = 0
+        self._gets = 0
+        self._put_wait_time = 0.0
+        self._get_wait_time = 0.0
         self._init(maxsize)
 
     def _init(self, maxsize):
@@ -63,6 +75,11 @@ class Queue:
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, count):
+        while waiters and count > 0:
+            self._wakeup_next(waiters)
+            count -= 1
+
     def __repr__(self):
         return '<{} at {:#x} {}>'.format(type(self).__name__, id(self),
             self._format())
@@ -115,18 +132,27 @@ class Queue:
 
         This method is a coroutine.
         """
-        while self.full():
-            putter = self._loop.create_future()
-            self._putters.append(putter)
-            try:
-                yield from putter
-            except:
-                putter.cancel()
-                if not self.full() and not putter.cancelled():
-                    self._wakeup_next(self._putters)
-                raise
+        if self.full():
+            yield from self._wait_for_free_slot()
         return self.put_nowait(item)
 
+    @coroutine
+    def _wait_for_free_slot(self):
+        start = self._loop.time()
+        try:
+            while self.full():
+                putter = self._loop.create_future()
+                self._putters.append(putter)
+                try:
+                    yield from putter
+                except:
+                    putter.cancel()
+                    if not self.full() and not putter.cancelled():
+                        self._wakeup_next(self._putters)
+                    raise
+        finally:
+            self._put_wait_time += self._loop.time() - start
+
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
 
@@ -136,9 +162,61 @@ class Queue:
             raise QueueFull
         self._put(item)
         self._unfinished_tasks += 1
+        self._puts += 1
         self._finished.clear()
+        size = self.qsize()
+        if size > self._peak_size:
+            self._peak_size = size
         self._wakeup_next(self._getters)
 
+    @coroutine
+    def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        The items are added as soon as free slots are available, and
+        waiting getters are woken once for each group of items added
+        together rather than once per item.  With a bounded queue,
+        consumers may thus see the first items before the last ones
+        are added.
+
+        This method is a coroutine.
+        """
+        items = list(items)
+        i = 0
+        while i < len(items):
+            if self.full():
+                yield from self._wait_for_free_slot()
+            if self._maxsize <= 0:
+                n = len(items) - i
+            else:
+                n = min(len(items) - i, self._maxsize - self.qsize())
+            self._put_items(items[i:i + n])
+            i += n
+
+    def put_many_nowait(self, items):
+        """Put all items of an iterable into the queue without blocking.
+
+        Either all items are added or, if there are not enough free
+        slots, none of them is and QueueFull is raised.
+        """
+        items = list(items)
+        if self._maxsize > 0 and self.qsize() + len(items) > self._maxsize:
+            raise QueueFull
+        self._put_items(items)
+
+    def _put_items(self, items):
+        if not items:
+            return
+        for item in items:
+            self._put(item)
+        self._unfinished_tasks += len(items)
+        self._puts += len(items)
+        self._finished.clear()
+        size = self.qsize()
+        if size > self._peak_size:
+            self._peak_size = size
+        self._wakeup_many(self._getters, len(items))
+
     @coroutine
     def get(self):
         """Remove and return an item from the queue.
@@ -147,18 +225,50 @@ class Queue:
 
         This method is a coroutine.
         """
-        while self.empty():
-            getter = self._loop.create_future()
-            self._getters.append(getter)
-            try:
-                yield from getter
-            except:
-                getter.cancel()
-                if not self.empty() and not getter.cancelled():
-                    self._wakeup_next(self._getters)
-                raise
+        if self.empty():
+            yield from self._wait_for_item(None)
         return self.get_nowait()
 
+    @coroutine
+    def _wait_for_item(self, timeout):
+        start = self._loop.time()
+        try:
+            while self.empty():
+                if timeout is not None:
+                    remaining = start + timeout - self._loop.time()
+                    if remaining <= 0:
+                        return
+                getter = self._loop.create_future()
+                self._getters.append(getter)
+                if timeout is None:
+                    handle = None
+                else:
+                    handle = self._loop.call_later(remaining, self.
+                        _getter_timeout, getter)
+                try:
+                    yield from getter
+                except:
+                    getter.cancel()
+                    self._discard_getter(getter)
+                    if not self.empty() and not getter.cancelled():
+                        self._wakeup_next(self._getters)
+                    raise
+                finally:
+                    if handle is not None:
+                        handle.cancel()
+        finally:
+            self._get_wait_time += self._loop.time() - start
+
+    def _discard_getter(self, getter):
+        try:
+            self._getters.remove(getter)
+        except ValueError:
+            pass
+
+    def _getter_timeout(self, getter):
+        self._discard_getter(getter)
+        _release_waiter(getter)
+
     def get_nowait(self):
         """Remove and return an item from the queue.
 
@@ -167,9 +277,51 @@ class Queue:
         if self.empty():
             raise QueueEmpty
         item = self._get()
+        self._gets += 1
         self._wakeup_next(self._putters)
         return item
 
+    @coroutine
+    def get_batch(self, max_items=None, timeout=None):
+        """Remove and return a list of up to max_items items.
+
+        If the queue is empty, wait until an item is available, but for
+        no more than timeout seconds if timeout is not None; an empty
+        list is returned if it expires.  All the items available at that
+        point, up to max_items, are then returned at once, so a consumer
+        is woken once per batch instead of once per item.  Each item
+        still needs its own task_done() call.
+
+        This method is a coroutine.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        if self.empty():
+            yield from self._wait_for_item(timeout)
+            if self.empty():
+                return []
+        return self.get_batch_nowait(max_items)
+
+    def get_batch_nowait(self, max_items=None):
+        """Remove and return a list of up to max_items items.
+
+        Return all the available items, or max_items of them if there
+        are more, else raise QueueEmpty.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        if self.empty():
+            raise QueueEmpty
+        n = self.qsize()
+        if max_items is not None and max_items < n:
+            n = max_items
+        items = [self._get() for _ in range(n)]
+        self._gets += n
+        self._wakeup_many(self._putters, n)
+        if not self.empty():
+            self._wakeup_next(self._getters)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -202,6 +354,19 @@ class Queue:
         if self._unfinished_tasks > 0:
             yield from self._finished.wait()
 
+    def stats(self):
+        """Return a QueueStats tuple describing the queue.
+
+        size and peak_size are the current and largest number of queued
+        items, puts and gets count the items added and removed, getters
+        and putters the coroutines currently blocked, and put_wait_time
+        and get_wait_time the total number of seconds they spent waiting.
+        """
+        return QueueStats(self.qsize(), self._peak_size, self._puts, self.
+            _gets, sum(1 for w in self._getters if not w.done()), sum(1 for
+            w in self._putters if not w.done()), self._put_wait_time, self.
+            _get_wait_time)
+
 
 class PriorityQueue(Queue):
     """A subclass of Queue; retrieves entries in priority order (lowest first).
@@ -7,6 +7,8 @@ __all__ = ['BaseSelectorEventLoop']
 import collections
 import errno
 import functools
+import itertools
+import os
 import socket
 import warnings
 import weakref
@@ -19,11 +21,20 @@ from . import compat
 from . import constants
 from . import events
 from . import futures
+from . import protocols
 from . import selectors
 from . import transports
 from . import sslproto
 from .coroutines import coroutine
 from .log import logger
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+if _HAS_SENDMSG:
+    try:
+        SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, OSError, ValueError):
+        SC_IOV_MAX = 16
+WriteBufferStats = collections.namedtuple('WriteBufferStats', ['size',
+    'buffers', 'peak_size', 'writes', 'sends', 'bytes_sent'])
 
 
 def _test_selector_event(selector, fd, event):
@@ -600,10 +611,17 @@ class _SelectorTransport(transports._FlowControlMixin, transports.Transport):
 
 
 class _SelectorSocketTransport(_SelectorTransport):
+    _buffer_factory = collections.deque
 
     def __init__(self, loop, sock, protocol, waiter=None, extra=None,
         server=None):
         super().__init__(loop, sock, protocol, extra, server)
+        self.set_protocol(protocol)
+        self._buffer_size = 0
+        self._peak_buffer_size = 0
+        self._writes = 0
+        self._sends = 0
+        self._bytes_sent = 0
         self._eof = False
         self._paused = False
         _set_nodelay(self._sock)
@@ -634,7 +652,44 @@ class _SelectorSocketTransport(_SelectorTransport):
         if self._loop.get_debug():
             logger.debug('%r resumes reading', self)
 
+    def set_protocol(self, protocol):
+        if isinstance(protocol, protocols.BufferedProtocol):
+            self._read_ready_cb = self._read_ready__get_buffer
+        else:
+            self._read_ready_cb = self._read_ready__data_received
+        super().set_protocol(protocol)
+
     def _read_ready(self):
+        self._read_ready_cb()
+
+    def _read_ready__get_buffer(self):
+        if self._conn_lost:
+            return
+        try:
+            buf = self._protocol.get_buffer(-1)
+            if not len(buf):
+                raise RuntimeError('get_buffer() returned an empty buffer')
+        except Exception as exc:
+            self._fatal_error(exc,
+                'Fatal error: protocol.get_buffer() call failed.')
+            return
+        try:
+            nbytes = self._sock.recv_into(buf)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as exc:
+            self._fatal_error(exc, 'Fatal read error on socket transport')
+            return
+        if not nbytes:
+            self._read_ready__on_eof()
+            return
+        try:
+            self._protocol.buffer_updated(nbytes)
+        except Exception as exc:
+            self._fatal_error(exc,
+                'Fatal error: protocol.buffer_updated() call failed.')
+
+    def _read_ready__data_received(self):
         if self._conn_lost:
             return
         try:
@@ -647,13 +702,16 @@ class _SelectorSocketTransport(_SelectorTransport):
             if data:
                 self._protocol.data_received(data)
             else:
-                if self._loop.get_debug():
-                    logger.debug('%r received EOF', self)
-                keep_open = self._protocol.eof_received()
-                if keep_open:
-                    self._loop._remove_reader(self._sock_fd)
-                else:
-                    self.close()
+                self._read_ready__on_eof()
+
+    def _read_ready__on_eof(self):
+        if self._loop.get_debug():
+            logger.debug('%r received EOF', self)
+        keep_open = self._protocol.eof_received()
+        if keep_open:
+            self._loop._remove_reader(self._sock_fd)
+        else:
+            self.close()
 
     def write(self, data):
         if not isinstance(data, (bytes, bytearray, memoryview)):
@@ -669,6 +727,7 @@ class _SelectorSocketTransport(_SelectorTransport):
                 logger.warning('socket.send() raised exception.')
             self._conn_lost += 1
             return
+        self._writes += 1
         if not self._buffer:
             try:
                 n = self._sock.send(data)
@@ -678,19 +737,84 @@ class _SelectorSocketTransport(_SelectorTransport):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
+                self._sends += 1
+                self._bytes_sent += n
+                data = memoryview(data).cast('B')[n:]
                 if not data:
                     return
             self._loop._add_writer(self._sock_fd, self._write_ready)
-        self._buffer.extend(data)
+        self._buffer_append(data)
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data):
+        """Write a list (or any iterable) of data bytes to the transport.
+
+        The buffers are not concatenated: they are passed together to
+        socket.sendmsg() where it is available, and bytes objects which
+        cannot be sent immediately are queued without being copied.
+        """
+        list_of_data = list(list_of_data)
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(
+                    'data argument must be a bytes-like object, not %r' %
+                    type(data).__name__)
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+        self._writes += 1
+        was_empty = not self._buffer
+        for data in list_of_data:
+            if data:
+                self._buffer_append(data)
+        if was_empty and self._buffer:
+            self._write_ready()
+            if self._buffer:
+                self._loop._add_writer(self._sock_fd, self._write_ready)
         self._maybe_pause_protocol()
 
+    def _buffer_append(self, data):
+        data = memoryview(data)
+        if isinstance(data.obj, bytes) and data.c_contiguous:
+            data = data.cast('B')
+        else:
+            data = memoryview(bytes(data))
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        if self._buffer_size > self._peak_buffer_size:
+            self._peak_buffer_size = self._buffer_size
+
+    def _buffer_consume(self, n):
+        self._bytes_sent += n
+        self._buffer_size -= n
+        buffer = self._buffer
+        while n:
+            data = buffer.popleft()
+            if len(data) > n:
+                buffer.appendleft(data[n:])
+                break
+            n -= len(data)
+
     def _write_ready(self):
         assert self._buffer, 'Data should not be empty'
         if self._conn_lost:
             return
+        buffer = self._buffer
         try:
-            n = self._sock.send(self._buffer)
+            if len(buffer) == 1:
+                n = self._sock.send(buffer[0])
+            elif _HAS_SENDMSG:
+                n = self._sock.sendmsg(list(itertools.islice(buffer,
+                    SC_IOV_MAX)))
+            else:
+                data = memoryview(b''.join(buffer))
+                buffer.clear()
+                buffer.append(data)
+                n = self._sock.send(data)
         except (BlockingIOError, InterruptedError):
             pass
         except Exception as exc:
@@ -698,8 +822,9 @@ class _SelectorSocketTransport(_SelectorTransport):
             self._buffer.clear()
             self._fatal_error(exc, 'Fatal write error on socket transport')
         else:
+            self._sends += 1
             if n:
-                del self._buffer[:n]
+                self._buffer_consume(n)
             self._maybe_resume_protocol()
             if not self._buffer:
                 self._loop._remove_writer(self._sock_fd)
@@ -718,6 +843,24 @@ class _SelectorSocketTransport(_SelectorTransport):
     def can_write_eof(self):
         return True
 
+    def _force_close(self, exc):
+        self._buffer_size = 0
+        super()._force_close(exc)
+
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
+    def get_write_buffer_stats(self):
+        """Return a WriteBufferStats tuple for this transport.
+
+        size and buffers describe the data currently queued, peak_size is
+        the largest size reached, writes counts write() and writelines()
+        calls and sends counts the send() and sendmsg() system calls which
+        transmitted bytes_sent bytes in total.
+        """
+        return WriteBufferStats(self._buffer_size, len(self._buffer), self.
+            _peak_buffer_size, self._writes, self._sends, self._bytes_sent)
+
 
 class _SelectorSslTransport(_SelectorTransport):
     _buffer_factory = bytearray
@@ -470,6 +470,27 @@ class StreamReader:
         LimitOverrunError exception  will be raised, and the data
         will be left in the internal buffer, so it can be read again.
         """
+        n = yield from self._wait_for_separator(separator)
+        data = self._take(n)
+        self._maybe_resume_transport()
+        return data
+
+    @coroutine
+    def readuntil_view(self, separator=b'\n'):
+        """Like readuntil(), but return a memoryview of the data.
+
+        The frame is usually not copied: the internal buffer is handed
+        over to the returned memoryview and only the bytes following the
+        frame are moved to a new buffer.  The memoryview is not shared
+        with the stream and remains valid after further reads.
+        """
+        n = yield from self._wait_for_separator(separator)
+        view = self._take_view(n)
+        self._maybe_resume_transport()
+        return view
+
+    @coroutine
+    def _wait_for_separator(self, separator):
         seplen = len(separator)
         if seplen == 0:
             raise ValueError('Separator should be at least one-byte string')
@@ -495,10 +516,86 @@ class StreamReader:
         if isep > self._limit:
             raise LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
+        return isep + seplen
+
+    @coroutine
+    def _read_lines(self, n):
+        if self._exception is not None:
+            raise self._exception
+        limit = max(n, self._limit)
+        while True:
+            buf = self._buffer
+            end = buf.rfind(b'\n', 0, n)
+            if end == -1:
+                end = buf.find(b'\n', n)
+            if end != -1:
+                if end > limit:
+                    raise LimitOverrunError(
+                        'Separator is found, but chunk is longer than limit',
+                        end)
+                data = self._take(end)
+                del self._buffer[:1]
+                break
+            if self._eof:
+                if not buf:
+                    return []
+                data = self._take(len(buf))
+                break
+            if len(buf) > limit:
+                raise LimitOverrunError(
+                    'Separator is not found, and chunk exceed the limit',
+                    len(buf))
+            yield from self._wait_for_data('iter_chunks')
         self._maybe_resume_transport()
-        return bytes(chunk)
+        return data.split(b'\n')
+
+    def iter_chunks(self, chunk_size=None, lines=False):
+        """Return an asynchronous iterator over the data of the stream.
+
+        Each iteration waits until data is available and yields at most
+        chunk_size bytes (the stream limit by default) as soon as they
+        have arrived, so large outputs are consumed in a few big reads
+        instead of one coroutine call per line.  Iteration stops at EOF.
+
+        If lines is true, each iteration instead yields a list of the
+        complete lines found in the first chunk_size bytes of the buffer,
+        split in one operation and without their b'\\n' terminators.  A
+        line longer than chunk_size is yielded on its own; one longer than
+        both chunk_size and the stream limit raises LimitOverrunError and
+        is left in the buffer.  An incomplete last line is yielded at EOF.
+        """
+        if chunk_size is None:
+            chunk_size = self._limit
+        elif chunk_size <= 0:
+            raise ValueError('chunk_size must be a positive integer')
+        return _StreamChunks(self, chunk_size, lines)
+
+    def _take(self, n):
+        """Remove the first n bytes of the buffer and return them as bytes,
+        copying them once."""
+        if len(self._buffer) == n:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            with memoryview(self._buffer) as view:
+                data = bytes(view[:n])
+            del self._buffer[:n]
+        return data
+
+    def _take_view(self, n):
+        """Remove the first n bytes of the buffer and return them as a
+        memoryview.
+
+        When fewer bytes follow the frame than it contains, the buffer
+        itself is given to the memoryview and the remainder is moved to
+        a new buffer, so that at most min(n, len(buffer) - n) bytes are
+        copied.
+        """
+        buf = self._buffer
+        if len(buf) - n > n:
+            return memoryview(self._take(n))
+        self._buffer = buf[n:]
+        return memoryview(buf)[:n]
 
     @coroutine
     def read(self, n=-1):
@@ -535,8 +632,7 @@ class StreamReader:
             return b''.join(blocks)
         if not self._buffer and not self._eof:
             yield from self._wait_for_data('read')
-        data = bytes(self._buffer[:n])
-        del self._buffer[:n]
+        data = self._take(min(n, len(self._buffer)))
         self._maybe_resume_transport()
         return data
 
@@ -562,20 +658,37 @@ class StreamReader:
             raise self._exception
         if n == 0:
             return b''
+        yield from self._wait_for_size(n, 'readexactly')
+        data = self._take(n)
+        self._maybe_resume_transport()
+        return data
+
+    @coroutine
+    def readexactly_view(self, n):
+        """Like readexactly(), but return a memoryview of the data.
+
+        This is meant for length-prefixed framing: the frame is usually
+        not copied, see readuntil_view().
+        """
+        if n < 0:
+            raise ValueError('readexactly size can not be less than zero')
+        if self._exception is not None:
+            raise self._exception
+        if n == 0:
+            return memoryview(b'')
+        yield from self._wait_for_size(n, 'readexactly_view')
+        view = self._take_view(n)
+        self._maybe_resume_transport()
+        return view
+
+    @coroutine
+    def _wait_for_size(self, n, func_name):
         while len(self._buffer) < n:
             if self._eof:
                 incomplete = bytes(self._buffer)
                 self._buffer.clear()
                 raise IncompleteReadError(incomplete, n)
-            yield from self._wait_for_data('readexactly')
-        if len(self._buffer) == n:
-            data = bytes(self._buffer)
-            self._buffer.clear()
-        else:
-            data = bytes(self._buffer[:n])
-            del self._buffer[:n]
-        self._maybe_resume_transport()
-        return data
+            yield from self._wait_for_data(func_name)
     if compat.PY35:
 
         @coroutine
@@ -592,3 +705,25 @@ class StreamReader:
 
         def __aiter__(self):
             return self
+
+
+class _StreamChunks:
+    """Asynchronous iterator returned by StreamReader.iter_chunks()."""
+
+    def __init__(self, stream, chunk_size, lines):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._lines = lines
+
+    def __aiter__(self):
+        return self
+
+    @coroutine
+    def __anext__(self):
+        if self._lines:
+            data = yield from self._stream._read_lines(self._chunk_size)
+        else:
+            data = yield from self._stream.read(self._chunk_size)
+        if not data:
+            raise StopAsyncIteration
+        return data
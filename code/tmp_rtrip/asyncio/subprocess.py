@@ -1,4 +1,6 @@
-__all__ = ['create_subprocess_exec', 'create_subprocess_shell']
+__all__ = ['create_subprocess_exec', 'create_subprocess_shell',
+    'create_subprocess_pipeline']
+import os
 import subprocess
 from . import events
 from . import protocols
@@ -208,3 +210,58 @@ def create_subprocess_exec(program, *args, stdin=None, stdout=None, stderr=
     transport, protocol = yield from loop.subprocess_exec(protocol_factory,
         program, *args, stdin=stdin, stdout=stdout, stderr=stderr, **kwds)
     return Process(transport, protocol, loop)
+
+
+@coroutine
+def create_subprocess_pipeline(*cmds, stdin=None, stdout=None, stderr=None,
+    loop=None, limit=streams._DEFAULT_LIMIT, **kwds):
+    """Start a pipeline of programs and return their Process objects.
+
+    Each command is a sequence of a program and its arguments, as passed
+    to create_subprocess_exec().  The stdout of every process is connected
+    to the stdin of the next one by an OS pipe, so the data flowing
+    between them never passes through Python.  stdin applies to the first
+    process, stdout to the last one and stderr to all of them.  If a
+    process cannot be started, the ones already started are killed and
+    waited for.
+    """
+    if not cmds:
+        raise ValueError('at least one command is required')
+    if loop is None:
+        loop = events.get_event_loop()
+    procs = []
+    read_fd = None
+    try:
+        for i, cmd in enumerate(cmds):
+            proc_stdin = stdin if read_fd is None else read_fd
+            if i == len(cmds) - 1:
+                read_next = write_fd = None
+                proc_stdout = stdout
+            else:
+                read_next, write_fd = os.pipe()
+                proc_stdout = write_fd
+            try:
+                proc = yield from create_subprocess_exec(*cmd, stdin=
+                    proc_stdin, stdout=proc_stdout, stderr=stderr, loop=
+                    loop, limit=limit, **kwds)
+            finally:
+                if read_fd is not None:
+                    os.close(read_fd)
+                if write_fd is not None:
+                    os.close(write_fd)
+                read_fd = read_next
+            procs.append(proc)
+    except:
+        if read_fd is not None:
+            os.close(read_fd)
+        for proc in procs:
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+        for proc in procs:
+            yield from proc.wait()
+            proc._transport.close()
+        raise
+    return procs
@@ -1,7 +1,9 @@
 """Support for tasks, coroutines and the scheduler."""
 __all__ = ['Task', 'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
     'wait', 'wait_for', 'as_completed', 'sleep', 'async', 'gather',
-    'shield', 'ensure_future', 'run_coroutine_threadsafe']
+    'shield', 'ensure_future', 'run_coroutine_threadsafe', 'TaskGroup',
+    'map_unordered']
+import collections
 import concurrent.futures
 import functools
 import inspect
@@ -12,6 +14,7 @@ from . import compat
 from . import coroutines
 from . import events
 from . import futures
+from . import locks
 from .coroutines import coroutine
 
 
@@ -616,3 +619,217 @@ def run_coroutine_threadsafe(coro, loop):
             raise
     loop.call_soon_threadsafe(callback)
     return future
+
+
+class TaskGroup:
+    """A group of tasks with bounded concurrency that fail together.
+
+    At most limit tasks of the group run at the same time: spawn() waits
+    for one of them to finish before starting another.  If a task fails,
+    all other tasks of the group are cancelled and wait() raises the
+    exception of the first failed task.
+
+    Usage:
+
+        group = TaskGroup(limit=10)
+        for url in urls:
+            yield from group.spawn(fetch(url))
+        yield from group.wait()
+
+    or, with 'async with':
+
+        async with TaskGroup(limit=10) as group:
+            for url in urls:
+                await group.spawn(fetch(url))
+
+    Leaving the 'async with' block waits for all tasks; if the block
+    raises, the tasks are cancelled instead.
+    """
+
+    def __init__(self, limit=None, *, loop=None):
+        if limit is not None and limit < 1:
+            raise ValueError('limit must be None or >= 1')
+        if loop is None:
+            loop = events.get_event_loop()
+        self._loop = loop
+        self._limit = limit
+        if limit is None:
+            self._semaphore = None
+        else:
+            self._semaphore = locks.Semaphore(limit, loop=loop)
+        self._tasks = set()
+        self._exception = None
+        self._waiter = None
+
+    def __repr__(self):
+        info = ['tasks={}'.format(len(self._tasks))]
+        if self._limit is not None:
+            info.append('limit={}'.format(self._limit))
+        if self._exception is not None:
+            info.append('failed')
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(info))
+
+    def __len__(self):
+        """Return the number of tasks of the group that are not done."""
+        return len(self._tasks)
+
+    @coroutine
+    def spawn(self, coro_or_future):
+        """Run a coroutine or future as a task of the group.
+
+        Waits until fewer than limit tasks are running, then returns the
+        task.  Raises the exception of the failed task if the group has
+        already failed.
+        """
+        if self._semaphore is not None:
+            yield from self._semaphore.acquire()
+        if self._exception is not None:
+            if self._semaphore is not None:
+                self._semaphore.release()
+            if coroutines.iscoroutine(coro_or_future):
+                coro_or_future.close()
+            raise self._exception
+        task = ensure_future(coro_or_future, loop=self._loop)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task):
+        self._tasks.discard(task)
+        if self._semaphore is not None:
+            self._semaphore.release()
+        if not task.cancelled():
+            exc = task.exception()
+            if exc is not None and self._exception is None:
+                self._exception = exc
+                self.cancel()
+        if not self._tasks and self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+
+    def cancel(self):
+        """Cancel all tasks of the group that are not done."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    @coroutine
+    def _join(self):
+        while self._tasks:
+            self._waiter = self._loop.create_future()
+            try:
+                yield from self._waiter
+            except futures.CancelledError:
+                self.cancel()
+                raise
+            finally:
+                self._waiter = None
+
+    @coroutine
+    def wait(self):
+        """Wait until all tasks of the group are done.
+
+        Raises the exception of the first failed task, if any.  If the
+        waiting coroutine is cancelled, the tasks are cancelled too.
+        """
+        yield from self._join()
+        if self._exception is not None:
+            raise self._exception
+    if compat.PY35:
+
+        @coroutine
+        def __aenter__(self):
+            return self
+
+        @coroutine
+        def __aexit__(self, exc_type, exc, tb):
+            if exc_type is not None:
+                self.cancel()
+                yield from self._join()
+            else:
+                yield from self.wait()
+
+
+def map_unordered(func, iterable, *, limit, loop=None):
+    """Return an iterator whose values are coroutines.
+
+    Like as_completed(), but the awaitables are produced by calling
+    func on each item of iterable, and only limit of them are started
+    at a time.  A new one is started whenever a result is consumed, so
+    at most limit tasks are running or holding an unconsumed result,
+    and iterable may be lazy:
+
+        for f in map_unordered(fetch, urls, limit=100):
+            result = yield from f  # The 'yield from' may raise.
+            # Use result.
+
+    There is one coroutine per item.  Items taken from iterable while
+    limit tasks are already out wait until awaiting one of the
+    coroutines frees a slot, so the iterator may also be collected with
+    list() and passed to gather().  Tasks still running when the
+    iterator is closed before it is exhausted are cancelled, and no
+    more are started.
+    """
+    if limit < 1:
+        raise ValueError('limit must be >= 1')
+    loop = loop if loop is not None else events.get_event_loop()
+    from .queues import Queue
+    items = iter(iterable)
+    pending = collections.deque()
+    running = set()
+    done = Queue(loop=loop)
+    exhausted = False
+    taken = 0
+
+    def _on_completion(f):
+        running.discard(f)
+        done.put_nowait(f)
+
+    def _take():
+        nonlocal exhausted, taken
+        try:
+            item = next(items)
+        except StopIteration:
+            exhausted = True
+            raise
+        taken += 1
+        return item
+
+    def _fill():
+        while len(running) + done.qsize() < limit:
+            if pending:
+                item = pending.popleft()
+            elif exhausted:
+                return
+            else:
+                try:
+                    item = _take()
+                except StopIteration:
+                    return
+            task = ensure_future(func(item), loop=loop)
+            running.add(task)
+            task.add_done_callback(_on_completion)
+
+    @coroutine
+    def _wait_for_one():
+        f = yield from done.get()
+        _fill()
+        return f.result()
+    try:
+        yielded = 0
+        while True:
+            _fill()
+            if yielded == taken:
+                if exhausted:
+                    return
+                try:
+                    pending.append(_take())
+                except StopIteration:
+                    return
+            yielded += 1
+            yield _wait_for_one()
+    except BaseException:
+        exhausted = True
+        pending.clear()
+        for task in running:
+            task.cancel()
+        raise
@@ -32,15 +32,18 @@ Local worker thread:
   _CallItem and put in the "Call Q". New _CallItems are put in the "Call Q"
   until "Call Q" is full. NOTE: the size of the "Call Q" is kept small because
   calls placed in the "Call Q" can no longer be cancelled with Future.cancel().
+  With max_batch_size > 1, several _CallItems may be put in the "Call Q"
+  together as a list.
 - reads _ResultItems from "Result Q", updates the future stored in the
   "Work Items" dict and deletes the dict entry
 
 Process #1..n:
 - reads _CallItems from "Call Q", executes the calls, and puts the resulting
-  _ResultItems in "Result Q\"
+  _ResultItems in "Result Q\", as a list for a list of _CallItems
 """
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 import atexit
+import collections
 import os
 from concurrent.futures import _base
 import queue
@@ -52,6 +55,7 @@ import threading
 import weakref
 from functools import partial
 import itertools
+import time
 import traceback
 _threads_queues = weakref.WeakKeyDictionary()
 _shutdown = False
@@ -68,6 +72,8 @@ def _python_exit():
 
 
 EXTRA_QUEUED_CALLS = 1
+MAX_RESULTS_PER_WAKEUP = 64
+ADAPTIVE_CHUNK_TIME = 0.05
 
 
 class _RemoteTraceback(Exception):
@@ -144,6 +150,118 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk like _process_chunk and also returns the
+    number of seconds it took.
+
+    This function is run in a separate process.
+
+    """
+    start = time.monotonic()
+    results = [fn(*args) for args in chunk]
+    return results, time.monotonic() - start
+
+
+def _next_chunksize(chunksize, nitems, elapsed):
+    """ Returns the size of the next chunk given that the last chunk of
+    nitems took elapsed seconds to process.
+
+    Chunks are sized to take about ADAPTIVE_CHUNK_TIME seconds, but may
+    at most double or halve from one chunk to the next.
+
+    """
+    if elapsed <= 0:
+        ideal = 2 * chunksize
+    else:
+        ideal = int(ADAPTIVE_CHUNK_TIME * nitems / elapsed)
+    return max(1, chunksize // 2, min(ideal, 2 * chunksize))
+
+
+def _bounded_map(executor, fn, iterables, timeout, chunksize, buffersize):
+    """ Implements ProcessPoolExecutor.map() with at most buffersize
+    unfinished chunks, and at most twice that many unconsumed chunks.
+
+    Input is only consumed as results are, so iterables may be infinite.
+    If chunksize is None, chunk sizes follow _next_chunksize().  Once
+    the input is exhausted, chunks that have not started running while
+    workers are idle are withdrawn and split in two, so that the tail of
+    the work is spread over all workers.
+
+    """
+    if timeout is not None:
+        end_time = timeout + time.time()
+    adaptive = chunksize is None
+    size = 1 if adaptive else chunksize
+    it = zip(*iterables)
+    in_flight = collections.deque()
+    exhausted = False
+
+    def submit(chunk):
+        if adaptive:
+            future = executor.submit(_process_timed_chunk, fn, chunk)
+        else:
+            future = executor.submit(_process_chunk, fn, chunk)
+        return future, chunk
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) < 2 * buffersize:
+            if sum(not future.done() for future, chunk in in_flight
+                ) >= buffersize:
+                return
+            chunk = tuple(itertools.islice(it, size))
+            if chunk:
+                in_flight.append(submit(chunk))
+            else:
+                exhausted = True
+
+    def split_stragglers():
+        running = sum(future.running() for future, chunk in in_flight)
+        if running >= executor._max_workers:
+            return
+        for i in range(len(in_flight)):
+            future, chunk = in_flight.popleft()
+            if len(chunk) > 1 and future.cancel():
+                half = len(chunk) // 2
+                in_flight.append(submit(chunk[:half]))
+                in_flight.append(submit(chunk[half:]))
+            else:
+                in_flight.append((future, chunk))
+
+    def result_iterator():
+        nonlocal size
+        try:
+            while True:
+                fill()
+                if not in_flight:
+                    return
+                if exhausted:
+                    split_stragglers()
+                future, chunk = in_flight[0]
+                if not future.done():
+                    if timeout is None:
+                        remaining = None
+                    else:
+                        remaining = end_time - time.time()
+                    _base.wait([f for f, c in in_flight], remaining, _base.
+                        FIRST_COMPLETED)
+                    if not future.done():
+                        if timeout is not None and end_time <= time.time():
+                            raise _base.TimeoutError()
+                        continue
+                in_flight.popleft()
+                results = future.result()
+                if adaptive:
+                    results, elapsed = results
+                    size = _next_chunksize(size, len(chunk), elapsed)
+                yield from results
+        finally:
+            for future, chunk in in_flight:
+                future.cancel()
+    fill()
+    return result_iterator()
+
+
 def _process_worker(call_queue, result_queue):
     """Evaluates calls from call_queue and places the results in result_queue.
 
@@ -162,16 +280,25 @@ def _process_worker(call_queue, result_queue):
         if call_item is None:
             result_queue.put(os.getpid())
             return
-        try:
-            r = call_item.fn(*call_item.args, **call_item.kwargs)
-        except BaseException as e:
-            exc = _ExceptionWithTraceback(e, e.__traceback__)
-            result_queue.put(_ResultItem(call_item.work_id, exception=exc))
+        if isinstance(call_item, list):
+            result_queue.put([_call(item) for item in call_item])
         else:
-            result_queue.put(_ResultItem(call_item.work_id, result=r))
+            result_queue.put(_call(call_item))
+
+
+def _call(call_item):
+    """Evaluates a _CallItem and returns the corresponding _ResultItem."""
+    try:
+        r = call_item.fn(*call_item.args, **call_item.kwargs)
+    except BaseException as e:
+        exc = _ExceptionWithTraceback(e, e.__traceback__)
+        return _ResultItem(call_item.work_id, exception=exc)
+    else:
+        return _ResultItem(call_item.work_id, result=r)
 
 
-def _add_call_item_to_queue(pending_work_items, work_ids, call_queue):
+def _add_call_item_to_queue(pending_work_items, work_ids, call_queue,
+    max_batch_size=1, nworkers=1):
     """Fills call_queue with _WorkItems from pending_work_items.
 
     This function never blocks.
@@ -185,26 +312,39 @@ def _add_call_item_to_queue(pending_work_items, work_ids, call_queue):
             call_queue.
         call_queue: A multiprocessing.Queue that will be filled with _CallItems
             derived from _WorkItems.
+        max_batch_size: The maximum number of _CallItems put in call_queue
+            as a single list. Batches are only formed when there are more
+            waiting work ids than nworkers, so that every worker gets some
+            of the work.
+        nworkers: The number of worker processes.
     """
     while True:
         if call_queue.full():
             return
-        try:
-            work_id = work_ids.get(block=False)
-        except queue.Empty:
-            return
-        else:
+        batch_size = max(1, min(max_batch_size, work_ids.qsize() // nworkers))
+        batch = []
+        while len(batch) < batch_size:
+            try:
+                work_id = work_ids.get(block=False)
+            except queue.Empty:
+                break
             work_item = pending_work_items[work_id]
             if work_item.future.set_running_or_notify_cancel():
-                call_queue.put(_CallItem(work_id, work_item.fn, work_item.
-                    args, work_item.kwargs), block=True)
+                batch.append(_CallItem(work_id, work_item.fn, work_item.args,
+                    work_item.kwargs))
             else:
                 del pending_work_items[work_id]
-                continue
+        if not batch:
+            return
+        if len(batch) == 1:
+            call_queue.put(batch[0], block=True)
+        else:
+            call_queue.put(batch, block=True)
 
 
 def _queue_management_worker(executor_reference, processes,
-    pending_work_items, work_ids_queue, call_queue, result_queue):
+    pending_work_items, work_ids_queue, call_queue, result_queue,
+    max_batch_size=1):
     """Manages the communication between this process and the worker processes.
 
     This function is run in a local thread.
@@ -220,8 +360,11 @@ def _queue_management_worker(executor_reference, processes,
         work_ids_queue: A queue.Queue of work ids e.g. Queue([5, 6, ...]).
         call_queue: A multiprocessing.Queue that will be filled with _CallItems
             derived from _WorkItems for processing by the process workers.
-        result_queue: A multiprocessing.Queue of _ResultItems generated by the
-            process workers.
+        result_queue: A multiprocessing.Queue of _ResultItems, or lists of
+            _ResultItems for batches of calls, generated by the process
+            workers.
+        max_batch_size: The maximum number of calls sent to a worker in a
+            single message.
     """
     executor = None
 
@@ -237,12 +380,16 @@ def _queue_management_worker(executor_reference, processes,
             p.join()
     reader = result_queue._reader
     while True:
-        _add_call_item_to_queue(pending_work_items, work_ids_queue, call_queue)
+        _add_call_item_to_queue(pending_work_items, work_ids_queue,
+            call_queue, max_batch_size, len(processes))
         sentinels = [p.sentinel for p in processes.values()]
         assert sentinels
         ready = wait([reader] + sentinels)
         if reader in ready:
-            result_item = reader.recv()
+            result_items = [reader.recv()]
+            while len(result_items) < MAX_RESULTS_PER_WAKEUP and reader.poll(
+                ):
+                result_items.append(reader.recv())
         else:
             executor = executor_reference()
             if executor is not None:
@@ -259,21 +406,19 @@ def _queue_management_worker(executor_reference, processes,
                 p.terminate()
             shutdown_worker()
             return
-        if isinstance(result_item, int):
-            assert shutting_down()
-            p = processes.pop(result_item)
-            p.join()
-            if not processes:
-                shutdown_worker()
-                return
-        elif result_item is not None:
-            work_item = pending_work_items.pop(result_item.work_id, None)
-            if work_item is not None:
-                if result_item.exception:
-                    work_item.future.set_exception(result_item.exception)
-                else:
-                    work_item.future.set_result(result_item.result)
-                del work_item
+        for result_item in result_items:
+            if isinstance(result_item, int):
+                assert shutting_down()
+                p = processes.pop(result_item)
+                p.join()
+                if not processes:
+                    shutdown_worker()
+                    return
+            elif isinstance(result_item, list):
+                for item in result_item:
+                    _set_result(pending_work_items, item)
+            elif result_item is not None:
+                _set_result(pending_work_items, result_item)
         executor = executor_reference()
         if shutting_down():
             try:
@@ -285,6 +430,16 @@ def _queue_management_worker(executor_reference, processes,
         executor = None
 
 
+def _set_result(pending_work_items, result_item):
+    """Completes the future of the _WorkItem that result_item belongs to."""
+    work_item = pending_work_items.pop(result_item.work_id, None)
+    if work_item is not None:
+        if result_item.exception:
+            work_item.future.set_exception(result_item.exception)
+        else:
+            work_item.future.set_result(result_item.result)
+
+
 _system_limits_checked = False
 _system_limited = None
 
@@ -318,13 +473,19 @@ class BrokenProcessPool(RuntimeError):
 
 class ProcessPoolExecutor(_base.Executor):
 
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, max_batch_size=1):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of processes that can be used to
                 execute the given calls. If None or not given then as many
                 worker processes will be created as the machine has processors.
+            max_batch_size: The maximum number of calls sent to a worker
+                process, and of results sent back, in a single message.
+                Batching reduces the communication overhead of many small
+                calls, but calls in a batch can no longer be cancelled and
+                their results are only available once the whole batch has
+                been evaluated.
         """
         _check_system_limits()
         if max_workers is None:
@@ -333,6 +494,9 @@ class ProcessPoolExecutor(_base.Executor):
             if max_workers <= 0:
                 raise ValueError('max_workers must be greater than 0')
             self._max_workers = max_workers
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be greater than 0')
+        self._max_batch_size = max_batch_size
         self._call_queue = multiprocessing.Queue(self._max_workers +
             EXTRA_QUEUED_CALLS)
         self._call_queue._ignore_epipe = True
@@ -355,7 +519,8 @@ class ProcessPoolExecutor(_base.Executor):
             self._queue_management_thread = threading.Thread(target=
                 _queue_management_worker, args=(weakref.ref(self,
                 weakref_cb), self._processes, self._pending_work_items,
-                self._work_ids, self._call_queue, self._result_queue))
+                self._work_ids, self._call_queue, self._result_queue, self.
+                _max_batch_size))
             self._queue_management_thread.daemon = True
             self._queue_management_thread.start()
             _threads_queues[self._queue_management_thread] = self._result_queue
@@ -386,7 +551,8 @@ class ProcessPoolExecutor(_base.Executor):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None
+        ):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -397,6 +563,12 @@ class ProcessPoolExecutor(_base.Executor):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the chunk size is adapted to the observed duration
+                of the calls.
+            buffersize: The maximum number of chunks submitted to the
+                process pool but not yet consumed. If None and chunksize is
+                not None, all chunks are submitted at once; if None and
+                chunksize is None, twice the number of workers is used.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -407,8 +579,15 @@ class ProcessPoolExecutor(_base.Executor):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
-        if chunksize < 1:
+        if chunksize is not None and chunksize < 1:
             raise ValueError('chunksize must be >= 1.')
+        if buffersize is not None and buffersize < 1:
+            raise ValueError('buffersize must be >= 1.')
+        if chunksize is None or buffersize is not None:
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            return _bounded_map(self, fn, iterables, timeout, chunksize,
+                buffersize)
         results = super().map(partial(_process_chunk, fn), _get_chunks(*
             iterables, chunksize=chunksize), timeout=timeout)
         return itertools.chain.from_iterable(results)
@@ -2,8 +2,11 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 import atexit
 from concurrent.futures import _base
+import collections
+import itertools
 import queue
 import threading
+import time
 import weakref
 import os
 _threads_queues = weakref.WeakKeyDictionary()
@@ -21,6 +24,9 @@ def _python_exit():
 
 
 atexit.register(_python_exit)
+_ThreadPoolStats = collections.namedtuple('ThreadPoolStats', ['threads',
+    'active_workers', 'queue_depth', 'completed_tasks', 'total_wait_time',
+    'max_wait_time'])
 
 
 class _WorkItem(object):
@@ -30,6 +36,7 @@ class _WorkItem(object):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.submit_time = time.monotonic()
 
     def run(self):
         if not self.future.set_running_or_notify_cancel():
@@ -42,13 +49,63 @@ class _WorkItem(object):
             self.future.set_result(result)
 
 
-def _worker(executor_reference, work_queue):
+class _PriorityWorkItem(_WorkItem):
+
+    def __init__(self, future, fn, args, kwargs, priority, deadline):
+        super().__init__(future, fn, args, kwargs)
+        self.priority = priority
+        self.deadline = deadline
+
+    def run(self):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.future.cancel()
+        super().run()
+
+
+class _PriorityWorkQueue(queue.PriorityQueue):
+    """A queue of _PriorityWorkItems which returns the item with the lowest
+    priority value first, and items of equal priority in FIFO order.
+
+    None, which wakes up the workers, is returned after all work items.
+    """
+
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self._counter = itertools.count()
+
+    def _put(self, item):
+        if item is None:
+            priority = float('inf')
+        else:
+            priority = item.priority
+        super()._put((priority, next(self._counter), item))
+
+    def _get(self):
+        return super()._get()[-1]
+
+
+def _worker(executor_reference, work_queue, idle_timeout=None):
     try:
         while True:
-            work_item = work_queue.get(block=True)
+            try:
+                work_item = work_queue.get(block=True, timeout=idle_timeout)
+            except queue.Empty:
+                executor = executor_reference()
+                if executor is None or executor._retire_idle_worker():
+                    return
+                del executor
+                continue
             if work_item is not None:
+                executor = executor_reference()
+                if executor is not None:
+                    executor._task_started(work_item)
+                del executor
                 work_item.run()
                 del work_item
+                executor = executor_reference()
+                if executor is not None:
+                    executor._task_done()
+                del executor
                 continue
             executor = executor_reference()
             if _shutdown or executor is None or executor._shutdown:
@@ -61,24 +118,38 @@ def _worker(executor_reference, work_queue):
 
 class ThreadPoolExecutor(_base.Executor):
 
-    def __init__(self, max_workers=None, thread_name_prefix=''):
+    def __init__(self, max_workers=None, thread_name_prefix='',
+        idle_timeout=None):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of threads that can be used to
                 execute the given calls.
             thread_name_prefix: An optional name prefix to give our threads.
+            idle_timeout: The number of seconds after which a thread that
+                has been waiting for work exits. If None, threads only exit
+                at shutdown.
         """
         if max_workers is None:
             max_workers = (os.cpu_count() or 1) * 5
         if max_workers <= 0:
             raise ValueError('max_workers must be greater than 0')
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError('idle_timeout must be greater than 0')
         self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
         self._work_queue = queue.Queue()
+        self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
+        self._thread_counter = itertools.count()
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
         self._thread_name_prefix = thread_name_prefix
+        self._stats_lock = threading.Lock()
+        self._active_workers = 0
+        self._completed_tasks = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
 
     def submit(self, fn, *args, **kwargs):
         with self._shutdown_lock:
@@ -93,25 +164,108 @@ class ThreadPoolExecutor(_base.Executor):
     submit.__doc__ = _base.Executor.submit.__doc__
 
     def _adjust_thread_count(self):
+        if self._idle_semaphore.acquire(False):
+            return
 
         def weakref_cb(_, q=self._work_queue):
             q.put(None)
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
-            thread_name = '%s_%d' % (self._thread_name_prefix or self,
-                num_threads)
+            thread_name = '%s_%d' % (self._thread_name_prefix or self, next
+                (self._thread_counter))
             t = threading.Thread(name=thread_name, target=_worker, args=(
-                weakref.ref(self, weakref_cb), self._work_queue))
+                weakref.ref(self, weakref_cb), self._work_queue, self.
+                _idle_timeout))
             t.daemon = True
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    def _task_started(self, work_item):
+        wait_time = time.monotonic() - work_item.submit_time
+        with self._stats_lock:
+            self._active_workers += 1
+            self._total_wait_time += wait_time
+            if wait_time > self._max_wait_time:
+                self._max_wait_time = wait_time
+
+    def _task_done(self):
+        with self._stats_lock:
+            self._active_workers -= 1
+            self._completed_tasks += 1
+        self._idle_semaphore.release()
+
+    def _retire_idle_worker(self):
+        """Called by a worker which has not received work for idle_timeout
+        seconds; returns True if the worker should exit."""
+        with self._shutdown_lock:
+            if not self._work_queue.empty():
+                return False
+            if not self._idle_semaphore.acquire(False):
+                return False
+            self._threads.discard(threading.current_thread())
+        return True
+
+    def stats(self):
+        """Returns a snapshot of the executor's activity.
+
+        The result is a named tuple of the number of threads, the number of
+        threads running a call, the number of calls waiting for a thread,
+        the number of completed calls, and the total and maximum number of
+        seconds calls waited for a thread before they started.
+        """
+        with self._stats_lock:
+            return _ThreadPoolStats(len(self._threads), self._active_workers,
+                self._work_queue.qsize(), self._completed_tasks, self.
+                _total_wait_time, self._max_wait_time)
+
     def shutdown(self, wait=True):
         with self._shutdown_lock:
             self._shutdown = True
             self._work_queue.put(None)
+            threads = list(self._threads)
         if wait:
-            for t in self._threads:
+            for t in threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+class PriorityThreadPoolExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor which runs calls in order of priority.
+
+    Calls submitted with submit() or map() have priority 0.  Calls with a
+    deadline that has passed by the time a thread picks them up are not
+    run and their futures are cancelled.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+        idle_timeout=None):
+        super().__init__(max_workers, thread_name_prefix, idle_timeout)
+        self._work_queue = _PriorityWorkQueue()
+
+    def submit(self, fn, *args, **kwargs):
+        return self.submit_with_priority(0, None, fn, *args, **kwargs)
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def submit_with_priority(self, priority, deadline, fn, *args, **kwargs):
+        """Submits a callable to be executed with the given arguments.
+
+        Args:
+            priority: Calls with lower values are started first; calls with
+                equal values are started in the order they were submitted.
+            deadline: None, or the time.monotonic() value after which the
+                call should no longer be started. If it is reached before a
+                thread picks up the call, the returned Future is cancelled.
+
+        Returns:
+            A Future representing the given call.
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown'
+                    )
+            f = _base.Future()
+            w = _PriorityWorkItem(f, fn, args, kwargs, priority, deadline)
+            self._work_queue.put(w)
+            self._adjust_thread_count()
+            return f
@@ -160,6 +160,14 @@ def parse_headers(fp, _class=HTTPMessage):
 
 
 class HTTPResponse(io.BufferedIOBase):
+    """Response to a request sent with HTTPConnection.
+
+    If release_conn is set to a callable, it is called once when the
+    response is closed, with True if the body was read completely and
+    the server did not ask for the connection to be closed, meaning that
+    the connection can be used for another request.
+    """
+    release_conn = None
 
     def __init__(self, sock, debuglevel=0, method=None, url=None):
         self.fp = sock.makefile('rb')
@@ -276,6 +284,10 @@ class HTTPResponse(io.BufferedIOBase):
         fp = self.fp
         self.fp = None
         fp.close()
+        release_conn = self.release_conn
+        if release_conn is not None:
+            self.release_conn = None
+            release_conn(self.will_close is False and self.length == 0)
 
     def close(self):
         try:
@@ -345,6 +357,25 @@ class HTTPResponse(io.BufferedIOBase):
                 self._close_conn()
         return n
 
+    def iter_chunks(self, chunk_size=65536, buffer=None):
+        """Iterate over the rest of the body as memoryviews.
+
+        Every view is a window onto one buffer which is refilled with up
+        to chunk_size bytes on each step, so a view is only valid until
+        the next one is requested and must be consumed (or copied) before
+        that.  A writable buffer may be passed to be filled instead of
+        allocating one, in which case chunk_size is ignored.  Works for
+        both fixed-length and chunked bodies.
+        """
+        if buffer is None:
+            buffer = bytearray(chunk_size)
+        view = memoryview(buffer).cast('B')
+        while True:
+            n = self.readinto(view)
+            if not n:
+                break
+            yield view[:n]
+
     def _read_next_chunk_size(self):
         line = self.fp.readline(_MAXLINE + 1)
         if len(line) > _MAXLINE:
@@ -379,6 +410,7 @@ class HTTPResponse(io.BufferedIOBase):
                 raise IncompleteRead(b'')
             if chunk_left == 0:
                 self._read_and_discard_trailer()
+                self.length = 0
                 self._close_conn()
                 chunk_left = None
             self.chunk_left = chunk_left
@@ -387,16 +419,18 @@ class HTTPResponse(io.BufferedIOBase):
     def _readall_chunked(self):
         assert self.chunked != _UNKNOWN
         value = []
+        complete = 0
         try:
             while True:
                 chunk_left = self._get_chunk_left()
                 if chunk_left is None:
                     break
-                value.append(self._safe_read(chunk_left))
+                self._safe_read_pieces(chunk_left, value)
+                complete = len(value)
                 self.chunk_left = 0
             return b''.join(value)
         except IncompleteRead:
-            raise IncompleteRead(b''.join(value))
+            raise IncompleteRead(b''.join(value[:complete]))
 
     def _readinto_chunked(self, b):
         assert self.chunked != _UNKNOWN
@@ -432,15 +466,27 @@ class HTTPResponse(io.BufferedIOBase):
         This function should be used when <amt> bytes "should" be present for
         reading. If the bytes are truly not available (due to EOF), then the
         IncompleteRead exception can be used to detect the problem.
+
+        The body is read in pieces of at most MAXAMOUNT bytes, so memory is
+        only allocated as data actually arrives and a bogus Content-Length
+        cannot force one huge allocation.
         """
         s = []
+        self._safe_read_pieces(amt, s)
+        return b''.join(s)
+
+    def _safe_read_pieces(self, amt, pieces):
+        """Append the next amt bytes to the list pieces, in pieces of at
+        most MAXAMOUNT bytes, raising IncompleteRead at EOF like
+        _safe_read().  Callers join the list once, so a body made of many
+        pieces is copied a single time."""
+        start = len(pieces)
         while amt > 0:
             chunk = self.fp.read(min(amt, MAXAMOUNT))
             if not chunk:
-                raise IncompleteRead(b''.join(s), amt)
-            s.append(chunk)
+                raise IncompleteRead(b''.join(pieces[start:]), amt)
+            pieces.append(chunk)
             amt -= len(chunk)
-        return b''.join(s)
 
     def _safe_readinto(self, b):
         """Same as _safe_read, but for reading into a buffer."""
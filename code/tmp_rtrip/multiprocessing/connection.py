@@ -1,4 +1,5 @@
 __all__ = ['Client', 'Listener', 'Pipe', 'wait']
+import collections
 import io
 import os
 import sys
@@ -19,7 +20,10 @@ except ImportError:
     if sys.platform == 'win32':
         raise
     _winapi = None
+ConnectionStats = collections.namedtuple('ConnectionStats', ['bytes_sent',
+    'bytes_received', 'messages_sent', 'messages_received'])
 BUFSIZE = 8192
+_RECV_BUFFER_MAX = 1048576
 CONNECTION_TIMEOUT = 20.0
 _mmap_counter = itertools.count()
 default_family = 'AF_INET'
@@ -95,6 +99,10 @@ class _ConnectionBase:
         self._handle = handle
         self._readable = readable
         self._writable = writable
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._messages_sent = 0
+        self._messages_received = 0
 
     def __del__(self):
         if self._handle is not None:
@@ -147,6 +155,31 @@ class _ConnectionBase:
             finally:
                 self._handle = None
 
+    def stats(self):
+        """Return a ConnectionStats tuple of the traffic seen so far.
+
+        Bytes count message payloads, not the length headers; messages
+        count the objects or byte strings passed to the send and recv
+        methods, so a send_many() of ten objects counts as ten.
+        """
+        return ConnectionStats(self._bytes_sent, self._bytes_received,
+            self._messages_sent, self._messages_received)
+
+    def _send_message(self, buf, count=1):
+        self._send_bytes(buf)
+        self._bytes_sent += len(buf)
+        self._messages_sent += count
+
+    def _recv_message(self, maxsize=None, count=1):
+        buf = self._recv_bytes(maxsize)
+        if buf is not None:
+            self._bytes_received += buf.tell()
+            self._messages_received += count
+        return buf
+
+    def _recv_view(self, count=1):
+        return self._recv_message(count=count).getbuffer()
+
     def send_bytes(self, buf, offset=0, size=None):
         """Send the bytes data from a bytes-like object"""
         self._check_closed()
@@ -165,13 +198,42 @@ class _ConnectionBase:
             raise ValueError('size is negative')
         elif offset + size > n:
             raise ValueError('buffer length < offset + size')
-        self._send_bytes(m[offset:offset + size])
+        self._send_message(m[offset:offset + size])
 
     def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        self._send_message(_ForkingPickler.dumps(obj))
+
+    def send_many(self, objs):
+        """Send an iterable of (picklable) objects as a single message.
+
+        The pickles are framed behind a table of their lengths and
+        written together, so a batch costs one round of system calls
+        instead of one per object.  The peer must call recv_many()."""
+        self._check_closed()
+        self._check_writable()
+        dumps = [_ForkingPickler.dumps(obj) for obj in objs]
+        n = len(dumps)
+        header = struct.pack('!%di' % (n + 1), n, *map(len, dumps))
+        self._send_message(b''.join([header] + dumps), n)
+
+    def send_oob(self, obj):
+        """Send a (picklable) object, writing its large bytes, bytearray
+        and memoryview buffers directly from memory instead of copying
+        them into the pickle.  The peer must call recv_oob().
+
+        The pickle and each buffer are written as separate messages, so
+        threads or processes sharing this end of the connection must
+        serialize their calls with a common lock, the way
+        multiprocessing.Queue guards its pipe with a write lock."""
+        self._check_closed()
+        self._check_writable()
+        data, buffers = _ForkingPickler.dumps_oob(obj)
+        self._send_message(struct.pack('!i', len(buffers)) + data)
+        for buf in buffers:
+            self._send_message(buf, 0)
 
     def recv_bytes(self, maxlength=None):
         """
@@ -181,7 +243,7 @@ class _ConnectionBase:
         self._check_readable()
         if maxlength is not None and maxlength < 0:
             raise ValueError('negative maxlength')
-        buf = self._recv_bytes(maxlength)
+        buf = self._recv_message(maxlength)
         if buf is None:
             self._bad_message_length()
         return buf.getvalue()
@@ -200,7 +262,7 @@ class _ConnectionBase:
                 raise ValueError('negative offset')
             elif offset > bytesize:
                 raise ValueError('offset too large')
-            result = self._recv_bytes()
+            result = self._recv_message()
             size = result.tell()
             if bytesize < offset + size:
                 raise BufferTooShort(result.getvalue())
@@ -212,8 +274,34 @@ class _ConnectionBase:
         """Receive a (picklable) object"""
         self._check_closed()
         self._check_readable()
-        buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        return _ForkingPickler.loads(self._recv_view())
+
+    def recv_many(self):
+        """Receive a list of objects sent with send_many()"""
+        self._check_closed()
+        self._check_readable()
+        view = self._recv_view(0)
+        n, = struct.unpack_from('!i', view)
+        lengths = struct.unpack_from('!%di' % n, view, 4)
+        pos = 4 * (n + 1)
+        objs = []
+        for length in lengths:
+            objs.append(_ForkingPickler.loads(view[pos:pos + length]))
+            pos += length
+        self._messages_received += n
+        return objs
+
+    def recv_oob(self):
+        """Receive an object sent with send_oob()
+
+        Readers sharing this end of the connection must hold a common
+        lock around the call, see send_oob()."""
+        self._check_closed()
+        self._check_readable()
+        buf = self._recv_message().getbuffer()
+        n, = struct.unpack('!i', buf[:4])
+        buffers = [self._recv_message(count=0).getvalue() for i in range(n)]
+        return _ForkingPickler.loads_oob(buf[4:], buffers)
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -317,6 +405,7 @@ class Connection(_ConnectionBase):
     Connection class based on an arbitrary file descriptor (Unix only), or
     a socket handle (Windows).
     """
+    _recv_buffer = bytearray()
     if _winapi:
 
         def _close(self, _close=_multiprocessing.closesocket):
@@ -330,6 +419,27 @@ class Connection(_ConnectionBase):
         _write = os.write
         _read = os.read
 
+        def _recv_view(self, count=1, readv=os.readv):
+            size, = struct.unpack('!i', self._recv(4).getvalue())
+            buf = self._recv_buffer
+            if len(buf) < size:
+                buf = bytearray(size)
+                if size <= _RECV_BUFFER_MAX:
+                    self._recv_buffer = buf
+            view = memoryview(buf)[:size]
+            handle = self._handle
+            pos = 0
+            while pos < size:
+                n = readv(handle, [view[pos:]])
+                if n == 0:
+                    if pos == 0:
+                        raise EOFError
+                    raise OSError('got end of file during message')
+                pos += n
+            self._bytes_received += size
+            self._messages_received += count
+            return view
+
     def _send(self, buf, write=_write):
         remaining = len(buf)
         while True:
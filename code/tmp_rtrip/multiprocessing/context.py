@@ -174,6 +174,13 @@ class BaseContext(object):
         from .forkserver import set_forkserver_preload
         set_forkserver_preload(module_names)
 
+    def set_forkserver_initializers(self, initializers):
+        """Set list of functions to call once in the forkserver process.
+        Processes forked from it inherit whatever state they build.
+        """
+        from .forkserver import set_forkserver_initializers
+        set_forkserver_initializers(initializers)
+
     def get_context(self, method=None):
         if method is None:
             return self
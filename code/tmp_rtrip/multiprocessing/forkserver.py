@@ -13,7 +13,7 @@ from . import semaphore_tracker
 from . import spawn
 from . import util
 __all__ = ['ensure_running', 'get_inherited_fds', 'connect_to_new_process',
-    'set_forkserver_preload']
+    'set_forkserver_preload', 'set_forkserver_initializers']
 MAXFDS_TO_SEND = 256
 UNSIGNED_STRUCT = struct.Struct('Q')
 
@@ -26,6 +26,7 @@ class ForkServer(object):
         self._inherited_fds = None
         self._lock = threading.Lock()
         self._preload_modules = ['__main__']
+        self._initializers = []
 
     def set_forkserver_preload(self, modules_names):
         """Set list of module names to try to load in forkserver process."""
@@ -33,6 +34,30 @@ class ForkServer(object):
             raise TypeError('module_names must be a list of strings')
         self._preload_modules = modules_names
 
+    def set_forkserver_initializers(self, initializers):
+        """Set list of functions to call once in the forkserver process.
+
+        Each function is called without arguments after the preload modules
+        have been imported, so it can build expensive state (tables, models,
+        caches) in module globals.  Every process started by the forkserver,
+        including pool workers replaced because of maxtasksperchild, is
+        forked from it and inherits that state copy-on-write instead of
+        rebuilding it.  The functions are looked up by module and qualified
+        name, so they must be defined at the top level of an importable
+        module or of the main script.  This only has an effect if called
+        before the forkserver is started.
+        """
+        names = []
+        for func in initializers:
+            modname = getattr(func, '__module__', None)
+            qualname = getattr(func, '__qualname__', None)
+            if not callable(func) or modname is None or qualname is None:
+                raise TypeError('initializers must be a list of functions')
+            if '<' in qualname:
+                raise ValueError('%r cannot be looked up by name' % func)
+            names.append((modname, qualname))
+        self._initializers = names
+
     def get_inherited_fds(self):
         """Return list of fds inherited from parent process.
 
@@ -83,13 +108,20 @@ class ForkServer(object):
                 return
             cmd = ('from multiprocessing.forkserver import main; ' +
                 'main(%d, %d, %r, **%r)')
-            if self._preload_modules:
+            if self._preload_modules or self._initializers:
                 desired_keys = {'main_path', 'sys_path'}
                 data = spawn.get_preparation_data('ignore')
+                main_path = data.get('init_main_from_path')
                 data = dict((x, y) for x, y in data.items() if x in
                     desired_keys)
             else:
+                main_path = None
                 data = {}
+            if self._initializers:
+                data['initializers'] = self._initializers
+                if '__main__' in dict(self._initializers
+                    ) and main_path is not None:
+                    data['main_path'] = main_path
             with socket.socket(socket.AF_UNIX) as listener:
                 address = connection.arbitrary_address('AF_UNIX')
                 listener.bind(address)
@@ -113,10 +145,12 @@ class ForkServer(object):
                 self._forkserver_alive_fd = alive_w
 
 
-def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
+def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
+    initializers=()):
     """Run forkserver."""
-    if preload:
-        if '__main__' in preload and main_path is not None:
+    if preload or initializers:
+        if ('__main__' in preload or '__main__' in dict(initializers)
+            ) and main_path is not None:
             process.current_process()._inheriting = True
             try:
                 spawn.import_main_path(main_path)
@@ -127,6 +161,11 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
                 __import__(modname)
             except ImportError:
                 pass
+    for modname, qualname in initializers:
+        try:
+            _call_initializer(modname, qualname)
+        except Exception:
+            sys.excepthook(*sys.exc_info())
     util._close_stdin()
     handlers = {signal.SIGCHLD: signal.SIG_IGN, signal.SIGINT: signal.SIG_DFL}
     old_handlers = {sig: signal.signal(sig, val) for sig, val in handlers.
@@ -161,6 +200,17 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
                     raise
 
 
+def _call_initializer(modname, qualname):
+    if modname == '__main__':
+        obj = sys.modules['__main__']
+    else:
+        __import__(modname)
+        obj = sys.modules[modname]
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    obj()
+
+
 def _serve_one(s, listener, alive_r, handlers):
     listener.close()
     os.close(alive_r)
@@ -205,3 +255,4 @@ ensure_running = _forkserver.ensure_running
 get_inherited_fds = _forkserver.get_inherited_fds
 connect_to_new_process = _forkserver.connect_to_new_process
 set_forkserver_preload = _forkserver.set_forkserver_preload
+set_forkserver_initializers = _forkserver.set_forkserver_initializers
@@ -1,9 +1,10 @@
-__all__ = ['BaseManager', 'SyncManager', 'BaseProxy', 'Token']
+__all__ = ['BaseManager', 'SyncManager', 'BaseProxy', 'Token', 'ProxyBatch']
 import sys
 import threading
 import array
 import queue
 from time import time as _time
+from time import monotonic as _monotonic
 from traceback import format_exc
 from . import connection
 from .context import reduction, get_spawning_popen
@@ -189,54 +190,17 @@ class Server(object):
             current_thread().name)
         recv = conn.recv
         send = conn.send
-        id_to_obj = self.id_to_obj
         while not self.stop_event.is_set():
             try:
-                methodname = obj = None
                 request = recv()
-                ident, methodname, args, kwds = request
-                try:
-                    obj, exposed, gettypeid = id_to_obj[ident]
-                except KeyError as ke:
-                    try:
-                        obj, exposed, gettypeid = self.id_to_local_proxy_obj[
-                            ident]
-                    except KeyError as second_ke:
-                        raise ke
-                if methodname not in exposed:
-                    raise AttributeError(
-                        'method %r of %r object is not in exposed=%r' % (
-                        methodname, type(obj), exposed))
-                function = getattr(obj, methodname)
-                try:
-                    res = function(*args, **kwds)
-                except Exception as e:
-                    msg = '#ERROR', e
-                else:
-                    typeid = gettypeid and gettypeid.get(methodname, None)
-                    if typeid:
-                        rident, rexposed = self.create(conn, typeid, res)
-                        token = Token(typeid, self.address, rident)
-                        msg = '#PROXY', (rexposed, token)
-                    else:
-                        msg = '#RETURN', res
-            except AttributeError:
-                if methodname is None:
-                    msg = '#TRACEBACK', format_exc()
-                else:
-                    try:
-                        fallback_func = self.fallback_mapping[methodname]
-                        result = fallback_func(self, conn, ident, obj, *
-                            args, **kwds)
-                        msg = '#RETURN', result
-                    except Exception:
-                        msg = '#TRACEBACK', format_exc()
             except EOFError:
                 util.debug('got EOF -- exiting thread serving %r',
                     threading.current_thread().name)
                 sys.exit(0)
             except Exception:
                 msg = '#TRACEBACK', format_exc()
+            else:
+                msg = self.call_method(conn, request)
             try:
                 try:
                     send(msg)
@@ -250,6 +214,58 @@ class Server(object):
                 conn.close()
                 sys.exit(1)
 
+    def call_method(self, conn, request):
+        """
+        Carry out one request from a proxy and return the reply message
+
+        A '#BATCH' request carries a list of requests in its args; they
+        are carried out in order and their replies returned together.
+        """
+        methodname = obj = None
+        try:
+            ident, methodname, args, kwds = request
+            if methodname == '#BATCH':
+                return '#BATCH', [self.call_method(conn, r) for r in args]
+            try:
+                obj, exposed, gettypeid = self.id_to_obj[ident]
+            except KeyError as ke:
+                try:
+                    obj, exposed, gettypeid = self.id_to_local_proxy_obj[ident
+                        ]
+                except KeyError as second_ke:
+                    raise ke
+            if methodname not in exposed:
+                raise AttributeError(
+                    'method %r of %r object is not in exposed=%r' % (
+                    methodname, type(obj), exposed))
+            function = getattr(obj, methodname)
+            try:
+                res = function(*args, **kwds)
+            except Exception as e:
+                msg = '#ERROR', e
+            else:
+                typeid = gettypeid and gettypeid.get(methodname, None)
+                if typeid:
+                    rident, rexposed = self.create(conn, typeid, res)
+                    token = Token(typeid, self.address, rident)
+                    msg = '#PROXY', (rexposed, token)
+                else:
+                    msg = '#RETURN', res
+        except AttributeError:
+            if methodname is None:
+                msg = '#TRACEBACK', format_exc()
+            else:
+                try:
+                    fallback_func = self.fallback_mapping[methodname]
+                    result = fallback_func(self, conn, ident, obj, *args,
+                        **kwds)
+                    msg = '#RETURN', result
+                except Exception:
+                    msg = '#TRACEBACK', format_exc()
+        except Exception:
+            msg = '#TRACEBACK', format_exc()
+        return msg
+
     def fallback_getvalue(self, conn, ident, obj):
         return obj
 
@@ -579,6 +595,9 @@ class BaseProxy(object):
     """
     _address_to_local = {}
     _mutex = util.ForkAwareThreadLock()
+    _cache = None
+    _cache_methods = frozenset()
+    _cache_max_age = None
 
     def __init__(self, token, serializer, manager=None, authkey=None,
         exposed=None, incref=True, manager_owned=False):
@@ -614,10 +633,7 @@ class BaseProxy(object):
         dispatch(conn, None, 'accept_connection', (name,))
         self._tls.connection = conn
 
-    def _callmethod(self, methodname, args=(), kwds={}):
-        """
-        Try to call a method of the referrent and return a copy of the result
-        """
+    def _request(self, request):
         try:
             conn = self._tls.connection
         except AttributeError:
@@ -625,8 +641,51 @@ class BaseProxy(object):
                 current_thread().name)
             self._connect()
             conn = self._tls.connection
-        conn.send((self._id, methodname, args, kwds))
-        kind, result = conn.recv()
+        conn.send(request)
+        return conn.recv()
+
+    def _callmethod(self, methodname, args=(), kwds={}):
+        """
+        Try to call a method of the referrent and return a copy of the result
+        """
+        if self._cache is not None:
+            return self._callcached(methodname, args, kwds)
+        kind, result = self._request((self._id, methodname, args, kwds))
+        return self._convert_reply(kind, result)
+
+    def _callcached(self, methodname, args, kwds):
+        cache = self._cache
+        if methodname not in self._cache_methods:
+            cache.clear()
+            key = None
+        else:
+            key = methodname, args, tuple(sorted(kwds.items()))
+            try:
+                stamp, result = cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None
+            else:
+                max_age = self._cache_max_age
+                if max_age is None or _monotonic() - stamp < max_age:
+                    return result
+        kind, result = self._request((self._id, methodname, args, kwds))
+        if key is not None and kind == '#RETURN':
+            cache[key] = _monotonic(), result
+        return self._convert_reply(kind, result)
+
+    def _callbatch(self, calls):
+        """
+        Send a list of (id, methodname, args, kwds) calls to the manager in
+        one message and return the list of (kind, result) replies
+        """
+        kind, result = self._request((None, '#BATCH', calls, {}))
+        if kind == '#BATCH':
+            return result
+        raise convert_to_error(kind, result)
+
+    def _convert_reply(self, kind, result):
         if kind == '#RETURN':
             return result
         elif kind == '#PROXY':
@@ -646,6 +705,34 @@ class BaseProxy(object):
         """
         return self._callmethod('#GETVALUE')
 
+    def _enable_cache(self, methods=None, max_age=None):
+        """
+        Keep the results of the read-only `methods` in a local cache
+
+        `methods` defaults to the `_cacheable_` methods of the proxy type.
+        A cached result is reused for identical arguments until another
+        method is called through this proxy, `_invalidate_cache()` is
+        called, or it is older than `max_age` seconds.  Changes made
+        through other proxies are not seen until then, so this is only
+        suitable for objects which are rarely modified.  Cached results
+        are shared between calls and must not be mutated.
+        """
+        if methods is None:
+            methods = getattr(self, '_cacheable_', ())
+        self._cache_methods = frozenset(methods)
+        self._cache_max_age = max_age
+        self._cache = {}
+
+    def _disable_cache(self):
+        self._cache = None
+
+    def _invalidate_cache(self):
+        """
+        Discard all results cached by `_enable_cache()`
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
     def _incref(self):
         if self._owned_by_manager:
             util.debug('owned_by_manager skipped INCREF of %r', self._token.id)
@@ -679,6 +766,7 @@ class BaseProxy(object):
 
     def _after_fork(self):
         self._manager = None
+        self._invalidate_cache()
         try:
             self._incref()
         except Exception as e:
@@ -713,6 +801,71 @@ class BaseProxy(object):
             return repr(self)[:-1] + "; '__str__()' failed>"
 
 
+class ProxyBatch(object):
+    """
+    Collects method calls on proxies and sends them to the manager at once
+
+    Calls queued with `call()` are carried out in order by the manager
+    when `flush()` is called or the with block ends, costing a single
+    round trip.  All the proxies must belong to the same manager.
+    """
+
+    def __init__(self):
+        self._calls = []
+        self.results = None
+
+    def __len__(self):
+        return len(self._calls)
+
+    def call(self, proxy, methodname, *args, **kwds):
+        """
+        Queue `proxy.methodname(*args, **kwds)` and return its position
+        """
+        calls = self._calls
+        if calls and calls[0][0]._token.address != proxy._token.address:
+            raise ValueError('proxies in a batch must share a manager')
+        calls.append((proxy, methodname, args, kwds))
+        return len(calls) - 1
+
+    def flush(self):
+        """
+        Send the queued calls and return the list of their results
+
+        Every call is carried out even if an earlier one fails; the first
+        failure is then raised, and `results` holds the outcome of every
+        call with the exception in place of each failed one.
+        """
+        calls, self._calls = self._calls, []
+        results = self.results = []
+        if not calls:
+            return results
+        replies = calls[0][0]._callbatch([(proxy._id, methodname, args,
+            kwds) for proxy, methodname, args, kwds in calls])
+        error = None
+        for (proxy, methodname, args, kwds), (kind, result) in zip(calls,
+            replies):
+            if methodname not in proxy._cache_methods:
+                proxy._invalidate_cache()
+            try:
+                results.append(proxy._convert_reply(kind, result))
+            except Exception as e:
+                results.append(e)
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._calls = []
+
+
 def RebuildProxy(func, token, serializer, kwds):
     """
     Function used for unpickling proxy objects.
@@ -941,6 +1094,7 @@ class NamespaceProxy(BaseProxy):
 
 class ValueProxy(BaseProxy):
     _exposed_ = 'get', 'set'
+    _cacheable_ = 'get',
 
     def get(self):
         return self._callmethod('get')
@@ -957,6 +1111,8 @@ BaseListProxy = MakeProxyType('BaseListProxy', ('__add__', '__contains__',
 
 
 class ListProxy(BaseListProxy):
+    _cacheable_ = ('__contains__', '__getitem__', '__len__', 'count',
+        'index')
 
     def __iadd__(self, value):
         self._callmethod('extend', (value,))
@@ -971,6 +1127,8 @@ DictProxy = MakeProxyType('DictProxy', ('__contains__', '__delitem__',
     '__getitem__', '__len__', '__setitem__', 'clear', 'copy', 'get',
     'has_key', 'items', 'keys', 'pop', 'popitem', 'setdefault', 'update',
     'values'))
+DictProxy._cacheable_ = ('__contains__', '__getitem__', '__len__', 'copy',
+    'get', 'items', 'keys', 'values')
 ArrayProxy = MakeProxyType('ArrayProxy', ('__len__', '__getitem__',
     '__setitem__'))
 BasePoolProxy = MakeProxyType('PoolProxy', ('apply', 'apply_async', 'close',
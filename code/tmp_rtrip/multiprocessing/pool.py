@@ -109,6 +109,14 @@ def _helper_reraises_exception(ex):
     raise ex
 
 
+def _flatten_chunks(result):
+    try:
+        for chunk in result:
+            yield from chunk
+    finally:
+        result.close()
+
+
 class Pool(object):
     """
     Class which supports an async version of applying functions to arguments.
@@ -239,43 +247,58 @@ class Pool(object):
         except Exception as e:
             yield result_job, i + 1, _helper_reraises_exception, (e,), {}
 
-    def imap(self, func, iterable, chunksize=1):
+    def _start_imap(self, result, func, iterable, max_inflight):
+        tasks = self._guarded_task_generation(result._job, func, iterable)
+        if max_inflight is None:
+            self._taskqueue.put((tasks, result._set_length))
+            return result
+        result._feed(self._taskqueue, tasks, max_inflight)
+        return _BoundedIMapIterator(result)
+
+    def imap(self, func, iterable, chunksize=1, max_inflight=None):
         """
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
+
+        If `max_inflight` is given, at most that many tasks (chunks if
+        `chunksize` is above 1) are submitted ahead of the results taken
+        from the returned iterator, and `iterable` is only advanced as
+        results are consumed.  An iterator abandoned before the end stops
+        submitting tasks when it is garbage collected; call its close()
+        method to stop earlier.
         """
         if self._state != RUN:
             raise ValueError('Pool not running')
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError('max_inflight must be at least 1')
         if chunksize == 1:
             result = IMapIterator(self._cache)
-            self._taskqueue.put((self._guarded_task_generation(result._job,
-                func, iterable), result._set_length))
-            return result
+            return self._start_imap(result, func, iterable, max_inflight)
         else:
             assert chunksize > 1
             task_batches = Pool._get_tasks(func, iterable, chunksize)
             result = IMapIterator(self._cache)
-            self._taskqueue.put((self._guarded_task_generation(result._job,
-                mapstar, task_batches), result._set_length))
-            return (item for chunk in result for item in chunk)
+            return _flatten_chunks(self._start_imap(result, mapstar,
+                task_batches, max_inflight))
 
-    def imap_unordered(self, func, iterable, chunksize=1):
+    def imap_unordered(self, func, iterable, chunksize=1, max_inflight=None):
         """
         Like `imap()` method but ordering of results is arbitrary.
+
+        See `imap()` for the meaning of `max_inflight`.
         """
         if self._state != RUN:
             raise ValueError('Pool not running')
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError('max_inflight must be at least 1')
         if chunksize == 1:
             result = IMapUnorderedIterator(self._cache)
-            self._taskqueue.put((self._guarded_task_generation(result._job,
-                func, iterable), result._set_length))
-            return result
+            return self._start_imap(result, func, iterable, max_inflight)
         else:
             assert chunksize > 1
             task_batches = Pool._get_tasks(func, iterable, chunksize)
             result = IMapUnorderedIterator(self._cache)
-            self._taskqueue.put((self._guarded_task_generation(result._job,
-                mapstar, task_batches), result._set_length))
-            return (item for chunk in result for item in chunk)
+            return _flatten_chunks(self._start_imap(result, mapstar,
+                task_batches, max_inflight))
 
     def apply_async(self, func, args=(), kwds={}, callback=None,
         error_callback=None):
@@ -576,6 +599,7 @@ class MapResult(ApplyResult):
 
 
 class IMapIterator(object):
+    _tasks = None
 
     def __init__(self, cache):
         self._cond = threading.Condition(threading.Lock())
@@ -604,6 +628,8 @@ class IMapIterator(object):
                     if self._index == self._length:
                         raise StopIteration
                     raise TimeoutError
+        if self._tasks is not None:
+            self._submit(1)
         success, value = item
         if success:
             return value
@@ -632,6 +658,36 @@ class IMapIterator(object):
                 self._cond.notify()
                 del self._cache[self._job]
 
+    def _feed(self, taskqueue, tasks, max_inflight):
+        self._feed_lock = threading.Lock()
+        self._taskqueue = taskqueue
+        self._tasks = tasks
+        self._submitted = 0
+        self._submit(max_inflight)
+
+    def _submit(self, n):
+        with self._feed_lock:
+            if self._tasks is None:
+                return
+            batch = list(itertools.islice(self._tasks, n))
+            self._submitted += len(batch)
+            if batch:
+                self._taskqueue.put((batch, None))
+            if len(batch) < n:
+                self._tasks = None
+                self._set_length(self._submitted)
+
+    def close(self):
+        """
+        Stop submitting tasks from the iterable of a `max_inflight` map;
+        the results of tasks already submitted can still be retrieved.
+        """
+        if self._tasks is not None:
+            with self._feed_lock:
+                if self._tasks is not None:
+                    self._tasks = None
+                    self._set_length(self._submitted)
+
 
 class IMapUnorderedIterator(IMapIterator):
 
@@ -644,6 +700,33 @@ class IMapUnorderedIterator(IMapIterator):
                 del self._cache[self._job]
 
 
+class _BoundedIMapIterator(object):
+    """
+    Iterator returned by `imap()` and `imap_unordered()` with `max_inflight`.
+
+    Only the wrapped result object is kept in the pool's cache, so an
+    abandoned iterator can be garbage collected, which closes it.
+    """
+
+    def __init__(self, result):
+        self._result = result
+        self._job = result._job
+
+    def __iter__(self):
+        return self
+
+    def next(self, timeout=None):
+        return self._result.next(timeout)
+    __next__ = next
+
+    def close(self):
+        self._result.close()
+    close.__doc__ = IMapIterator.close.__doc__
+
+    def __del__(self):
+        self._result.close()
+
+
 class ThreadPool(Pool):
     _wrap_exception = False
 
@@ -34,6 +34,31 @@ class ForkingPickler(pickle.Pickler):
         return buf.getbuffer()
     loads = pickle.loads
 
+    @classmethod
+    def dumps_oob(cls, obj):
+        """Pickle obj with protocol 5, leaving large buffers out of band.
+
+        Return the pickle data and a list of memoryviews of the buffers;
+        the buffers are not copied."""
+        buffers = []
+        buf = io.BytesIO()
+        _OutOfBandPickler(buf, buffers, cls).dump(obj)
+        return buf.getbuffer(), buffers
+
+    @staticmethod
+    def loads_oob(data, buffers):
+        """Unpickle data produced by dumps_oob() using the given buffers."""
+        return pickle._loads(data, buffers=buffers)
+
+
+class _OutOfBandPickler(pickle._Pickler):
+
+    def __init__(self, file, buffers, pickler_class):
+        super().__init__(file, pickle._BUFFER_PROTOCOL, buffer_callback=
+            lambda buf: buffers.append(buf.raw()))
+        self.dispatch_table = pickler_class._copyreg_dispatch_table.copy()
+        self.dispatch_table.update(pickler_class._extra_reducers)
+
 
 register = ForkingPickler.register
 
@@ -48,17 +48,24 @@ class SemaphoreTracker(object):
             finally:
                 os.close(r)
 
-    def register(self, name):
-        """Register name of semaphore with semaphore tracker."""
-        self._send('REGISTER', name)
+    def register(self, name, rtype='semaphore'):
+        """Register name of resource with semaphore tracker.
 
-    def unregister(self, name):
-        """Unregister name of semaphore with semaphore tracker."""
-        self._send('UNREGISTER', name)
+        rtype is one of the keys of _CLEANUP_FUNCS and selects how the
+        resource is destroyed if it is leaked."""
+        self._send('REGISTER', name, rtype)
 
-    def _send(self, cmd, name):
+    def unregister(self, name, rtype='semaphore'):
+        """Unregister name of resource with semaphore tracker."""
+        self._send('UNREGISTER', name, rtype)
+
+    def _send(self, cmd, name, rtype='semaphore'):
+        if rtype not in _CLEANUP_FUNCS:
+            raise ValueError('unknown resource type %r' % rtype)
+        if ':' in name:
+            raise ValueError('name must not contain %r' % ':')
         self.ensure_running()
-        msg = '{0}:{1}\n'.format(cmd, name).encode('ascii')
+        msg = '{0}:{1}:{2}\n'.format(cmd, name, rtype).encode('ascii')
         if len(name) > 512:
             raise ValueError('name too long')
         nbytes = os.write(self._fd, msg)
@@ -72,6 +79,17 @@ unregister = _semaphore_tracker.unregister
 getfd = _semaphore_tracker.getfd
 
 
+def _unlink_shared_memory(name):
+    from .shared_memory import _unlink
+    _unlink(name)
+
+
+_CLEANUP_FUNCS = {'semaphore': _multiprocessing.sem_unlink,
+    'shared_memory': _unlink_shared_memory}
+_PLURAL_NAMES = {'semaphore': 'semaphores', 'shared_memory':
+    'shared memory blocks'}
+
+
 def main(fd):
     """Run semaphore tracker."""
     signal.signal(signal.SIGINT, signal.SIG_IGN)
@@ -81,16 +99,16 @@ def main(fd):
             f.close()
         except Exception:
             pass
-    cache = set()
+    cache = {rtype: set() for rtype in _CLEANUP_FUNCS}
     try:
         with open(fd, 'rb') as f:
             for line in f:
                 try:
-                    cmd, name = line.strip().split(b':')
-                    if cmd == b'REGISTER':
-                        cache.add(name)
-                    elif cmd == b'UNREGISTER':
-                        cache.remove(name)
+                    cmd, name, rtype = line.strip().decode('ascii').split(':')
+                    if cmd == 'REGISTER':
+                        cache[rtype].add(name)
+                    elif cmd == 'UNREGISTER':
+                        cache[rtype].remove(name)
                     else:
                         raise RuntimeError('unrecognized command %r' % cmd)
                 except Exception:
@@ -99,19 +117,16 @@ def main(fd):
                     except:
                         pass
     finally:
-        if cache:
-            try:
-                warnings.warn(
-                    'semaphore_tracker: There appear to be %d leaked semaphores to clean up at shutdown'
-                     % len(cache))
-            except Exception:
-                pass
-        for name in cache:
-            try:
-                name = name.decode('ascii')
+        for rtype, names in cache.items():
+            if names:
+                try:
+                    warnings.warn(
+                        'semaphore_tracker: There appear to be %d leaked %s to clean up at shutdown'
+                         % (len(names), _PLURAL_NAMES[rtype]))
+                except Exception:
+                    pass
+            for name in names:
                 try:
-                    _multiprocessing.sem_unlink(name)
+                    _CLEANUP_FUNCS[rtype](name)
                 except Exception as e:
                     warnings.warn('semaphore_tracker: %r: %s' % (name, e))
-            finally:
-                pass
@@ -0,0 +1,256 @@
+"""Named shared memory blocks which processes can create and attach to.
+
+Unlike the arena used by multiprocessing.sharedctypes, a block does not
+have to be inherited: any process which knows its name can map it after
+it has been created.  Pickling a SharedMemory or SharedArray only
+transfers the name, so the contents are never copied.
+"""
+__all__ = ['SharedMemory', 'SharedArray']
+import array
+import mmap
+import os
+import struct
+import tempfile
+from . import util
+_USE_POSIX = os.name == 'posix'
+if _USE_POSIX:
+    from . import semaphore_tracker
+    if os.path.isdir('/dev/shm'):
+        _SHM_DIR = '/dev/shm'
+    else:
+        _SHM_DIR = tempfile.gettempdir()
+_SHM_PREFIX = 'psm_'
+_SHM_NAME_LENGTH = 14
+_ARRAY_TYPECODES = 'bBhHiIlLqQfd'
+
+
+def _make_filename():
+    """Create a random name for a shared memory block."""
+    nbytes = (_SHM_NAME_LENGTH - len(_SHM_PREFIX)) // 2
+    return _SHM_PREFIX + os.urandom(nbytes).hex()
+
+
+def _path(name):
+    return os.path.join(_SHM_DIR, name)
+
+
+def _unlink(name):
+    os.unlink(_path(name))
+
+
+class SharedMemory(object):
+    """A block of memory shared between processes and identified by name.
+
+    With create=True a new block of size bytes is created; if name is
+    None a unique name is chosen.  Otherwise the existing block called
+    name is attached to.  The contents are exposed as the memoryview
+    buf.  Every process should call close() when it no longer needs the
+    block and exactly one process should call unlink() to destroy it.
+    Blocks created but never unlinked are destroyed by the semaphore
+    tracker when the program ends.
+    """
+    _fd = -1
+    _mmap = None
+    _buf = None
+
+    def __init__(self, name=None, create=False, size=0):
+        if not size >= 0:
+            raise ValueError("'size' must be a positive integer")
+        if create and size == 0:
+            raise ValueError(
+                "'size' must be a positive number different from zero")
+        if name is None and not create:
+            raise ValueError("'name' can only be None if create=True")
+        if name is not None and (os.sep in name or ':' in name):
+            raise ValueError('invalid shared memory name %r' % name)
+        if _USE_POSIX:
+            flags = os.O_RDWR
+            if create:
+                flags |= os.O_CREAT | os.O_EXCL
+            while True:
+                candidate = _make_filename() if name is None else name
+                try:
+                    self._fd = os.open(_path(candidate), flags, 384)
+                except FileExistsError:
+                    if name is not None:
+                        raise
+                else:
+                    name = candidate
+                    break
+            try:
+                if create:
+                    os.ftruncate(self._fd, size)
+                size = os.fstat(self._fd).st_size
+                self._mmap = mmap.mmap(self._fd, size)
+            except:
+                self.close()
+                if create:
+                    _unlink(name)
+                raise
+            if create:
+                semaphore_tracker.register(name, 'shared_memory')
+        else:
+            if size == 0:
+                raise ValueError(
+                    "'size' is needed to attach to a shared memory block")
+            if name is None:
+                name = _make_filename()
+            self._mmap = mmap.mmap(-1, size, tagname=name)
+        self._name = name
+        self._size = size
+        self._buf = memoryview(self._mmap)
+        util.debug('%s shared memory block %r of %d bytes' % ('created' if
+            create else 'attached to', name, size))
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+    def __reduce__(self):
+        return self.__class__, (self.name, False, self.size)
+
+    def __repr__(self):
+        return '%s(%r, size=%d)' % (self.__class__.__name__, self.name,
+            self.size)
+
+    @property
+    def buf(self):
+        """A memoryview of the contents of the block."""
+        return self._buf
+
+    @property
+    def name(self):
+        """Name under which other processes can attach to the block."""
+        return self._name
+
+    @property
+    def size(self):
+        """Size of the block in bytes."""
+        return self._size
+
+    def close(self):
+        """Close access to the block from this instance.
+
+        All memoryviews derived from buf must be released first."""
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def unlink(self):
+        """Destroy the block once every process has closed it.
+
+        On Windows the block is destroyed when the last handle to it is
+        closed, so this does nothing."""
+        if _USE_POSIX:
+            _unlink(self._name)
+            semaphore_tracker.unregister(self._name, 'shared_memory')
+
+
+def _rebuild_array(shm):
+    return SharedArray(shm=shm)
+
+
+class SharedArray(object):
+    """A fixed-length array of numbers stored in a SharedMemory block.
+
+    typecode is one of the array module's numeric typecodes and
+    size_or_initializer is either the number of zeroed items or an
+    iterable of initial values.  Passing name instead attaches to an
+    array created elsewhere.  Items can be read and assigned by index,
+    and the view attribute is a memoryview of the items which can be
+    handed to other libraries without copying.
+    """
+    _header = struct.Struct('qc7x')
+
+    def __init__(self, typecode=None, size_or_initializer=0, *, name=None,
+        shm=None):
+        if shm is None and name is not None:
+            shm = SharedMemory(name)
+        if shm is not None:
+            length, typecode = self._header.unpack_from(shm.buf)
+            typecode = typecode.decode('ascii')
+        else:
+            if typecode not in _ARRAY_TYPECODES:
+                raise ValueError('bad typecode (must be one of %s)' % ', '.
+                    join(_ARRAY_TYPECODES))
+            if isinstance(size_or_initializer, int):
+                initializer = None
+                length = size_or_initializer
+            else:
+                initializer = array.array(typecode, size_or_initializer)
+                length = len(initializer)
+            nbytes = length * struct.calcsize(typecode)
+            shm = SharedMemory(create=True, size=self._header.size + nbytes)
+            self._header.pack_into(shm.buf, 0, length, typecode.encode(
+                'ascii'))
+            if initializer is not None:
+                start = self._header.size
+                shm.buf[start:start + nbytes] = memoryview(initializer).cast(
+                    'B')
+        start = self._header.size
+        stop = start + length * struct.calcsize(typecode)
+        self._shm = shm
+        self._typecode = typecode
+        self._view = shm.buf[start:stop].cast(typecode)
+
+    def __reduce__(self):
+        return _rebuild_array, (self._shm,)
+
+    def __repr__(self):
+        return '%s(%r, %r, name=%r)' % (self.__class__.__name__, self.
+            typecode, len(self), self.name)
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view[index].tolist()
+        return self._view[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = memoryview(array.array(self._typecode, value))
+        self._view[index] = value
+
+    def __iter__(self):
+        return iter(self._view)
+
+    @property
+    def name(self):
+        """Name of the underlying SharedMemory block."""
+        return self._shm.name
+
+    @property
+    def shm(self):
+        """The underlying SharedMemory block."""
+        return self._shm
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    @property
+    def view(self):
+        """A memoryview of the items, formatted with typecode."""
+        return self._view
+
+    def tolist(self):
+        return self._view.tolist()
+
+    def close(self):
+        """Close access to the array from this instance."""
+        self._view.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the underlying block; see SharedMemory.unlink()."""
+        self._shm.unlink()
@@ -7,6 +7,7 @@ Classes:
 
     Pickler
     Unpickler
+    PickleBuffer
 
 Functions:
 
@@ -35,12 +36,13 @@ import io
 import codecs
 import _compat_pickle
 __all__ = ['PickleError', 'PicklingError', 'UnpicklingError', 'Pickler',
-    'Unpickler', 'dump', 'dumps', 'load', 'loads']
+    'Unpickler', 'PickleBuffer', 'dump', 'dumps', 'load', 'loads']
 bytes_types = bytes, bytearray
 format_version = '4.0'
 compatible_formats = ['1.0', '1.1', '1.2', '1.3', '2.0', '3.0', '4.0']
 HIGHEST_PROTOCOL = 4
 DEFAULT_PROTOCOL = 3
+_BUFFER_PROTOCOL = 5
 
 
 class PickleError(Exception):
@@ -146,9 +148,61 @@ NEWOBJ_EX = b'\x92'
 STACK_GLOBAL = b'\x93'
 MEMOIZE = b'\x94'
 FRAME = b'\x95'
+NEXT_BUFFER = b'\x97'
 __all__.extend([x for x in dir() if re.match('[A-Z][A-Z0-9_]+$', x)])
 
 
+class PickleBuffer:
+    """Wrapper for a buffer that may be pickled out of band.
+
+    Instances are passed to the *buffer_callback* of a Pickler; raw()
+    returns a flat memoryview of the wrapped data without copying it.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+
+    def raw(self):
+        """Return a one-dimensional memoryview of unsigned bytes over the
+        underlying buffer, which must be contiguous."""
+        if not self._view.c_contiguous:
+            raise BufferError(
+                'cannot extract raw buffer from non-contiguous buffer')
+        return self._view.cast('B')
+
+    def release(self):
+        """Release the underlying buffer."""
+        self._view.release()
+
+    def __repr__(self):
+        return '<%s of %d bytes>' % (self.__class__.__name__, self._view.
+            nbytes)
+
+    def __reduce_ex__(self, protocol):
+        view = self.raw()
+        if view.readonly:
+            return bytes, (view.tobytes(),)
+        return bytearray, (view.tobytes(),)
+
+
+def _rebuild_buffer(cls, buffer, format='B', shape=None):
+    if isinstance(buffer, PickleBuffer):
+        buffer = buffer.raw()
+    if cls is memoryview:
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        if format != 'B' or shape is not None:
+            view = view.cast(format, shape)
+        return view
+    if type(buffer) is cls:
+        return buffer
+    return cls(buffer)
+
+
+_buffer_types = bytearray, memoryview
+
+
 class _Framer:
     _FRAME_SIZE_TARGET = 64 * 1024
 
@@ -306,7 +360,8 @@ def decode_long(data):
 
 class _Pickler:
 
-    def __init__(self, file, protocol=None, *, fix_imports=True):
+    def __init__(self, file, protocol=None, *, fix_imports=True,
+        buffer_callback=None, records=False):
         """This takes a binary file for writing a pickle data stream.
 
         The optional *protocol* argument tells the pickler to use the
@@ -328,12 +383,31 @@ class _Pickler:
         will try to map the new Python 3 names to the old module names
         used in Python 2, so that the pickle data stream is readable
         with Python 2.
+
+        If *buffer_callback* is not None, it is called with a
+        PickleBuffer for every PickleBuffer and memoryview, and for
+        every bytes and bytearray object of at least 64 KiB, that is
+        pickled.  If it returns a false value the data is left out of the
+        pickle stream and must be passed to the unpickler's *buffers*
+        argument, in the same order; otherwise the data is pickled
+        in-band.  *buffer_callback* requires protocol 5, which is
+        protocol 4 plus out-of-band buffers.  Only the pure-Python
+        pickler and unpickler support protocol 5, so it must be asked
+        for explicitly and is not HIGHEST_PROTOCOL.
+
+        If *records* is True and *protocol* is at least 1, lists of 64 or
+        more tuples whose fields have the same types, each int, float or
+        str, are written in batches without calling save() for every
+        tuple and field.  Those tuples and strings are not memoized and
+        not passed to persistent_id(), so equal records are not shared.
+        Any unpickler can read the result.
         """
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
         if protocol < 0:
             protocol = HIGHEST_PROTOCOL
-        elif not 0 <= protocol <= HIGHEST_PROTOCOL:
+        elif not 0 <= protocol <= HIGHEST_PROTOCOL and protocol != (
+            _BUFFER_PROTOCOL):
             raise ValueError('pickle protocol must be <= %d' % HIGHEST_PROTOCOL
                 )
         try:
@@ -347,6 +421,11 @@ class _Pickler:
         self.bin = protocol >= 1
         self.fast = 0
         self.fix_imports = fix_imports and protocol < 3
+        if buffer_callback is not None and protocol < _BUFFER_PROTOCOL:
+            raise ValueError('buffer_callback needs protocol %d' %
+                _BUFFER_PROTOCOL)
+        self._buffer_callback = buffer_callback
+        self._records = records and self.bin
 
     def clear_memo(self):
         """Clears the pickler's "memo".
@@ -415,6 +494,9 @@ class _Pickler:
         if f is not None:
             f(self, obj)
             return
+        if (self._buffer_callback is not None and t in _buffer_types and
+            self._save_out_of_band(obj)):
+            return
         reduce = getattr(self, 'dispatch_table', dispatch_table).get(t)
         if reduce is not None:
             rv = reduce(obj)
@@ -530,36 +612,80 @@ class _Pickler:
     dispatch[bool] = save_bool
 
     def save_long(self, obj):
+        self.write(self._encode_long(obj))
+    dispatch[int] = save_long
+
+    def _encode_long(self, obj):
         if self.bin:
             if obj >= 0:
                 if obj <= 255:
-                    self.write(BININT1 + pack('<B', obj))
-                    return
+                    return BININT1 + pack('<B', obj)
                 if obj <= 65535:
-                    self.write(BININT2 + pack('<H', obj))
-                    return
+                    return BININT2 + pack('<H', obj)
             if -2147483648 <= obj <= 2147483647:
-                self.write(BININT + pack('<i', obj))
-                return
+                return BININT + pack('<i', obj)
         if self.proto >= 2:
             encoded = encode_long(obj)
             n = len(encoded)
             if n < 256:
-                self.write(LONG1 + pack('<B', n) + encoded)
-            else:
-                self.write(LONG4 + pack('<i', n) + encoded)
-            return
-        self.write(LONG + repr(obj).encode('ascii') + b'L\n')
-    dispatch[int] = save_long
+                return LONG1 + pack('<B', n) + encoded
+            return LONG4 + pack('<i', n) + encoded
+        return LONG + repr(obj).encode('ascii') + b'L\n'
 
     def save_float(self, obj):
+        self.write(self._encode_float(obj))
+    dispatch[float] = save_float
+
+    def _encode_float(self, obj):
         if self.bin:
-            self.write(BINFLOAT + pack('>d', obj))
+            return BINFLOAT + pack('>d', obj)
+        return FLOAT + repr(obj).encode('ascii') + b'\n'
+
+    _OUT_OF_BAND_MIN = 1 << 16
+
+    def _save_out_of_band(self, obj):
+        t = type(obj)
+        if t is not memoryview and len(obj) < self._OUT_OF_BAND_MIN:
+            return False
+        buf = PickleBuffer(obj)
+        if buf._view.c_contiguous and not self._buffer_callback(buf):
+            self.save(_rebuild_buffer)
+            write = self.write
+            write(MARK)
+            self.save(t)
+            write(NEXT_BUFFER)
+            if t is memoryview and (obj.format != 'B' or obj.ndim != 1):
+                self.save(obj.format)
+                self.save(obj.shape)
+            write(TUPLE + REDUCE)
+            self.memoize(obj)
+        elif t is memoryview:
+            self.save_reduce(_rebuild_buffer, (memoryview, obj.tobytes(),
+                obj.format, obj.shape), obj=obj)
+        elif t is bytearray:
+            self.save(bytearray)
+            self._write_bytes(bytes(obj))
+            self.write(TUPLE1 + REDUCE)
+            self.memoize(obj)
         else:
-            self.write(FLOAT + repr(obj).encode('ascii') + b'\n')
-    dispatch[float] = save_float
+            return False
+        return True
+
+    def save_picklebuffer(self, obj):
+        callback = self._buffer_callback
+        if callback is not None and not callback(obj):
+            self.write(NEXT_BUFFER)
+            return
+        view = obj.raw()
+        if view.readonly:
+            self.save_bytes(view.tobytes())
+        else:
+            self.save(bytearray(view))
+    dispatch[PickleBuffer] = save_picklebuffer
 
     def save_bytes(self, obj):
+        if self._buffer_callback is not None and self._save_out_of_band(obj):
+            return
         if self.proto < 3:
             if not obj:
                 self.save_reduce(bytes, (), obj=obj)
@@ -567,6 +693,10 @@ class _Pickler:
                 self.save_reduce(codecs.encode, (str(obj, 'latin1'),
                     'latin1'), obj=obj)
             return
+        self._write_bytes(obj)
+    dispatch[bytes] = save_bytes
+
+    def _write_bytes(self, obj):
         n = len(obj)
         if n <= 255:
             self.write(SHORT_BINBYTES + pack('<B', n) + obj)
@@ -575,24 +705,24 @@ class _Pickler:
         else:
             self.write(BINBYTES + pack('<I', n) + obj)
         self.memoize(obj)
-    dispatch[bytes] = save_bytes
 
     def save_str(self, obj):
+        self.write(self._encode_str(obj))
+        self.memoize(obj)
+    dispatch[str] = save_str
+
+    def _encode_str(self, obj):
         if self.bin:
             encoded = obj.encode('utf-8', 'surrogatepass')
             n = len(encoded)
             if n <= 255 and self.proto >= 4:
-                self.write(SHORT_BINUNICODE + pack('<B', n) + encoded)
-            elif n > 4294967295 and self.proto >= 4:
-                self.write(BINUNICODE8 + pack('<Q', n) + encoded)
-            else:
-                self.write(BINUNICODE + pack('<I', n) + encoded)
-        else:
-            obj = obj.replace('\\', '\\u005c')
-            obj = obj.replace('\n', '\\u000a')
-            self.write(UNICODE + obj.encode('raw-unicode-escape') + b'\n')
-        self.memoize(obj)
-    dispatch[str] = save_str
+                return SHORT_BINUNICODE + pack('<B', n) + encoded
+            if n > 4294967295 and self.proto >= 4:
+                return BINUNICODE8 + pack('<Q', n) + encoded
+            return BINUNICODE + pack('<I', n) + encoded
+        obj = obj.replace('\\', '\\u005c')
+        obj = obj.replace('\n', '\\u000a')
+        return UNICODE + obj.encode('raw-unicode-escape') + b'\n'
 
     def save_tuple(self, obj):
         if not obj:
@@ -630,6 +760,8 @@ class _Pickler:
     dispatch[tuple] = save_tuple
 
     def save_list(self, obj):
+        if self._records and self._save_records(obj):
+            return
         if self.bin:
             self.write(EMPTY_LIST)
         else:
@@ -638,6 +770,44 @@ class _Pickler:
         self._batch_appends(obj)
     dispatch[list] = save_list
     _BATCHSIZE = 1000
+    _RECORDS_MIN = 64
+    _record_encoders = {int: '_encode_long', float: '_encode_float', str:
+        '_encode_str'}
+
+    def _save_records(self, obj):
+        if len(obj) < self._RECORDS_MIN:
+            return False
+        first = obj[0]
+        if type(first) is not tuple or not first:
+            return False
+        types = tuple(map(type, first))
+        try:
+            encoders = [getattr(self, self._record_encoders[t]) for t in types]
+        except KeyError:
+            return False
+        for record in obj:
+            if type(record) is not tuple or tuple(map(type, record)) != types:
+                return False
+        n = len(types)
+        if n <= 3 and self.proto >= 2:
+            begin, end = b'', _tuplesize2code[n]
+        else:
+            begin, end = MARK, TUPLE
+        write = self.write
+        write(EMPTY_LIST)
+        self.memoize(obj)
+        for i in range(0, len(obj), self._BATCHSIZE):
+            batch = obj[i:i + self._BATCHSIZE]
+            parts = [MARK] if len(batch) > 1 else []
+            for record in batch:
+                parts.append(begin)
+                parts.extend([encode(field) for encode, field in zip(
+                    encoders, record)])
+                parts.append(end)
+            parts.append(APPENDS if len(batch) > 1 else APPEND)
+            self.framer.commit_frame()
+            write(b''.join(parts))
+        return True
 
     def _batch_appends(self, items):
         save = self.save
@@ -812,7 +982,7 @@ class _Pickler:
 class _Unpickler:
 
     def __init__(self, file, *, fix_imports=True, encoding='ASCII', errors=
-        'strict'):
+        'strict', buffers=None):
         """This takes a binary file for reading a pickle data stream.
 
         The protocol version of the pickle is detected automatically, so
@@ -839,7 +1009,15 @@ class _Unpickler:
         to decode 8-bit string instances pickled by Python 2; these
         default to 'ASCII' and 'strict', respectively. *encoding* can be
         'bytes' to read theses 8-bit string instances as bytes objects.
+
+        If *buffers* is not None, it is an iterable of buffer objects
+        consumed in order each time the pickle stream refers to an
+        out-of-band buffer.  bytes, bytearray and memoryview buffers of
+        the type being unpickled are used as is, without copying.
         """
+        if buffers is not None:
+            buffers = iter(buffers)
+        self._buffers = buffers
         self._file_readline = file.readline
         self._file_read = file.read
         self.memo = {}
@@ -888,7 +1066,7 @@ class _Unpickler:
 
     def load_proto(self):
         proto = self.read(1)[0]
-        if not 0 <= proto <= HIGHEST_PROTOCOL:
+        if not 0 <= proto <= HIGHEST_PROTOCOL and proto != _BUFFER_PROTOCOL:
             raise ValueError('unsupported pickle protocol: %d' % proto)
         self.proto = proto
     dispatch[PROTO[0]] = load_proto
@@ -900,6 +1078,21 @@ class _Unpickler:
         self._unframer.load_frame(frame_size)
     dispatch[FRAME[0]] = load_frame
 
+    def load_next_buffer(self):
+        if self.proto < _BUFFER_PROTOCOL:
+            raise UnpicklingError('NEXT_BUFFER needs protocol %d' %
+                _BUFFER_PROTOCOL)
+        if self._buffers is None:
+            raise UnpicklingError(
+                'pickle stream refers to out-of-band data but no *buffers* argument was given'
+                )
+        try:
+            buf = next(self._buffers)
+        except StopIteration:
+            raise UnpicklingError('not enough out-of-band buffers')
+        self.append(buf)
+    dispatch[NEXT_BUFFER[0]] = load_next_buffer
+
     def load_persid(self):
         try:
             pid = self.readline()[:-1].decode('ascii')
@@ -1345,29 +1538,35 @@ class _Unpickler:
     dispatch[STOP[0]] = load_stop
 
 
-def _dump(obj, file, protocol=None, *, fix_imports=True):
-    _Pickler(file, protocol, fix_imports=fix_imports).dump(obj)
+def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=
+    None, records=False):
+    _Pickler(file, protocol, fix_imports=fix_imports, buffer_callback=
+        buffer_callback, records=records).dump(obj)
 
 
-def _dumps(obj, protocol=None, *, fix_imports=True):
+def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None,
+    records=False):
     f = io.BytesIO()
-    _Pickler(f, protocol, fix_imports=fix_imports).dump(obj)
+    _Pickler(f, protocol, fix_imports=fix_imports, buffer_callback=
+        buffer_callback, records=records).dump(obj)
     res = f.getvalue()
     assert isinstance(res, bytes_types)
     return res
 
 
-def _load(file, *, fix_imports=True, encoding='ASCII', errors='strict'):
+def _load(file, *, fix_imports=True, encoding='ASCII', errors='strict',
+    buffers=None):
     return _Unpickler(file, fix_imports=fix_imports, encoding=encoding,
-        errors=errors).load()
+        errors=errors, buffers=buffers).load()
 
 
-def _loads(s, *, fix_imports=True, encoding='ASCII', errors='strict'):
+def _loads(s, *, fix_imports=True, encoding='ASCII', errors='strict',
+    buffers=None):
     if isinstance(s, str):
         raise TypeError("Can't load pickle from unicode string")
     file = io.BytesIO(s)
     return _Unpickler(file, fix_imports=fix_imports, encoding=encoding,
-        errors=errors).load()
+        errors=errors, buffers=buffers).load()
 
 
 try:
@@ -820,7 +820,8 @@ class OpcodeInfo(object):
         for x in stack_after:
             assert isinstance(x, StackObject)
         self.stack_after = stack_after
-        assert isinstance(proto, int) and 0 <= proto <= pickle.HIGHEST_PROTOCOL
+        assert isinstance(proto, int) and 0 <= proto <= max(pickle.
+            HIGHEST_PROTOCOL, pickle._BUFFER_PROTOCOL)
         self.proto = proto
         assert isinstance(doc, str)
         self.doc = doc
@@ -1438,6 +1439,13 @@ opcodes = [I(name='INT', code='I', arg=decimalnl_short, stack_before=[],
       The unpickler may use this opcode to safely prefetch data from its
       underlying stream.
       """
+    ), I(name='NEXT_BUFFER', code='\x97', arg=None, stack_before=[],
+    stack_after=[anyobject], proto=5, doc=
+    """Push an out-of-band buffer object.
+
+      The object pushed is the next one in the sequence of buffers given
+      to the unpickler; the data itself is not part of the pickle.
+      """
     ), I(name='PERSID', code='P', arg=stringnl_noescape, stack_before=[],
     stack_after=[anyobject], proto=0, doc=
     """Push an object identified by a persistent ID.
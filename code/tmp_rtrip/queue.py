@@ -6,7 +6,8 @@ except ImportError:
 from collections import deque
 from heapq import heappush, heappop
 from time import monotonic as time
-__all__ = ['Empty', 'Full', 'Queue', 'PriorityQueue', 'LifoQueue']
+__all__ = ['Empty', 'Full', 'Queue', 'PriorityQueue', 'LifoQueue',
+    'SimpleQueue']
 
 
 class Empty(Exception):
@@ -162,6 +163,75 @@ class Queue:
             self.not_full.notify()
             return item
 
+    def put_many(self, items, block=True, timeout=None):
+        """Put the items into the queue in order.
+
+        This behaves like calling put() for every item with 'timeout'
+        covering the whole batch, but takes the lock and wakes consumers
+        once per batch.  On a bounded queue items are added as free slots
+        become available, so when Full is raised the items before the one
+        which did not fit have been queued.
+        """
+        if block and timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            endtime = time() + timeout
+        with self.not_full:
+            pending = 0
+            try:
+                for item in items:
+                    while 0 < self.maxsize <= self._qsize():
+                        if not block:
+                            raise Full
+                        if pending:
+                            self.not_empty.notify(pending)
+                            pending = 0
+                        if timeout is None:
+                            self.not_full.wait()
+                        else:
+                            remaining = endtime - time()
+                            if remaining <= 0.0:
+                                raise Full
+                            self.not_full.wait(remaining)
+                    self._put(item)
+                    self.unfinished_tasks += 1
+                    pending += 1
+            finally:
+                if pending:
+                    self.not_empty.notify(pending)
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        """Remove and return a list of up to 'max_items' items.
+
+        Waits like get() until at least one item is available, then takes
+        every queued item (or the first 'max_items' of them) without
+        blocking further.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("'max_items' must be a positive integer")
+        with self.not_empty:
+            if not block:
+                if not self._qsize():
+                    raise Empty
+            elif timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time() + timeout
+                while not self._qsize():
+                    remaining = endtime - time()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+            n = self._qsize()
+            if max_items is not None:
+                n = min(n, max_items)
+            items = [self._get() for i in range(n)]
+            self.not_full.notify(n)
+            return items
+
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
 
@@ -224,3 +294,143 @@ class LifoQueue(Queue):
 
     def _get(self):
         return self.queue.pop()
+
+
+class SimpleQueue:
+    """Simple, unbounded FIFO queue.
+
+    Unlike Queue there is no maxsize and no task tracking (task_done()
+    and join()), which lets put() and non-blocking get() run without
+    taking any lock: items live in a deque, whose append() and
+    popleft() are atomic.  Only a get() which has to wait takes a lock,
+    to register itself, and put() wakes one registered getter.
+    """
+
+    def __init__(self):
+        self._queue = deque()
+        self._waiters = deque()
+        self._mutex = threading.Lock()
+
+    def put(self, item, block=True, timeout=None):
+        """Put the item on the queue.
+
+        The optional 'block' and 'timeout' arguments are ignored, as this
+        method never blocks.  They are provided for compatibility with the
+        Queue class.
+        """
+        self._queue.append(item)
+        if self._waiters:
+            self._wakeup(1)
+
+    def put_many(self, items, block=True, timeout=None):
+        """Put the items on the queue in order; never blocks."""
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        self._queue.extend(items)
+        if self._waiters:
+            self._wakeup(len(items))
+
+    def get(self, block=True, timeout=None):
+        """Remove and return an item from the queue.
+
+        If optional args 'block' is true and 'timeout' is None (the default),
+        block if necessary until an item is available. If 'timeout' is
+        a non-negative number, it blocks at most 'timeout' seconds and raises
+        the Empty exception if no item was available within that time.
+        Otherwise ('block' is false), return an item if one is immediately
+        available, else raise the Empty exception ('timeout' is ignored
+        in that case).
+        """
+        try:
+            return self._queue.popleft()
+        except IndexError:
+            pass
+        if not block:
+            raise Empty
+        return self._wait_for_item(timeout)
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        """Remove and return a list of up to 'max_items' items.
+
+        Waits like get() until at least one item is available, then takes
+        the items queued at that point (or the first 'max_items' of them)
+        without blocking further.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("'max_items' must be a positive integer")
+        items = [self.get(block, timeout)]
+        popleft = self._queue.popleft
+        n = len(self._queue)
+        if max_items is not None:
+            n = min(n, max_items - 1)
+        try:
+            for i in range(n):
+                items.append(popleft())
+        except IndexError:
+            pass
+        return items
+
+    def put_nowait(self, item):
+        """Put an item into the queue without blocking.
+
+        This is exactly equivalent to `put(item)` and is only provided
+        for compatibility with the Queue class.
+        """
+        return self.put(item, block=False)
+
+    def get_nowait(self):
+        """Remove and return an item from the queue without blocking.
+
+        Only get an item if one is immediately available. Otherwise
+        raise the Empty exception.
+        """
+        return self.get(False)
+
+    def empty(self):
+        """Return True if the queue is empty (not reliable!)."""
+        return not self._queue
+
+    def qsize(self):
+        """Return the approximate size of the queue (not reliable!)."""
+        return len(self._queue)
+
+    def _wakeup(self, n):
+        with self._mutex:
+            waiters = self._waiters
+            while n and waiters:
+                waiters.popleft().release()
+                n -= 1
+
+    def _wait_for_item(self, timeout):
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            endtime = time() + timeout
+        waiter = threading.Lock()
+        waiter.acquire()
+        while True:
+            with self._mutex:
+                self._waiters.append(waiter)
+                try:
+                    item = self._queue.popleft()
+                except IndexError:
+                    pass
+                else:
+                    self._waiters.pop()
+                    return item
+            if timeout is None:
+                waiter.acquire()
+                continue
+            remaining = endtime - time()
+            if remaining > 0.0 and waiter.acquire(True, remaining):
+                continue
+            with self._mutex:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    waiter.acquire()
+                try:
+                    return self._queue.popleft()
+                except IndexError:
+                    pass
+            raise Empty
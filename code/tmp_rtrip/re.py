@@ -79,6 +79,10 @@ This module exports the following functions:
     finditer  Return an iterator yielding a match object for each match.
     compile   Compile a pattern into a RegexObject.
     purge     Clear the regular expression cache.
+    cache_info     Report statistics about the regular expression cache.
+    set_cache_size Change the maximum number of cached patterns.
+    dump_cache     Save the programs of the cached patterns to a file.
+    load_cache     Load programs saved by dump_cache().
     escape    Backslash all non-alphanumerics in a string.
 
 Some of the functions in this module takes flags as optional parameters:
@@ -106,12 +110,17 @@ import enum
 import sre_compile
 import sre_parse
 import functools
+import collections
+import marshal
+import sys
+import _sre
 try:
     import _locale
 except ImportError:
     _locale = None
 __all__ = ['match', 'fullmatch', 'search', 'sub', 'subn', 'split',
     'findall', 'finditer', 'compile', 'purge', 'template', 'escape',
+    'cache_info', 'set_cache_size', 'dump_cache', 'load_cache', 'RegexSet',
     'error', 'A', 'I', 'L', 'M', 'S', 'X', 'U', 'ASCII', 'IGNORECASE',
     'LOCALE', 'MULTILINE', 'DOTALL', 'VERBOSE', 'UNICODE']
 __version__ = '2.2.1'
@@ -156,7 +165,10 @@ def fullmatch(pattern, string, flags=0):
 def search(pattern, string, flags=0):
     """Scan through string looking for a match to the pattern, returning
     a match object, or None if no match was found."""
-    return _compile(pattern, flags).search(string)
+    p = _compile(pattern, flags)
+    if not _may_match(pattern, flags, string):
+        return None
+    return p.search(string)
 
 
 def sub(pattern, repl, string, count=0, flags=0):
@@ -200,7 +212,10 @@ def findall(pattern, string, flags=0):
     has more than one group.
 
     Empty matches are included in the result."""
-    return _compile(pattern, flags).findall(string)
+    p = _compile(pattern, flags)
+    if not _may_match(pattern, flags, string):
+        return []
+    return p.findall(string)
 
 
 def finditer(pattern, string, flags=0):
@@ -208,7 +223,10 @@ def finditer(pattern, string, flags=0):
     string.  For each match, the iterator returns a match object.
 
     Empty matches are included in the result."""
-    return _compile(pattern, flags).finditer(string)
+    p = _compile(pattern, flags)
+    if not _may_match(pattern, flags, string):
+        return iter(())
+    return p.finditer(string)
 
 
 def compile(pattern, flags=0):
@@ -218,10 +236,75 @@ def compile(pattern, flags=0):
 
 def purge():
     """Clear the regular expression caches"""
+    global _cache_hits, _cache_misses
     _cache.clear()
+    _precompiled.clear()
+    _cache_hits = _cache_misses = 0
     _compile_repl.cache_clear()
 
 
+def cache_info():
+    """Report cache statistics as a named tuple of
+    (hits, misses, maxsize, currsize)."""
+    return _CacheInfo(_cache_hits, _cache_misses, _MAXCACHE, len(_cache))
+
+
+def set_cache_size(maxsize):
+    """Set the maximum number of compiled patterns kept in the cache.
+
+    When the cache is full the least recently used pattern is discarded.
+    A size of 0 disables caching."""
+    global _MAXCACHE
+    if not isinstance(maxsize, int):
+        raise TypeError('cache size must be an integer')
+    if maxsize < 0:
+        raise ValueError('cache size must be non-negative')
+    _MAXCACHE = maxsize
+    while len(_cache) > maxsize:
+        _cache.popitem(last=False)
+
+
+def dump_cache(file):
+    """Write the compiled programs of the cached patterns to the binary
+    file object file.
+
+    Patterns compiled with the LOCALE flag are not saved."""
+    programs = dict(_precompiled)
+    for key, (p, loc, literals) in _cache.items():
+        if loc is None and key not in programs and key[0] in (str, bytes):
+            pattern, flags = key[1:]
+            program = sre_compile._program(sre_parse.parse(pattern, flags),
+                flags, pattern)
+            programs[key] = program, literals
+    data = [(pattern, int(flags), _plain_program(program), literals) for (t,
+        pattern, flags), (program, literals) in programs.items()]
+    marshal.dump((_PROGRAM_MAGIC, data), file)
+
+
+def _plain_program(program):
+    pattern, flags, code, groups, groupindex, indexgroup = program
+    code = [int(c) for c in code]
+    return pattern, int(flags), code, groups, groupindex, indexgroup
+
+
+def load_cache(file):
+    """Read programs written by dump_cache() from the binary file object
+    file.  Compiling one of the saved patterns afterwards skips parsing
+    and code generation.  Return the number of programs loaded.
+
+    A file written by a different version of the regular expression
+    engine is ignored."""
+    try:
+        magic, data = marshal.load(file)
+    except (EOFError, ValueError, TypeError):
+        return 0
+    if magic != _PROGRAM_MAGIC:
+        return 0
+    for pattern, flags, program, literals in data:
+        _precompiled[type(pattern), pattern, flags] = program, literals
+    return len(data)
+
+
 def template(pattern, flags=0):
     """Compile a template pattern, returning a pattern object"""
     return _compile(pattern, flags | T)
@@ -262,18 +345,31 @@ def escape(pattern):
         return bytes(s)
 
 
-_cache = {}
+_cache = collections.OrderedDict()
+_precompiled = {}
 _pattern_type = type(sre_compile.compile('', 0))
 _MAXCACHE = 512
+_cache_hits = _cache_misses = 0
+_CacheInfo = collections.namedtuple('CacheInfo',
+    'hits misses maxsize currsize')
+_PROGRAM_MAGIC = _sre.MAGIC, _sre.CODESIZE, sys.hexversion
 
 
 def _compile(pattern, flags):
+    global _cache_hits, _cache_misses
+    key = type(pattern), pattern, flags
     try:
-        p, loc = _cache[type(pattern), pattern, flags]
-        if loc is None or loc == _locale.setlocale(_locale.LC_CTYPE):
-            return p
+        p, loc, literals = _cache[key]
     except KeyError:
         pass
+    else:
+        if loc is None or loc == _locale.setlocale(_locale.LC_CTYPE):
+            _cache_hits += 1
+            try:
+                _cache.move_to_end(key)
+            except KeyError:
+                pass
+            return p
     if isinstance(pattern, _pattern_type):
         if flags:
             raise ValueError(
@@ -281,20 +377,44 @@ def _compile(pattern, flags):
         return pattern
     if not sre_compile.isstring(pattern):
         raise TypeError('first argument must be string or compiled pattern')
-    p = sre_compile.compile(pattern, flags)
-    if not flags & DEBUG:
-        if len(_cache) >= _MAXCACHE:
-            _cache.clear()
-        if p.flags & LOCALE:
-            if not _locale:
-                return p
-            loc = _locale.setlocale(_locale.LC_CTYPE)
-        else:
-            loc = None
-        _cache[type(pattern), pattern, flags] = p, loc
+    if flags & DEBUG:
+        return sre_compile.compile(pattern, flags)
+    _cache_misses += 1
+    try:
+        program, literals = _precompiled[key]
+    except KeyError:
+        p, literals = sre_compile._compile_prefiltered(pattern, flags)
+    else:
+        p = _sre.compile(*program)
+    if p.flags & LOCALE:
+        if not _locale:
+            return p
+        loc = _locale.setlocale(_locale.LC_CTYPE)
+    else:
+        loc = None
+    if _MAXCACHE:
+        _cache[key] = p, loc, literals
+        try:
+            _cache.move_to_end(key)
+            while len(_cache) > _MAXCACHE:
+                _cache.popitem(last=False)
+        except KeyError:
+            pass
     return p
 
 
+def _may_match(pattern, flags, string):
+    try:
+        literals = _cache[type(pattern), pattern, flags][2]
+    except KeyError:
+        return True
+    if literals and type(string) is type(literals[0]):
+        for literal in literals:
+            if literal not in string:
+                return False
+    return True
+
+
 @functools.lru_cache(_MAXCACHE)
 def _compile_repl(repl, pattern):
     return sre_parse.parse_template(repl, pattern)
@@ -361,3 +481,97 @@ class Scanner:
                 append(action)
             i = j
         return result, string[i:]
+
+
+class RegexSet:
+    """A set of regular expressions matched against a string together.
+
+    The patterns are combined into a single program, so finding out
+    whether any of them matches, and which one matches first, takes one
+    scan of the string; listing all of them does not, see matches().
+    Each pattern is identified by its index in the sequence passed to
+    the constructor.  The literals required by the patterns are checked
+    first and shared between patterns, so patterns which cannot match
+    a string are never run against it."""
+
+    def __init__(self, patterns, flags=0):
+        from sre_constants import BRANCH, SUBPATTERN
+        self.patterns = tuple(patterns)
+        self.flags = flags
+        if not self.patterns:
+            raise ValueError('a pattern set needs at least one pattern')
+        if len({isinstance(pattern, str) for pattern in self.patterns}) > 1:
+            raise TypeError('cannot mix str and bytes patterns in a set')
+        s = sre_parse.Pattern()
+        s.flags = sre_parse.fix_flags(self.patterns[0], flags)
+        self._compiled = []
+        self._ids = [None]
+        self._required = {}
+        branches = []
+        for i, pattern in enumerate(self.patterns):
+            if not sre_compile.isstring(pattern):
+                raise TypeError('patterns must be strings')
+            p = sre_parse.parse(pattern, flags)
+            if (p.pattern.flags ^ s.flags) & sre_parse.GLOBAL_FLAGS:
+                raise ValueError('incompatible flags in pattern %r' % (
+                    pattern,))
+            self._compiled.append(_sre.compile(*sre_compile._program(p,
+                flags, pattern)))
+            for literal in sre_compile._required_literals(p, flags, pattern):
+                self._required.setdefault(literal, []).append(i)
+            gid = s.opengroup()
+            for width in p.pattern.groupwidths[1:]:
+                s.groupwidths[s.opengroup()] = width
+            self._ids.extend([i] * (s.groups - len(self._ids)))
+            item = sre_parse.SubPattern(s, [(SUBPATTERN, (gid, p.pattern.
+                flags & ~s.flags, 0, sre_parse._renumber_groups(p, s, gid)))])
+            s.closegroup(gid, item)
+            branches.append(item)
+        self._scanner = sre_compile.compile(sre_parse.SubPattern(s, [(
+            BRANCH, (None, branches))]))
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return '<%s.%s with %d patterns>' % (self.__class__.__module__,
+            self.__class__.__qualname__, len(self.patterns))
+
+    def _candidates(self, string):
+        if not self._required or type(string) is not type(self.patterns[0]):
+            return range(len(self.patterns))
+        excluded = set()
+        for literal, ids in self._required.items():
+            if literal not in string:
+                excluded.update(ids)
+        return [i for i in range(len(self.patterns)) if i not in excluded]
+
+    def search(self, string):
+        """Return the index of the pattern matching leftmost in string,
+        or None if no pattern matches.  When several patterns match at
+        the same position the lowest index is returned."""
+        candidates = self._candidates(string)
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            i = candidates[0]
+            return i if self._compiled[i].search(string) else None
+        m = self._scanner.search(string)
+        if m is None:
+            return None
+        return self._ids[m.lastindex]
+
+    def matches(self, string):
+        """Return a sorted list of the indices of all the patterns that
+        match somewhere in string.
+
+        This is not a single pass.  The regular expression engine stops
+        at the first alternative that matches, and a combined program
+        loses the literal prefix scan each pattern gets on its own, so
+        running it first costs more than it saves.  Each pattern left
+        after the required-literal check is searched on its own instead;
+        the shared literal check is what keeps the cost down when most
+        patterns cannot match.
+        """
+        return [i for i in self._candidates(string) if self._compiled[i].
+            search(string)]
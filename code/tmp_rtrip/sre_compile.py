@@ -412,6 +412,44 @@ def _get_charset_prefix(pattern):
     return charset
 
 
+def _get_required_literals(pattern):
+    literals = []
+    literal = []
+    for op, av in pattern.data:
+        if op is LITERAL:
+            literal.append(av)
+            continue
+        if op is SUBPATTERN:
+            group, add_flags, del_flags, p = av
+            if not add_flags & SRE_FLAG_IGNORECASE:
+                prefix, prefix_skip, got_all = _get_literal_prefix(p)
+                if got_all:
+                    literal.extend(prefix)
+                    continue
+                literals.extend(_get_required_literals(p))
+        elif op is MAX_REPEAT or op is MIN_REPEAT:
+            lo, hi, item = av
+            if lo:
+                literals.extend(_get_required_literals(item))
+        if literal:
+            literals.append(literal)
+            literal = []
+    if literal:
+        literals.append(literal)
+    return literals
+
+
+def _required_literals(p, flags, pattern):
+    if (flags | p.pattern.flags) & SRE_FLAG_IGNORECASE:
+        return ()
+    literals = _get_required_literals(p)
+    if isinstance(pattern, bytes):
+        literals = [bytes(literal) for literal in literals]
+    else:
+        literals = [''.join(map(chr, literal)) for literal in literals]
+    return tuple(sorted(dict.fromkeys(literals), key=len, reverse=True))
+
+
 def _compile_info(code, pattern, flags):
     lo, hi = pattern.getwidth()
     if hi > MAXCODE:
@@ -469,16 +507,26 @@ def _code(p, flags):
     return code
 
 
+def _program(p, flags, pattern=None):
+    code = _code(p, flags)
+    groupindex = p.pattern.groupdict
+    indexgroup = [None] * p.pattern.groups
+    for k, i in groupindex.items():
+        indexgroup[i] = k
+    return (pattern, flags | p.pattern.flags, code, p.pattern.groups - 1,
+        groupindex, indexgroup)
+
+
 def compile(p, flags=0):
     if isstring(p):
         pattern = p
         p = sre_parse.parse(p, flags)
     else:
         pattern = None
-    code = _code(p, flags)
-    groupindex = p.pattern.groupdict
-    indexgroup = [None] * p.pattern.groups
-    for k, i in groupindex.items():
-        indexgroup[i] = k
-    return _sre.compile(pattern, flags | p.pattern.flags, code, p.pattern.
-        groups - 1, groupindex, indexgroup)
+    return _sre.compile(*_program(p, flags, pattern))
+
+
+def _compile_prefiltered(pattern, flags):
+    p = sre_parse.parse(pattern, flags)
+    return _sre.compile(*_program(p, flags, pattern)), _required_literals(p,
+        flags, pattern)
@@ -764,6 +764,35 @@ def _parse_flags(source, state, char):
     return add_flags, del_flags
 
 
+def _renumber_groups(p, pattern, offset):
+    data = []
+    for op, av in p.data:
+        if op is SUBPATTERN:
+            group, add_flags, del_flags, item = av
+            if group is not None:
+                group += offset
+            av = group, add_flags, del_flags, _renumber_groups(item,
+                pattern, offset)
+        elif op is MAX_REPEAT or op is MIN_REPEAT:
+            lo, hi, item = av
+            av = lo, hi, _renumber_groups(item, pattern, offset)
+        elif op is BRANCH:
+            av = av[0], [_renumber_groups(item, pattern, offset) for item in
+                av[1]]
+        elif op is ASSERT or op is ASSERT_NOT:
+            av = av[0], _renumber_groups(av[1], pattern, offset)
+        elif op is GROUPREF:
+            av += offset
+        elif op is GROUPREF_EXISTS:
+            condgroup, item_yes, item_no = av
+            item_yes = _renumber_groups(item_yes, pattern, offset)
+            if item_no is not None:
+                item_no = _renumber_groups(item_no, pattern, offset)
+            av = condgroup + offset, item_yes, item_no
+        data.append((op, av))
+    return SubPattern(pattern, data)
+
+
 def fix_flags(src, flags):
     if isinstance(src, str):
         if flags & SRE_FLAG_LOCALE:
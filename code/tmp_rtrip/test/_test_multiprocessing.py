@@ -13,6 +13,7 @@ import socket
 import random
 import logging
 import struct
+import pickle
 import operator
 import weakref
 import test.support
@@ -25,6 +26,7 @@ import multiprocessing.connection
 import multiprocessing.managers
 import multiprocessing.heap
 import multiprocessing.pool
+import multiprocessing.shared_memory
 from multiprocessing import util
 try:
     from multiprocessing import reduction
@@ -1399,6 +1401,45 @@ class _TestContainers(BaseTestCase):
         self.assertIsInstance(outer[0], list)
         self.assertEqual(outer[-1][-1]['feed'], 3)
 
+    def test_proxy_batch(self):
+        d = self.dict()
+        l = self.list()
+        with multiprocessing.managers.ProxyBatch() as batch:
+            self.assertEqual(batch.call(d, '__setitem__', 'a', 1), 0)
+            batch.call(d, 'get', 'a')
+            batch.call(l, 'append', 2)
+            batch.call(l, '__len__')
+            self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.results, [None, 1, None, 1])
+        self.assertEqual(d['a'], 1)
+        self.assertEqual(l[:], [2])
+        batch.call(d, '__getitem__', 'missing')
+        batch.call(d, 'get', 'a')
+        self.assertRaises(KeyError, batch.flush)
+        self.assertIsInstance(batch.results[0], KeyError)
+        self.assertEqual(batch.results[1], 1)
+        self.assertEqual(batch.flush(), [])
+
+    def test_proxy_cache(self):
+        d = self.dict(a=1)
+        other = self.list([d])[0]
+        d._enable_cache()
+        self.assertEqual(d['a'], 1)
+        other['a'] = 2
+        self.assertEqual(d['a'], 1)
+        d._invalidate_cache()
+        self.assertEqual(d['a'], 2)
+        other['a'] = 3
+        d['b'] = 0
+        self.assertEqual(d['a'], 3)
+        d._enable_cache(max_age=0)
+        self.assertEqual(d.get('a'), 3)
+        other['a'] = 4
+        self.assertEqual(d.get('a'), 4)
+        d._disable_cache()
+        other['a'] = 5
+        self.assertEqual(d['a'], 5)
+
     def test_namespace(self):
         n = self.Namespace()
         n.name = 'Bob'
@@ -1596,6 +1637,60 @@ class _TestPool(BaseTestCase):
             self.assertEqual(next(it), i * i)
         self.assertRaises(SayWhenError, it.__next__)
 
+    def test_imap_max_inflight(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        for imap in (self.pool.imap, self.pool.imap_unordered):
+            pulled = []
+
+            def gen():
+                for i in range(20):
+                    pulled.append(i)
+                    yield i
+            it = imap(sqr, gen(), max_inflight=4)
+            self.assertEqual(len(pulled), 4)
+            first = next(it)
+            self.assertEqual(len(pulled), 5)
+            self.assertEqual(sorted([first] + list(it)), list(map(sqr,
+                range(20))))
+            pulled = []
+            it = imap(sqr, gen(), chunksize=3, max_inflight=2)
+            self.assertEqual(sorted(it), list(map(sqr, range(20))))
+        self.assertRaises(ValueError, self.pool.imap, sqr, range(3),
+            max_inflight=0)
+        it = self.pool.imap(sqr, exception_throwing_generator(10, 3),
+            max_inflight=2)
+        for i in range(3):
+            self.assertEqual(next(it), i * i)
+        self.assertRaises(SayWhenError, it.__next__)
+
+    def test_imap_max_inflight_close(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        it = self.pool.imap(sqr, itertools.count(), max_inflight=2)
+        self.assertEqual(next(it), 0)
+        it.close()
+        self.assertEqual(list(it), [1, 4])
+        self.assertNotIn(it._job, self.pool._cache)
+        it = self.pool.imap(sqr, itertools.count(), chunksize=5,
+            max_inflight=2)
+        self.assertEqual(next(it), 0)
+        it.close()
+        self.assertEqual(self.pool.map(sqr, range(3)), [0, 1, 4])
+
+    def test_imap_max_inflight_abandoned(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        p = self.Pool(2)
+        it = p.imap(sqr, itertools.count(), max_inflight=2)
+        self.assertEqual(next(it), 0)
+        job = it._job
+        del it
+        gc.collect()
+        p.close()
+        p.join()
+        self.assertNotIn(job, p._cache)
+
     def test_imap_unordered(self):
         it = self.pool.imap_unordered(sqr, list(range(1000)))
         self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
@@ -2054,6 +2149,93 @@ class _TestConnection(BaseTestCase):
             self.assertRaises(EOFError, conn.recv_bytes)
         p.join()
 
+    @classmethod
+    def _echo_oob(cls, conn):
+        for obj in iter(conn.recv_oob, SENTINEL):
+            conn.send_oob(obj)
+        conn.close()
+
+    def test_send_oob(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_oob, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+        big = latin('X') * (1024 * 1024)
+        arr = bytearray(range(256)) * 1024
+        obj = [big, arr, memoryview(arr)[10:20], 'small', big]
+        self.assertEqual(conn.send_oob(obj), None)
+        res = conn.recv_oob()
+        self.assertEqual(res[0], big)
+        self.assertIs(res[4], res[0])
+        self.assertIs(type(res[1]), bytearray)
+        self.assertEqual(res[1], arr)
+        self.assertEqual(res[2].tobytes(), arr[10:20])
+        self.assertEqual(res[3], 'small')
+        conn.send_oob(None)
+        self.assertEqual(conn.recv_oob(), None)
+        conn.send_oob(SENTINEL)
+        p.join()
+
+    @classmethod
+    def _echo_many(cls, conn):
+        for objs in iter(conn.recv_many, []):
+            conn.send_many(objs)
+        conn.close()
+
+    def test_send_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_many, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+        objs = [1, 'two', None, [3.0], latin('X') * (1024 * 1024 * 2)]
+        self.assertEqual(conn.send_many(iter(objs)), None)
+        self.assertEqual(conn.recv_many(), objs)
+        conn.send_many(['small'])
+        self.assertEqual(conn.recv_many(), ['small'])
+        conn.send_many(objs[:3])
+        self.assertEqual(conn.recv_many(), objs[:3])
+        stats = conn.stats()
+        self.assertEqual(stats.messages_sent, 9)
+        self.assertEqual(stats.messages_received, 9)
+        self.assertEqual(stats.bytes_sent, stats.bytes_received)
+        self.assertGreater(stats.bytes_sent, 1024 * 1024 * 2)
+        conn.send_many([])
+        p.join()
+
+    def test_stats(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        reader, writer = self.Pipe(duplex=False)
+        self.assertEqual(writer.stats(), (0, 0, 0, 0))
+        writer.send_bytes(latin('hello'))
+        writer.send([1, 2])
+        self.assertEqual(reader.recv_bytes(), latin('hello'))
+        self.assertEqual(reader.recv(), [1, 2])
+        self.assertEqual(writer.stats().messages_sent, 2)
+        self.assertEqual(reader.stats().messages_received, 2)
+        self.assertEqual(reader.stats().bytes_received, writer.stats().
+            bytes_sent)
+        self.assertEqual(reader.stats().bytes_sent, 0)
+
+    @unittest.skipIf(sys.platform == 'win32', 'POSIX only')
+    def test_recv_eof_after_header(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        for body, exc in [(b'', EOFError), (b'abc', OSError)]:
+            reader, writer = self.Pipe(duplex=False)
+            os.write(writer.fileno(), struct.pack('!i', 10) + body)
+            writer.close()
+            with self.assertRaises(exc) as cm:
+                reader.recv()
+            self.assertIs(type(cm.exception), exc)
+            reader.close()
+
     def test_duplex_false(self):
         reader, writer = self.Pipe(duplex=False)
         self.assertEqual(writer.send(1), None)
@@ -2542,6 +2724,88 @@ class _TestSharedCTypes(BaseTestCase):
         self.assertAlmostEqual(bar.y, 5.0)
 
 
+class _TestSharedMemory(BaseTestCase):
+    ALLOWED_TYPES = 'processes',
+
+    @classmethod
+    def _write(cls, shm, arr):
+        shm.buf[:5] = b'howdy'
+        for i in range(len(arr)):
+            arr[i] *= 2
+        shm.close()
+        arr.close()
+
+    def test_shared_memory_basics(self):
+        shm = multiprocessing.shared_memory.SharedMemory(create=True, size=10)
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        self.assertEqual(shm.size, 10)
+        self.assertEqual(len(shm.buf), 10)
+        shm.buf[:3] = b'abc'
+        other = multiprocessing.shared_memory.SharedMemory(shm.name)
+        self.assertEqual(other.size, 10)
+        self.assertEqual(bytes(other.buf[:3]), b'abc')
+        other.buf[3] = 100
+        self.assertEqual(shm.buf[3], 100)
+        other.close()
+        other.close()
+        self.assertIsNone(other.buf)
+        with self.assertRaises(FileExistsError):
+            multiprocessing.shared_memory.SharedMemory(shm.name, create=True,
+                size=10)
+        self.assertRaises(ValueError, multiprocessing.shared_memory.
+            SharedMemory)
+        self.assertRaises(ValueError, multiprocessing.shared_memory.
+            SharedMemory, create=True)
+
+    @unittest.skipIf(sys.platform == 'win32',
+        'blocks are destroyed on close on Windows')
+    def test_shared_memory_unlink(self):
+        shm = multiprocessing.shared_memory.SharedMemory(create=True, size=10)
+        shm.close()
+        shm.unlink()
+        with self.assertRaises(FileNotFoundError):
+            multiprocessing.shared_memory.SharedMemory(shm.name)
+
+    def test_shared_array(self):
+        arr = multiprocessing.shared_memory.SharedArray('d', range(10))
+        self.addCleanup(arr.unlink)
+        self.addCleanup(arr.close)
+        self.assertEqual(len(arr), 10)
+        self.assertEqual(arr.typecode, 'd')
+        self.assertEqual(arr[2:4], [2.0, 3.0])
+        arr[2:4] = [20, 30]
+        self.assertEqual(arr.tolist(), [0.0, 1.0, 20.0, 30.0] + [float(i) for
+            i in range(4, 10)])
+        self.assertEqual(arr.view.format, 'd')
+        other = multiprocessing.shared_memory.SharedArray(name=arr.name)
+        self.assertEqual(other.typecode, 'd')
+        self.assertEqual(list(other), arr.tolist())
+        other.close()
+        zeros = multiprocessing.shared_memory.SharedArray('i', 5)
+        self.assertEqual(zeros.tolist(), [0] * 5)
+        zeros.close()
+        zeros.unlink()
+        self.assertRaises(ValueError, multiprocessing.shared_memory.
+            SharedArray, 'u', 5)
+
+    def test_shared_memory_in_child(self):
+        shm = multiprocessing.shared_memory.SharedMemory(create=True, size=10)
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        arr = multiprocessing.shared_memory.SharedArray('q', range(100))
+        self.addCleanup(arr.unlink)
+        self.addCleanup(arr.close)
+        self.assertLess(len(pickle.dumps(arr)), 200)
+        p = self.Process(target=self._write, args=(shm, arr))
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(p.exitcode, 0)
+        self.assertEqual(bytes(shm.buf[:5]), b'howdy')
+        self.assertEqual(arr.tolist(), [i * 2 for i in range(100)])
+
+
 class _TestFinalize(BaseTestCase):
     ALLOWED_TYPES = 'processes',
 
@@ -3362,6 +3626,26 @@ class TestStartMethod(unittest.TestCase):
             print(err)
             self.fail('failed spawning forkserver or grandchild')
 
+    def test_forkserver_initializers(self):
+        if multiprocessing.get_start_method() != 'forkserver':
+            self.skipTest("test only relevant for 'forkserver' method")
+        name = os.path.join(os.path.dirname(__file__), 'mp_forkserver_state.py'
+            )
+        rc, out, err = test.support.script_helper.assert_python_ok(name)
+        out = out.decode()
+        err = err.decode()
+        if out.rstrip() != 'ok' or err != '':
+            print(out)
+            print(err)
+            self.fail('forkserver state not inherited by pool workers')
+
+    def test_forkserver_initializers_type(self):
+        ctx = multiprocessing.get_context()
+        self.assertRaises(TypeError, ctx.set_forkserver_initializers, [
+            'build_state'])
+        self.assertRaises(ValueError, ctx.set_forkserver_initializers, [
+            lambda : None])
+
 
 @unittest.skipIf(sys.platform == 'win32',
     "test semantics don't make sense on Windows")
@@ -3398,6 +3682,33 @@ class TestSemaphoreTracker(unittest.TestCase):
         self.assertRegex(err, expected)
         self.assertRegex(err, 'semaphore_tracker: %r: \\[Errno' % name1)
 
+    def test_shared_memory_tracker(self):
+        import subprocess
+        cmd = """if 1:
+            import os, time
+            from multiprocessing import shared_memory
+            shm = shared_memory.SharedMemory(create=True, size=10)
+            os.write(%d, shm.name.encode("ascii") + b"\\n")
+            time.sleep(10)
+        """
+        r, w = os.pipe()
+        p = subprocess.Popen([sys.executable, '-c', cmd % w], pass_fds=[w],
+            stderr=subprocess.PIPE)
+        os.close(w)
+        with open(r, 'rb', closefd=True) as f:
+            name = f.readline().rstrip().decode('ascii')
+        p.terminate()
+        p.wait()
+        time.sleep(2.0)
+        with self.assertRaises(FileNotFoundError):
+            multiprocessing.shared_memory.SharedMemory(name)
+        err = p.stderr.read().decode('utf-8')
+        p.stderr.close()
+        expected = (
+            'semaphore_tracker: There appear to be 1 leaked shared memory blocks'
+            )
+        self.assertRegex(err, expected)
+
 
 class TestSimpleQueue(unittest.TestCase):
 
@@ -881,3 +881,182 @@ class BarrierTests(BaseTestCase):
         b = self.barriertype(1)
         b.wait()
         b.wait()
+
+
+class RWLockTests(BaseTestCase):
+    """
+    Tests for reader-writer locks.
+    """
+
+    def test_concurrent_readers(self):
+        lock = self.rwlocktype()
+        N = 5
+        inside = []
+
+        def f():
+            with lock.reader:
+                inside.append(None)
+                while len(inside) < N:
+                    _wait()
+        b = Bunch(f, N)
+        b.wait_for_finished()
+        self.assertEqual(lock.stats()['read_acquires'], N)
+        self.assertEqual(lock.stats()['readers'], 0)
+
+    def test_writer_excludes(self):
+        lock = self.rwlocktype()
+        phase = []
+        lock.acquire_write()
+
+        def f():
+            with lock.reader:
+                phase.append('read')
+            with lock.writer:
+                phase.append('write')
+        b = Bunch(f, 2)
+        b.wait_for_started()
+        _wait()
+        self.assertEqual(phase, [])
+        lock.release_write()
+        b.wait_for_finished()
+        self.assertEqual(sorted(phase), ['read', 'read', 'write', 'write'])
+        stats = lock.stats()
+        self.assertEqual(stats['write_acquires'], 3)
+        self.assertGreaterEqual(stats['read_contended'], 1)
+        self.assertGreater(stats['read_wait_time'], 0.0)
+
+    def test_nonblocking_and_timeout(self):
+        lock = self.rwlocktype()
+        self.assertTrue(lock.acquire_read(False))
+        self.assertTrue(lock.acquire_read(timeout=0.01))
+        self.assertFalse(lock.acquire_write(False))
+        t1 = time.monotonic()
+        self.assertFalse(lock.acquire_write(timeout=0.1))
+        self.assertTimeout(time.monotonic() - t1, 0.1)
+        lock.release_read()
+        lock.release_read()
+        self.assertTrue(lock.acquire_write(timeout=0.01))
+        self.assertFalse(lock.acquire_read(False))
+        self.assertFalse(lock.acquire_read(timeout=0.01))
+        lock.release_write()
+        self.assertRaises(ValueError, lock.acquire_read, False, 1)
+        self.assertRaises(ValueError, lock.acquire_write, False, 1)
+
+    def test_release_unacquired(self):
+        lock = self.rwlocktype()
+        self.assertRaises(RuntimeError, lock.release_read)
+        self.assertRaises(RuntimeError, lock.release_write)
+        lock.acquire_write()
+        errors = []
+
+        def f():
+            try:
+                lock.release_write()
+            except RuntimeError as e:
+                errors.append(e)
+        Bunch(f, 1).wait_for_finished()
+        self.assertEqual(len(errors), 1)
+        lock.release_write()
+
+    def test_reader_preference(self):
+        lock = self.rwlocktype()
+        lock.acquire_read()
+
+        def f():
+            with lock.writer:
+                pass
+        b = Bunch(f, 1)
+        while not lock.stats()['waiting_writers']:
+            _wait()
+        self.assertTrue(lock.acquire_read(False))
+        lock.release_read()
+        lock.release_read()
+        b.wait_for_finished()
+
+    def test_writer_preference(self):
+        lock = self.rwlocktype(prefer_writers=True)
+        lock.acquire_read()
+
+        def f():
+            with lock.writer:
+                pass
+        b = Bunch(f, 1)
+        while not lock.stats()['waiting_writers']:
+            _wait()
+        self.assertFalse(lock.acquire_read(False))
+        lock.release_read()
+        b.wait_for_finished()
+        self.assertTrue(lock.acquire_read(False))
+        lock.release_read()
+
+    def test_writer_timeout_admits_readers(self):
+        lock = self.rwlocktype(prefer_writers=True)
+        lock.acquire_read()
+        results = []
+        Bunch(lambda : results.append(lock.acquire_write(timeout=0.05)), 1
+            ).wait_for_finished()
+        self.assertEqual(results, [False])
+        self.assertTrue(lock.acquire_read(False))
+        lock.release_read()
+        lock.release_read()
+        self.assertEqual(lock.stats()['write_contended'], 1)
+
+
+class ShardedLockTests(BaseTestCase):
+    """
+    Tests for sharded locks.
+    """
+
+    def test_constructor(self):
+        self.assertRaises(ValueError, self.shardedlocktype, 0)
+        locks = self.shardedlocktype(4)
+        self.assertEqual(len(locks), 4)
+        self.assertIs(locks['a'], locks['a'])
+        self.assertIs(locks[1], locks[5])
+        self.assertIsNot(locks[1], locks[2])
+
+    def test_with(self):
+        locks = self.shardedlocktype()
+        with locks['key']:
+            self.assertFalse(locks['key'].acquire(False))
+        self.assertTrue(locks['key'].acquire(False))
+        locks['key'].release()
+        stats = locks.stats()
+        self.assertEqual(stats['acquires'], 2)
+        self.assertEqual(stats['contended'], 0)
+        self.assertEqual(sum(stats['shard_acquires']), 2)
+
+    def test_contention(self):
+        locks = self.shardedlocktype(2)
+        locks[0].acquire()
+
+        def f():
+            with locks[0]:
+                pass
+            with locks[1]:
+                pass
+        b = Bunch(f, 1)
+        b.wait_for_started()
+        _wait()
+        locks[0].release()
+        b.wait_for_finished()
+        stats = locks.stats()
+        self.assertEqual(stats['shard_acquires'], [2, 1])
+        self.assertEqual(stats['shard_contended'], [1, 0])
+        self.assertGreater(stats['wait_time'], 0.0)
+
+    def test_timeout(self):
+        locks = self.shardedlocktype()
+        locks['a'].acquire()
+        results = []
+        Bunch(lambda : results.append(locks['a'].acquire(timeout=0.01)), 1
+            ).wait_for_finished()
+        self.assertEqual(results, [False])
+        locks['a'].release()
+
+    def test_rlock_factory(self):
+        locks = self.shardedlocktype(lock_factory=threading.RLock)
+        with locks['a']:
+            with locks['a']:
+                pass
+        self.assertEqual(locks.stats()['acquires'], 2)
@@ -0,0 +1,26 @@
+import multiprocessing
+import os
+STATE = {}
+
+
+def build_state():
+    STATE['pid'] = os.getpid()
+    STATE['table'] = [(i * i) for i in range(1000)]
+
+
+def lookup(i):
+    return STATE.get('pid'), os.getpid(), STATE['table'][i]
+
+
+if __name__ == '__main__':
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_initializers([build_state])
+    with ctx.Pool(2, maxtasksperchild=1) as pool:
+        results = pool.map(lookup, range(6), chunksize=1)
+    assert [r[2] for r in results] == [(i * i) for i in range(6)]
+    builders = {r[0] for r in results}
+    workers = {r[1] for r in results}
+    assert len(builders) == 1 and None not in builders, builders
+    assert os.getpid() not in builders
+    assert len(workers) == 6 and not builders & workers, workers
+    print('ok')
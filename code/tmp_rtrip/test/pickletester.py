@@ -1201,7 +1201,7 @@ class AbstractPickleTests(unittest.TestCase):
                 self.assertTrue(pickled.startswith(proto_header))
             else:
                 self.assertEqual(count_opcode(pickle.PROTO, pickled), 0)
-        oob = protocols[-1] + 1
+        oob = max(protocols[-1], pickle._BUFFER_PROTOCOL) + 1
         build_none = pickle.NONE + pickle.STOP
         badpickle = pickle.PROTO + bytes([oob]) + build_none
         try:
@@ -378,10 +378,10 @@ class BaseEventLoopTests(test_utils.TestCase):
             add_cancel_count, 0)
         not_cancelled_count += add_not_cancel_count
         for x in range(add_not_cancel_count):
-            self.loop.call_later(3600, cb)
+            self.loop.call_later(0.5, cb)
         cancelled_count += add_cancel_count
         for x in range(add_cancel_count):
-            h = self.loop.call_later(3600, cb)
+            h = self.loop.call_later(0.5, cb)
             h.cancel()
         self.assertEqual(len(self.loop._scheduled), cancelled_count +
             not_cancelled_count)
@@ -390,6 +390,63 @@ class BaseEventLoopTests(test_utils.TestCase):
         self.assertTrue(all([(not x._cancelled) for x in self.loop._scheduled])
             )
 
+    def test__run_once_timer_wheel(self):
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        calls = []
+        near = self.loop.call_later(0.1, calls.append, 'near')
+        far = [self.loop.call_later(3600 + x, calls.append, x) for x in
+            range(10)]
+        self.assertEqual(self.loop._scheduled, [near])
+        self.assertEqual(self.loop._timer_wheel_count, 10)
+        far[0].cancel()
+        self.assertEqual(self.loop._timer_wheel_count, 9)
+        self.assertFalse(far[0]._scheduled)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+        for h in far[1:]:
+            h.cancel()
+        self.assertEqual(self.loop._timer_wheel, {})
+        h = self.loop.call_later(10, calls.append, 'later')
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(0 <= t <= 0.1, t)
+        wakeup = self.loop._next_timer_wheel_wakeup()
+        self.assertTrue(8 < wakeup - self.loop.time() < 10)
+        self.loop._advance_timer_wheel(self.loop.time() + 10)
+        self.assertIn(h, self.loop._scheduled)
+        self.assertEqual(self.loop._timer_wheel_count, 0)
+
+    def test_cancel_timer_wheel_handle_after_close(self):
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        h = self.loop.call_later(3600, lambda : None)
+        self.assertIsNotNone(h._wheel_key)
+        self.loop.close()
+        h.cancel()
+        self.assertTrue(h._cancelled)
+        self.assertFalse(h._scheduled)
+
+    def test_stats(self):
+        self.loop._process_events = mock.Mock()
+        self.assertIsNone(self.loop.get_stats())
+        self.loop.set_stats_enabled(True)
+        self.loop.call_soon(lambda : None)
+        self.loop.call_soon(time.sleep, 0.002)
+        self.loop.call_later(3600, lambda : None)
+        self.loop._run_once()
+        stats = self.loop.get_stats()
+        self.assertEqual(stats.iterations, 1)
+        self.assertEqual(stats.max_ready, 2)
+        self.assertEqual(stats.callbacks, 2)
+        self.assertEqual(sum(stats.callback_histogram), 2)
+        self.assertEqual(len(stats.callback_histogram), len(base_events.
+            CALLBACK_HISTOGRAM_BOUNDS) + 1)
+        self.assertGreaterEqual(stats.callback_histogram[1], 1)
+        self.assertGreater(stats.max_iteration_time, 0)
+        self.assertEqual(stats.timers, 1)
+        self.loop.set_stats_enabled(False)
+        self.assertIsNone(self.loop.get_stats())
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError, self.loop.run_until_complete, 'blah')
 
@@ -720,6 +777,96 @@ class BaseEventLoopTests(test_utils.TestCase):
         self.loop._selector.select.assert_called_once_with(0)
 
 
+class ResolverCacheTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = self.new_test_loop()
+        self.lookups = []
+        self.loop._getaddrinfo = self.resolve
+        self.loop.set_resolver_cache(10, maxsize=2)
+
+    def resolve(self, host, port, family, type, proto, flags):
+        self.lookups.append(host)
+        fut = self.loop.create_future()
+        if host == 'bad':
+            self.loop.call_soon(fut.set_exception, socket.gaierror())
+        else:
+            self.loop.call_soon(fut.set_result, [(socket.AF_INET, socket.
+                SOCK_STREAM, socket.IPPROTO_TCP, '', (host, port))])
+        return fut
+
+    def getaddrinfo(self, host, port=80):
+        return self.loop.run_until_complete(self.loop.getaddrinfo(host, port))
+
+    def test_disabled_by_default(self):
+        loop = base_events.BaseEventLoop()
+        self.addCleanup(loop.close)
+        self.assertIsNone(loop._resolver_cache)
+        self.assertIsNone(loop.get_resolver_stats())
+
+    def test_hit_and_expiry(self):
+        first = self.getaddrinfo('example.com')
+        second = self.getaddrinfo('example.com')
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.lookups, ['example.com'])
+        self.getaddrinfo('example.com', 443)
+        self.assertEqual(len(self.lookups), 2)
+        self.loop.advance_time(11)
+        self.getaddrinfo('example.com')
+        self.assertEqual(len(self.lookups), 3)
+        self.assertEqual(self.loop.get_resolver_stats(), base_events.
+            ResolverStats(hits=1, misses=3, coalesced=0, errors=0, entries=2))
+
+    def test_concurrent_lookups_coalesced(self):
+        waiters = [self.loop.getaddrinfo('example.com', 80) for _ in range(3)]
+        waiters[0].cancel()
+        self.loop.run_until_complete(asyncio.gather(*waiters[1:], loop=
+            self.loop))
+        self.assertEqual(self.lookups, ['example.com'])
+        self.assertEqual(waiters[1].result(), waiters[2].result())
+        stats = self.loop.get_resolver_stats()
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.coalesced, 2)
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                self.getaddrinfo('bad')
+        self.assertEqual(self.lookups, ['bad', 'bad'])
+        stats = self.loop.get_resolver_stats()
+        self.assertEqual(stats.errors, 2)
+        self.assertEqual(stats.entries, 0)
+
+    def test_maxsize(self):
+        self.getaddrinfo('a')
+        self.getaddrinfo('b')
+        self.getaddrinfo('a')
+        self.getaddrinfo('c')
+        self.assertEqual(self.loop.get_resolver_stats().entries, 2)
+        self.getaddrinfo('a')
+        self.getaddrinfo('b')
+        self.assertEqual(self.lookups, ['a', 'b', 'c', 'b'])
+
+    def test_create_connection_uses_cache(self):
+        self.loop.sock_connect = mock.Mock(side_effect=ConnectionRefusedError)
+        with mock.patch('asyncio.base_events.socket.socket'):
+            for _ in range(2):
+                coro = self.loop.create_connection(MyProto, 'example.com', 80)
+                self.assertRaises(OSError, self.loop.run_until_complete, coro)
+        self.assertEqual(self.lookups, ['example.com'])
+
+    def test_set_resolver_cache(self):
+        self.assertRaises(ValueError, self.loop.set_resolver_cache, -1)
+        self.assertRaises(ValueError, self.loop.set_resolver_cache, 1, 0)
+        self.loop.set_resolver_cache(None)
+        self.assertIsNone(self.loop.get_resolver_stats())
+        self.getaddrinfo('example.com')
+        self.getaddrinfo('example.com')
+        self.assertEqual(len(self.lookups), 2)
+
+
 class MyProto(asyncio.Protocol):
     done = None
 
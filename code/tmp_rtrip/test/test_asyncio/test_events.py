@@ -2231,6 +2231,27 @@ class ProtocolsAbsTests(unittest.TestCase):
         self.assertIsNone(sp.pipe_connection_lost(1, f))
         self.assertIsNone(sp.process_exited())
 
+    def test_buffered_protocol_data_received(self):
+        received = []
+
+        class Proto(asyncio.BufferedProtocol):
+
+            def __init__(self):
+                self.buf = bytearray(3)
+
+            def get_buffer(self, sizehint):
+                return self.buf
+
+            def buffer_updated(self, nbytes):
+                received.append(bytes(self.buf[:nbytes]))
+        p = Proto()
+        p.data_received(b'abcdefgh')
+        self.assertEqual(received, [b'abc', b'def', b'gh'])
+        bp = asyncio.BufferedProtocol()
+        self.assertRaises(NotImplementedError, bp.get_buffer, -1)
+        self.assertRaises(NotImplementedError, bp.buffer_updated, 1)
+        self.assertIsNone(bp.eof_received())
+
 
 class PolicyTests(unittest.TestCase):
 
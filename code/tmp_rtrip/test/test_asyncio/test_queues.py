@@ -1,4 +1,5 @@
 """Tests for queues.py"""
+import collections
 import unittest
 from unittest import mock
 import asyncio
@@ -446,6 +447,141 @@ class QueuePutTests(_QueueTestBase):
             t3, loop=self.loop))
 
 
+class QueueBatchTests(_QueueTestBase):
+
+    def test_nonblocking_batch(self):
+        q = asyncio.Queue(loop=self.loop)
+        q.put_many_nowait(range(5))
+        self.assertEqual(q.qsize(), 5)
+        self.assertEqual([0, 1, 2], q.get_batch_nowait(3))
+        self.assertEqual([3, 4], q.get_batch_nowait())
+        self.assertRaises(asyncio.QueueEmpty, q.get_batch_nowait)
+        self.assertRaises(ValueError, q.get_batch_nowait, 0)
+
+    def test_put_many_nowait_full(self):
+        q = asyncio.Queue(maxsize=3, loop=self.loop)
+        q.put_nowait(0)
+        q.put_nowait(1)
+        self.assertRaises(asyncio.QueueFull, q.put_many_nowait, [2, 3])
+        self.assertEqual(q.qsize(), 2)
+        q.put_many_nowait([2])
+        self.assertTrue(q.full())
+
+    def test_get_batch_wakes_once(self):
+        q = asyncio.Queue(loop=self.loop)
+        getter = asyncio.Task(q.get_batch(), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(q._getters), 1)
+        q.put_many_nowait([1, 2, 3])
+        self.assertEqual([1, 2, 3], self.loop.run_until_complete(getter))
+        self.assertTrue(q.empty())
+
+    def test_get_batch_shared_between_getters(self):
+        q = asyncio.Queue(loop=self.loop)
+        getters = [asyncio.Task(q.get_batch(2), loop=self.loop) for _ in
+            range(3)]
+        test_utils.run_briefly(self.loop)
+        q.put_many_nowait(range(5))
+        self.loop.run_until_complete(asyncio.wait(getters, loop=self.loop))
+        self.assertEqual([[0, 1], [2, 3], [4]], [t.result() for t in getters])
+
+    def test_get_batch_timeout(self):
+
+        def gen():
+            when = yield
+            self.assertAlmostEqual(0.1, when)
+            yield 0.1
+        loop = self.new_test_loop(gen)
+        q = asyncio.Queue(loop=loop)
+        self.assertEqual([], loop.run_until_complete(q.get_batch(timeout=0.1))
+            )
+        self.assertAlmostEqual(0.1, loop.time())
+        self.assertEqual(q.stats().getters, 0)
+        q.put_nowait(1)
+        self.assertEqual([1], loop.run_until_complete(q.get_batch(timeout=0)))
+
+    def test_get_batch_timeout_polling(self):
+
+        def gen():
+            when = yield
+            for _ in range(10):
+                when = yield 0.1
+        loop = self.new_test_loop(gen)
+        q = asyncio.Queue(loop=loop)
+        for _ in range(10):
+            self.assertEqual([], loop.run_until_complete(q.get_batch(
+                timeout=0.1)))
+            self.assertEqual(len(q._getters), 0)
+
+    def test_get_batch_cancelled(self):
+        q = asyncio.Queue(loop=self.loop)
+        getter = asyncio.Task(q.get_batch(), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        getter.cancel()
+        self.assertRaises(asyncio.CancelledError, self.loop.
+            run_until_complete, getter)
+        self.assertEqual(len(q._getters), 0)
+        q.put_many_nowait([1, 2])
+        self.assertEqual([1, 2], self.loop.run_until_complete(q.get_batch()))
+
+    def test_many_getters_woken_without_removal(self):
+        removed = []
+
+
+        class Getters(collections.deque):
+
+            def remove(self, value):
+                removed.append(value)
+                super().remove(value)
+        q = asyncio.Queue(loop=self.loop)
+        q._getters = Getters()
+        getters = [asyncio.Task(q.get(), loop=self.loop) for _ in range(
+            2000)]
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(q._getters), 2000)
+        q.put_many_nowait(range(2000))
+        self.loop.run_until_complete(asyncio.wait(getters, loop=self.loop))
+        self.assertEqual(removed, [])
+        self.assertEqual(list(range(2000)), [t.result() for t in getters])
+        self.assertEqual(len(q._getters), 0)
+
+    def test_put_many_bounded(self):
+        q = asyncio.Queue(maxsize=2, loop=self.loop)
+        received = []
+
+        @asyncio.coroutine
+        def consumer():
+            while len(received) < 7:
+                items = yield from q.get_batch()
+                self.assertLessEqual(len(items), 2)
+                received.extend(items)
+        putter = asyncio.Task(q.put_many(range(7)), loop=self.loop)
+        self.loop.run_until_complete(asyncio.gather(putter, consumer(),
+            loop=self.loop))
+        self.assertEqual(list(range(7)), received)
+
+    def test_stats(self):
+
+        def gen():
+            when = yield
+            self.assertAlmostEqual(0.1, when)
+            yield 0.1
+        loop = self.new_test_loop(gen)
+        q = asyncio.Queue(loop=loop)
+        self.assertEqual(q.stats(), asyncio.queues.QueueStats(0, 0, 0, 0,
+            0, 0, 0.0, 0.0))
+        loop.call_later(0.1, q.put_many_nowait, [1, 2, 3])
+        loop.run_until_complete(q.get())
+        q.get_batch_nowait(1)
+        stats = q.stats()
+        self.assertEqual(stats.size, 1)
+        self.assertEqual(stats.peak_size, 3)
+        self.assertEqual(stats.puts, 3)
+        self.assertEqual(stats.gets, 2)
+        self.assertAlmostEqual(stats.get_wait_time, 0.1)
+        self.assertEqual(stats.put_wait_time, 0.0)
+
+
 class LifoQueueTests(_QueueTestBase):
 
     def test_order(self):
@@ -501,6 +637,15 @@ class _QueueJoinTestMixin:
             q.put_nowait(0)
         self.loop.run_until_complete(asyncio.wait(tasks, loop=self.loop))
 
+    def test_task_done_batch(self):
+        q = self.q_class(loop=self.loop)
+        q.put_many_nowait([3, 1, 2])
+        items = q.get_batch_nowait()
+        self.assertEqual(sorted(items), [1, 2, 3])
+        for _ in items:
+            q.task_done()
+        self.loop.run_until_complete(q.join())
+
     def test_join_empty_queue(self):
         q = self.q_class(loop=self.loop)
 
@@ -1,4 +1,5 @@
 """Tests for selector_events.py"""
+import collections
 import errno
 import socket
 import unittest
@@ -8,6 +9,7 @@ try:
 except ImportError:
     ssl = None
 import asyncio
+from asyncio import selector_events
 from asyncio import selectors
 from asyncio import test_utils
 from asyncio.selector_events import BaseSelectorEventLoop
@@ -33,6 +35,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+def list_to_deque(l=()):
+    return collections.deque(memoryview(data) for data in l)
+
+
 def close_transport(transport):
     if transport._sock is None:
         return
@@ -794,17 +800,17 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer_append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer_append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']), transport.
+        self.assertEqual(list_to_deque([b'data1', b'data2']), transport.
             _buffer)
 
     def test_write_partial(self):
@@ -813,7 +819,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport = self.socket_transport()
         transport.write(data)
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -821,7 +827,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport = self.socket_transport()
         transport.write(data)
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))
 
     def test_write_partial_memoryview(self):
@@ -830,7 +836,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport = self.socket_transport()
         transport.write(data)
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -839,7 +845,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport = self.socket_transport()
         transport.write(data)
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -847,7 +853,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport = self.socket_transport()
         transport.write(data)
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -884,7 +890,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         data = b'data'
         self.sock.send.return_value = len(data)
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -895,7 +901,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = len(data)
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -911,36 +917,40 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         data = b'data'
         self.sock.send.return_value = 2
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg.side_effect = BlockingIOError
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer_append(b'data1')
+        transport._buffer_append(b'data2')
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data1', b'data2']), transport._buffer
+            )
+        self.assertEqual(transport.get_write_buffer_size(), 10)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer_append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(err,
             'Fatal write error on socket transport')
@@ -959,7 +969,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, list_to_deque([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -968,6 +978,80 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.shutdown.assert_called_with(socket.SHUT_WR)
         tr.close()
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg(self):
+        data1 = b'data1'
+        data2 = bytearray(b'data2')
+        self.sock.sendmsg.return_value = 10
+        transport = self.socket_transport()
+        transport.writelines([data1, b'', data2])
+        self.assertFalse(self.sock.send.called)
+        buffers = self.sock.sendmsg.call_args[0][0]
+        self.assertEqual(buffers, [data1, data2])
+        self.assertIs(buffers[0].obj, data1)
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_partial(self):
+        data = bytearray(b'data2')
+        self.sock.sendmsg.return_value = 7
+        transport = self.socket_transport()
+        transport.writelines([b'data1', data, b'data3'])
+        self.loop.assert_writer(7, transport._write_ready)
+        data[:] = b'xxxxx'
+        self.assertEqual(list_to_deque([b'ta2', b'data3']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+        self.sock.sendmsg.return_value = 8
+        transport._write_ready()
+        self.assertEqual(b''.join(self.sock.sendmsg.call_args[0][0]),
+            b'ta2data3')
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertFalse(self.loop.writers)
+
+    @mock.patch('asyncio.selector_events._HAS_SENDMSG', False)
+    def test_writelines_no_sendmsg(self):
+        self.sock.send.return_value = 4
+        transport = self.socket_transport()
+        transport.writelines([b'da', b'ta', b'more'])
+        self.sock.send.assert_called_with(b'datamore')
+        self.assertEqual(list_to_deque([b'more']), transport._buffer)
+
+    def test_writelines_errors(self):
+        transport = self.socket_transport()
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
+    def test_writelines_pause_protocol(self):
+        self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg.side_effect = BlockingIOError
+        transport = self.socket_transport()
+        transport.set_write_buffer_limits(high=8)
+        transport.writelines([b'data1', b'data2'])
+        self.protocol.pause_writing.assert_called_with()
+
+    def test_write_buffer_stats(self):
+        self.sock.send.return_value = 2
+        transport = self.socket_transport()
+        transport.write(b'data')
+        transport.write(b'data')
+        self.assertEqual(transport.get_write_buffer_stats(), selector_events
+            .WriteBufferStats(size=6, buffers=2, peak_size=6, writes=2,
+            sends=1, bytes_sent=2))
+        self.sock.send.return_value = 2
+        self.sock.sendmsg.return_value = 4
+        transport._write_ready()
+        transport._write_ready()
+        stats = transport.get_write_buffer_stats()
+        self.assertEqual(stats.size, 0)
+        self.assertEqual(stats.buffers, 0)
+        self.assertEqual(stats.peak_size, 6)
+        self.assertEqual(stats.sends, 3)
+        self.assertEqual(stats.bytes_sent, 8)
+
     @mock.patch('asyncio.base_events.logger')
     def test_transport_close_remove_writer(self, m_log):
         remove_writer = self.loop._remove_writer = mock.Mock()
@@ -976,6 +1060,91 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         remove_writer.assert_called_with(self.sock_fd)
 
 
+
+class SelectorSocketTransportBufferedProtocolTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = self.new_test_loop()
+        self.protocol = test_utils.make_test_protocol(asyncio.BufferedProtocol)
+        self.buf = bytearray(50)
+        self.protocol.get_buffer.return_value = self.buf
+        self.sock = mock.Mock(socket.socket)
+        self.sock_fd = self.sock.fileno.return_value = 7
+
+    def socket_transport(self):
+        transport = _SelectorSocketTransport(self.loop, self.sock, self.
+            protocol)
+        self.addCleanup(close_transport, transport)
+        return transport
+
+    def test_read_ready(self):
+        transport = self.socket_transport()
+
+        def recv_into(buf):
+            buf[:4] = b'data'
+            return 4
+        self.sock.recv_into.side_effect = recv_into
+        transport._read_ready()
+        self.protocol.get_buffer.assert_called_with(-1)
+        self.protocol.buffer_updated.assert_called_with(4)
+        self.assertEqual(self.buf[:4], b'data')
+        self.assertFalse(self.sock.recv.called)
+
+    def test_read_ready_eof(self):
+        transport = self.socket_transport()
+        transport.close = mock.Mock()
+        self.sock.recv_into.return_value = 0
+        transport._read_ready()
+        self.protocol.eof_received.assert_called_with()
+        self.assertFalse(self.protocol.buffer_updated.called)
+        transport.close.assert_called_with()
+
+    def test_read_ready_tryagain(self):
+        self.sock.recv_into.side_effect = BlockingIOError
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        self.assertFalse(transport._fatal_error.called)
+        self.assertFalse(self.protocol.buffer_updated.called)
+
+    def test_get_buffer_error(self):
+        err = self.protocol.get_buffer.side_effect = LookupError()
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        transport._fatal_error.assert_called_with(err,
+            'Fatal error: protocol.get_buffer() call failed.')
+        self.assertFalse(self.sock.recv_into.called)
+
+    def test_get_buffer_empty(self):
+        self.protocol.get_buffer.return_value = bytearray()
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        self.assertIsInstance(transport._fatal_error.call_args[0][0],
+            RuntimeError)
+        self.assertFalse(self.sock.recv_into.called)
+
+    def test_buffer_updated_error(self):
+        err = self.protocol.buffer_updated.side_effect = LookupError()
+        self.sock.recv_into.return_value = 10
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        transport._fatal_error.assert_called_with(err,
+            'Fatal error: protocol.buffer_updated() call failed.')
+
+    def test_set_protocol(self):
+        transport = self.socket_transport()
+        protocol = test_utils.make_test_protocol(asyncio.Protocol)
+        transport.set_protocol(protocol)
+        self.sock.recv.return_value = b'data'
+        transport._read_ready()
+        protocol.data_received.assert_called_with(b'data')
+        self.assertFalse(self.sock.recv_into.called)
+
+
 @unittest.skipIf(ssl is None, 'No ssl module')
 class SelectorSslTransportTests(test_utils.TestCase):
 
@@ -434,6 +434,99 @@ class StreamReaderTests(test_utils.TestCase):
         self.assertRaises(ValueError, self.loop.run_until_complete, stream.
             readexactly(2))
 
+    def test_readexactly_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'header')
+        buf = stream._buffer
+        read_task = asyncio.Task(stream.readexactly_view(9), loop=self.loop)
+        self.loop.call_soon(stream.feed_data, b'bodytail')
+        view = self.loop.run_until_complete(read_task)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view, b'headerbod')
+        self.assertIs(view.obj, buf)
+        self.assertEqual(b'ytail', stream._buffer)
+        stream.feed_data(b'more')
+        self.assertEqual(view, b'headerbod')
+        view = self.loop.run_until_complete(stream.readexactly_view(0))
+        self.assertEqual(view, b'')
+        self.assertEqual(b'ytailmore', stream._buffer)
+
+    def test_readexactly_view_long_tail(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'ab' + self.DATA)
+        view = self.loop.run_until_complete(stream.readexactly_view(2))
+        self.assertEqual(view, b'ab')
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readexactly_view_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readexactly_view(100))
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readuntil_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nli')
+        view = self.loop.run_until_complete(stream.readuntil_view())
+        self.assertEqual(view, b'line1\n')
+        self.assertEqual(b'li', stream._buffer)
+        stream.feed_data(b'ne2\n')
+        view = self.loop.run_until_complete(stream.readuntil_view())
+        self.assertEqual(view, b'line2\n')
+        self.assertEqual(b'', stream._buffer)
+
+    def test_iter_chunks(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        chunks = stream.iter_chunks(4)
+        self.assertIs(chunks.__aiter__(), chunks)
+        read_task = asyncio.Task(chunks.__anext__(), loop=self.loop)
+        self.loop.call_soon(stream.feed_data, b'abcdef')
+        self.assertEqual(b'abcd', self.loop.run_until_complete(read_task))
+        stream.feed_data(b'gh')
+        stream.feed_eof()
+        self.assertEqual(b'efgh', self.loop.run_until_complete(chunks.
+            __anext__()))
+        self.assertRaises(StopAsyncIteration, self.loop.run_until_complete,
+            chunks.__anext__())
+        self.assertRaises(ValueError, stream.iter_chunks, 0)
+
+    def test_iter_chunks_lines(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        chunks = stream.iter_chunks(12, lines=True)
+        stream.feed_data(b'line1\n\nline3\nline4')
+        lines = self.loop.run_until_complete(chunks.__anext__())
+        self.assertEqual([b'line1', b''], lines)
+        self.assertEqual(b'line3\nline4', stream._buffer)
+        self.assertEqual([b'line3'], self.loop.run_until_complete(chunks.
+            __anext__()))
+        read_task = asyncio.Task(chunks.__anext__(), loop=self.loop)
+        self.loop.call_soon(stream.feed_data, b'end\n')
+        self.assertEqual([b'line4end'], self.loop.run_until_complete(
+            read_task))
+        stream.feed_data(b'a long line\nlast')
+        stream.feed_eof()
+        self.assertEqual([b'a long line'], self.loop.run_until_complete(
+            stream.iter_chunks(4, lines=True).__anext__()))
+        self.assertEqual([b'last'], self.loop.run_until_complete(chunks.
+            __anext__()))
+        self.assertRaises(StopAsyncIteration, self.loop.run_until_complete,
+            chunks.__anext__())
+
+    def test_iter_chunks_lines_limit(self):
+        stream = asyncio.StreamReader(limit=4, loop=self.loop)
+        stream.feed_data(b'toolong\n')
+        chunks = stream.iter_chunks(lines=True)
+        with self.assertRaises(asyncio.LimitOverrunError):
+            self.loop.run_until_complete(chunks.__anext__())
+        self.assertEqual(b'toolong\n', stream._buffer)
+        chunks = stream.iter_chunks(16, lines=True)
+        stream.feed_data(b'ab\n')
+        self.assertEqual([b'toolong', b'ab'], self.loop.run_until_complete(
+            chunks.__anext__()))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
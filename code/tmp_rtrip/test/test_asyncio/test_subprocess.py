@@ -99,6 +99,79 @@ class SubprocessMixin:
         self.assertEqual(exitcode, 0)
         self.assertEqual(stdout, b'some data')
 
+    def test_iter_chunks(self):
+        code = 'import sys; sys.stdout.buffer.write(b"x\\n" * 100000)'
+        args = [sys.executable, '-c', code]
+
+        @asyncio.coroutine
+        def run():
+            proc = yield from asyncio.create_subprocess_exec(*args, stdout=
+                subprocess.PIPE, loop=self.loop)
+            lines = []
+            chunks = proc.stdout.iter_chunks(4096, lines=True)
+            while True:
+                try:
+                    chunk = yield from chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+                self.assertLessEqual(len(chunk), 2048)
+                lines.extend(chunk)
+            exitcode = yield from proc.wait()
+            return exitcode, lines
+        task = asyncio.wait_for(run(), 60.0, loop=self.loop)
+        exitcode, lines = self.loop.run_until_complete(task)
+        self.assertEqual(exitcode, 0)
+        self.assertEqual(lines, [b'x'] * 100000)
+
+    def test_pipeline(self):
+        upper = [sys.executable, '-c', ';'.join(('import sys',
+            'data = sys.stdin.buffer.read()',
+            'sys.stdout.buffer.write(data.upper())'))]
+
+        @asyncio.coroutine
+        def run(data):
+            procs = yield from asyncio.create_subprocess_pipeline(
+                PROGRAM_CAT, upper, PROGRAM_CAT, stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, loop=self.loop)
+            first, last = procs[0], procs[-1]
+            self.assertIsNone(first.stdout)
+            self.assertIsNone(last.stdin)
+            first.stdin.write(data)
+            first.stdin.close()
+            stdout = yield from last.stdout.read()
+            exitcodes = []
+            for proc in procs:
+                exitcode = yield from proc.wait()
+                exitcodes.append(exitcode)
+            return exitcodes, stdout
+        task = asyncio.wait_for(run(b'some data'), 60.0, loop=self.loop)
+        exitcodes, stdout = self.loop.run_until_complete(task)
+        self.assertEqual(exitcodes, [0, 0, 0])
+        self.assertEqual(stdout, b'SOME DATA')
+
+    def test_pipeline_popen_error(self):
+        procs = []
+        create = subprocess.create_subprocess_exec
+
+        @asyncio.coroutine
+        def create_and_record(*args, **kwds):
+            proc = yield from create(*args, **kwds)
+            procs.append(proc)
+            return proc
+
+        @asyncio.coroutine
+        def run():
+            yield from asyncio.create_subprocess_pipeline(PROGRAM_BLOCKED,
+                ['/nonexistent-program'], stdin=subprocess.PIPE, loop=self.
+                loop)
+        with mock.patch.object(subprocess, 'create_subprocess_exec',
+            create_and_record):
+            with self.assertRaises(FileNotFoundError):
+                self.loop.run_until_complete(run())
+        self.assertEqual(len(procs), 1)
+        self.assertIsNotNone(procs[0].returncode)
+        self.assertTrue(procs[0]._transport.is_closing())
+
     def test_shell(self):
         create = asyncio.create_subprocess_shell('exit 7', loop=self.loop)
         proc = self.loop.run_until_complete(create)
@@ -3,6 +3,7 @@ import collections
 import contextlib
 import functools
 import io
+import itertools
 import os
 import re
 import sys
@@ -2221,5 +2222,175 @@ class SleepTests(test_utils.TestCase):
         self.assertEqual(result, 11)
 
 
+class TaskGroupTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(None)
+
+    def tearDown(self):
+        self.loop.close()
+        self.loop = None
+        super().tearDown()
+
+    def test_limit(self):
+        running = 0
+        max_running = 0
+
+        @asyncio.coroutine
+        def work(i):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            yield from asyncio.sleep(0.001 * (i % 3), loop=self.loop)
+            running -= 1
+            return i
+
+        @asyncio.coroutine
+        def main():
+            group = asyncio.TaskGroup(limit=3, loop=self.loop)
+            tasks = []
+            for i in range(20):
+                tasks.append((yield from group.spawn(work(i))))
+                self.assertLessEqual(len(group), 3)
+            yield from group.wait()
+            self.assertEqual(len(group), 0)
+            return [t.result() for t in tasks]
+        self.assertEqual(self.loop.run_until_complete(main()), list(range(20)))
+        self.assertEqual(max_running, 3)
+        self.assertRaises(ValueError, asyncio.TaskGroup, limit=0, loop=self
+            .loop)
+
+    def test_failure_cancels_siblings(self):
+
+        @asyncio.coroutine
+        def fail():
+            yield from asyncio.sleep(0.001, loop=self.loop)
+            raise ZeroDivisionError
+
+        @asyncio.coroutine
+        def main():
+            group = asyncio.TaskGroup(loop=self.loop)
+            slow = yield from group.spawn(asyncio.sleep(10, loop=self.loop))
+            yield from group.spawn(fail())
+            with self.assertRaises(ZeroDivisionError):
+                yield from group.wait()
+            self.assertTrue(slow.cancelled())
+            with self.assertRaises(ZeroDivisionError):
+                yield from group.spawn(asyncio.sleep(0, loop=self.loop))
+        self.loop.run_until_complete(main())
+
+    def test_wait_cancelled(self):
+
+        @asyncio.coroutine
+        def main(group):
+            yield from group.spawn(asyncio.sleep(10, loop=self.loop))
+            yield from group.wait()
+        group = asyncio.TaskGroup(loop=self.loop)
+        task = self.loop.create_task(main(group))
+        self.loop.call_later(0.01, task.cancel)
+        self.assertRaises(asyncio.CancelledError, self.loop.
+            run_until_complete, task)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(group), 0)
+
+    @unittest.skipUnless(PY35, 'need python 3.5 or later')
+    def test_async_with(self):
+        ns = {}
+        exec(
+            """async def main(loop):
+                async with asyncio.TaskGroup(limit=2, loop=loop) as group:
+                    tasks = [await group.spawn(asyncio.sleep(0.001, i,
+                        loop=loop)) for i in range(5)]
+                return [t.result() for t in tasks]"""
+            , {'asyncio': asyncio}, ns)
+        result = self.loop.run_until_complete(ns['main'](self.loop))
+        self.assertEqual(result, list(range(5)))
+
+    def test_map_unordered(self):
+        started = []
+
+        @asyncio.coroutine
+        def work(i):
+            started.append(i)
+            yield from asyncio.sleep(0.001 * (5 - i % 5), loop=self.loop)
+            return i * 2
+
+        @asyncio.coroutine
+        def main():
+            results = []
+            it = asyncio.map_unordered(work, iter(range(10)), limit=4, loop
+                =self.loop)
+            for f in it:
+                self.assertLessEqual(len(started) - len(results), 4)
+                results.append((yield from f))
+            return results
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(sorted(results), [i * 2 for i in range(10)])
+        self.assertEqual(started, list(range(10)))
+
+    def test_map_unordered_close_cancels(self):
+        tasks = []
+
+        def work(i):
+            task = self.loop.create_task(asyncio.sleep(10, loop=self.loop))
+            tasks.append(task)
+            return task
+
+        @asyncio.coroutine
+        def main():
+            it = asyncio.map_unordered(work, itertools.count(), limit=3,
+                loop=self.loop)
+            next(it)
+            it.close()
+        self.loop.run_until_complete(main())
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(tasks), 3)
+        self.assertTrue(all(t.cancelled() for t in tasks))
+
+    def test_map_unordered_collect_before_await(self):
+        running = set()
+
+        @asyncio.coroutine
+        def work(i):
+            running.add(i)
+            self.assertLessEqual(len(running), limit)
+            yield from asyncio.sleep(0, loop=self.loop)
+            running.discard(i)
+            return i
+
+        @asyncio.coroutine
+        def main():
+            fs = list(asyncio.map_unordered(work, range(5), limit=limit,
+                loop=self.loop))
+            self.assertEqual(len(fs), 5)
+            return (yield from asyncio.gather(*fs, loop=self.loop))
+        for limit in (1, 3, 5, 10):
+            with self.subTest(limit=limit):
+                results = self.loop.run_until_complete(main())
+                self.assertEqual(sorted(results), list(range(5)))
+
+    def test_map_unordered_cancel_waiter(self):
+
+        @asyncio.coroutine
+        def work(i):
+            yield from asyncio.sleep(0, loop=self.loop)
+            return i
+
+        @asyncio.coroutine
+        def main():
+            fs = list(asyncio.map_unordered(work, range(4), limit=2, loop=
+                self.loop))
+            waiter = asyncio.ensure_future(fs[0], loop=self.loop)
+            waiter.cancel()
+            results = yield from asyncio.gather(*fs[1:], loop=self.loop)
+            self.assertTrue(waiter.cancelled())
+            return results
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(len(set(results)), 3)
+        self.assertLess(set(results), set(range(4)))
+
+
 if __name__ == '__main__':
     unittest.main()
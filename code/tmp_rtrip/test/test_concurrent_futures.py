@@ -3,7 +3,10 @@ test.support.import_module('_multiprocessing')
 test.support.import_module('multiprocessing.synchronize')
 test.support.import_module('threading')
 from test.support.script_helper import assert_python_ok
+import functools
+import itertools
 import os
+import queue
 import sys
 import threading
 import time
@@ -80,10 +83,19 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class PriorityThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.PriorityThreadPoolExecutor
+
+
 class ProcessPoolMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
 
 
+class ProcessPoolBatchMixin(ExecutorMixin):
+    executor_type = functools.partial(futures.ProcessPoolExecutor,
+        max_batch_size=8)
+
+
 class ExecutorShutdownTest:
 
     def test_run_after_shutdown(self):
@@ -117,10 +129,12 @@ class ThreadPoolShutdownTest(ThreadPoolMixin, ExecutorShutdownTest,
         pass
 
     def test_threads_terminate(self):
-        self.executor.submit(mul, 21, 2)
-        self.executor.submit(mul, 6, 7)
-        self.executor.submit(mul, 3, 14)
+        sem = threading.Semaphore(0)
+        for i in range(3):
+            self.executor.submit(sem.acquire)
         self.assertEqual(len(self.executor._threads), 3)
+        for i in range(3):
+            sem.release()
         self.executor.shutdown()
         for t in self.executor._threads:
             t.join()
@@ -392,6 +406,117 @@ class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, unittest.TestCase):
         executor = self.executor_type()
         self.assertEqual(executor._max_workers, (os.cpu_count() or 1) * 5)
 
+    def test_idle_thread_reuse(self):
+        executor = self.executor_type()
+        for i in range(10):
+            executor.submit(mul, i, i).result()
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown(wait=True)
+
+    def test_idle_timeout(self):
+        self.assertRaises(ValueError, self.executor_type, idle_timeout=0)
+        executor = self.executor_type(max_workers=4, idle_timeout=0.05)
+        sem = threading.Semaphore(0)
+        fs = [executor.submit(sem.acquire) for i in range(4)]
+        self.assertEqual(len(executor._threads), 4)
+        for i in range(4):
+            sem.release()
+        futures.wait(fs)
+        deadline = time.monotonic() + 10
+        while executor._threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(executor._threads), 0)
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown(wait=True)
+
+    def test_submit_while_retiring(self):
+        executor = self.executor_type(max_workers=1, idle_timeout=0.05)
+        self.addCleanup(executor.shutdown)
+        self.assertEqual(executor.submit(mul, 2, 3).result(), 6)
+        semaphore = executor._idle_semaphore
+        submitters = []
+        fs = []
+
+        def submit():
+            fs.append(executor.submit(mul, 6, 7))
+
+
+        class RetiringSemaphore(object):
+
+            def acquire(self, blocking=True):
+                acquired = semaphore.acquire(blocking)
+                if acquired and not submitters and threading.current_thread(
+                    ) in executor._threads:
+                    t = threading.Thread(target=submit)
+                    submitters.append(t)
+                    t.start()
+                    t.join(0.2)
+                return acquired
+
+            def release(self):
+                semaphore.release()
+        executor._idle_semaphore = RetiringSemaphore()
+        deadline = time.monotonic() + 10
+        while not submitters and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(submitters)
+        submitters[0].join()
+        self.assertEqual(fs[0].result(timeout=10), 42)
+
+    def test_stats(self):
+        executor = self.executor_type(max_workers=1)
+        started = threading.Event()
+        event = threading.Event()
+
+        def block():
+            started.set()
+            event.wait()
+        executor.submit(block)
+        started.wait()
+        executor.submit(mul, 2, 3)
+        stats = executor.stats()
+        self.assertEqual(stats.threads, 1)
+        self.assertEqual(stats.active_workers, 1)
+        self.assertEqual(stats.queue_depth, 1)
+        event.set()
+        executor.shutdown(wait=True)
+        stats = executor.stats()
+        self.assertEqual(stats.active_workers, 0)
+        self.assertEqual(stats.completed_tasks, 2)
+        self.assertGreaterEqual(stats.max_wait_time, 0)
+        self.assertGreaterEqual(stats.total_wait_time, stats.max_wait_time)
+
+
+class PriorityThreadPoolExecutorTest(PriorityThreadPoolMixin, ExecutorTest,
+    unittest.TestCase):
+
+    def test_priority_order(self):
+        executor = self.executor_type(max_workers=1)
+        event = threading.Event()
+        executor.submit(event.wait)
+        order = []
+        fs = [executor.submit_with_priority(priority, None, order.append,
+            priority) for priority in (5, 1, 3, 1, 0)]
+        executor.submit(order.append, 'default')
+        event.set()
+        futures.wait(fs)
+        executor.shutdown(wait=True)
+        self.assertEqual(order, [0, 'default', 1, 1, 3, 5])
+
+    def test_deadline(self):
+        executor = self.executor_type(max_workers=1)
+        event = threading.Event()
+        executor.submit(event.wait)
+        now = time.monotonic()
+        expired = executor.submit_with_priority(0, now, mul, 2, 3)
+        later = executor.submit_with_priority(0, now + 3600, mul, 2, 4)
+        event.set()
+        self.assertEqual(later.result(), 8)
+        self.assertTrue(expired.cancelled())
+        self.assertRaises(futures.CancelledError, expired.result)
+        executor.shutdown(wait=True)
+
 
 class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase
     ):
@@ -417,6 +542,37 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase
             chunksize=40)), ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(200), range(200)))
+        self.assertEqual(list(self.executor.map(pow, range(200), range(200),
+            chunksize=None)), ref)
+        self.assertEqual(list(self.executor.map(pow, range(200), range(200),
+            chunksize=None, buffersize=1)), ref)
+        self.assertEqual(list(self.executor.map(pow, range(200), range(200),
+            chunksize=7, buffersize=2)), ref)
+        self.assertEqual(list(self.executor.map(pow, [], chunksize=None)), [])
+        with self.assertRaises(ValueError):
+            self.executor.map(pow, range(40), range(40), buffersize=0)
+
+    def test_map_buffersize_infinite_input(self):
+        results = self.executor.map(abs, itertools.count(), chunksize=None)
+        self.assertEqual(list(itertools.islice(results, 50)), list(range(50)))
+        results.close()
+
+    def test_map_adaptive_exception(self):
+        results = self.executor.map(sleep_and_raise, [0, 0.01], chunksize=None
+            )
+        self.assertRaises(Exception, list, results)
+
+    def test_next_chunksize(self):
+        next_chunksize = futures.process._next_chunksize
+        target = futures.process.ADAPTIVE_CHUNK_TIME
+        self.assertEqual(next_chunksize(10, 10, target), 10)
+        self.assertEqual(next_chunksize(10, 10, target / 100), 20)
+        self.assertEqual(next_chunksize(10, 10, target * 100), 5)
+        self.assertEqual(next_chunksize(1, 1, target * 100), 1)
+        self.assertEqual(next_chunksize(4, 4, 0), 8)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123)
@@ -439,6 +595,37 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase
         self.assertIn('raise RuntimeError(123) # some comment', f1.getvalue())
 
 
+class ProcessPoolBatchExecutorTest(ProcessPoolBatchMixin, ExecutorTest,
+    unittest.TestCase):
+
+    def test_batched_results(self):
+        fs = [self.executor.submit(divmod, 100, i) for i in range(200)]
+        self.assertRaises(ZeroDivisionError, fs[0].result)
+        self.assertEqual([f.result() for f in fs[1:]], [divmod(100, i) for
+            i in range(1, 200)])
+
+    def test_max_batch_size(self):
+        self.assertRaises(ValueError, futures.ProcessPoolExecutor,
+            max_batch_size=0)
+
+    def test_add_call_item_to_queue_batches(self):
+        pending_work_items = {}
+        work_ids = queue.Queue()
+        for i in range(20):
+            pending_work_items[i] = futures.process._WorkItem(Future(), abs,
+                (i,), {})
+            work_ids.put(i)
+        pending_work_items[3].future.cancel()
+        call_queue = queue.Queue(2)
+        futures.process._add_call_item_to_queue(pending_work_items,
+            work_ids, call_queue, 4, 2)
+        first = call_queue.get_nowait()
+        second = call_queue.get_nowait()
+        self.assertEqual([item.work_id for item in first], [0, 1, 2, 4])
+        self.assertEqual([item.work_id for item in second], [5, 6, 7, 8])
+        self.assertNotIn(3, pending_work_items)
+
+
 class FutureTests(unittest.TestCase):
 
     def test_done_callback_with_result(self):
@@ -672,6 +672,21 @@ class BasicTest(TestCase):
             finally:
                 resp.close()
 
+    def test_chunked_large_chunks(self):
+        with support.swap_attr(client, 'MAXAMOUNT', 4):
+            sock = FakeSocket(chunked_start + last_chunk + chunked_end)
+            resp = client.HTTPResponse(sock, method='GET')
+            resp.begin()
+            self.assertEqual(resp.read(), chunked_expected)
+            resp.close()
+            sock = FakeSocket(chunked_start + '10\r\nabcdefgh')
+            resp = client.HTTPResponse(sock, method='GET')
+            resp.begin()
+            with self.assertRaises(client.IncompleteRead) as cm:
+                resp.read()
+            self.assertEqual(cm.exception.partial, chunked_expected)
+            resp.close()
+
     def test_readinto_chunked(self):
         expected = chunked_expected
         nexpected = len(expected)
@@ -769,6 +784,16 @@ class BasicTest(TestCase):
         else:
             self.fail('IncompleteRead expected')
 
+    def test_incomplete_read_huge_content_length(self):
+        sock = FakeSocket(
+            'HTTP/1.1 200 OK\r\nContent-Length: 1000000000000\r\n\r\nHello\r\n'
+            )
+        resp = client.HTTPResponse(sock, method='GET')
+        resp.begin()
+        with self.assertRaises(client.IncompleteRead) as cm:
+            resp.read()
+        self.assertEqual(cm.exception.partial, b'Hello\r\n')
+
     def test_epipe(self):
         sock = EPipeSocket(
             'HTTP/1.0 401 Authorization Required\r\nContent-type: text/html\r\nWWW-Authenticate: Basic realm="example"\r\n'
@@ -1064,6 +1089,22 @@ class ExtendedReadTest(TestCase):
     def test_read1_0(self):
         self.assertEqual(self.resp.read1(0), b'')
 
+    def test_iter_chunks(self):
+        chunks = [bytes(view) for view in self.resp.iter_chunks(7)]
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 7)
+        self.assertEqual(b''.join(chunks), self.lines_expected)
+        self.assertTrue(self.resp.isclosed())
+
+    def test_iter_chunks_buffer(self):
+        buffer = bytearray(16)
+        data = bytearray()
+        for view in self.resp.iter_chunks(buffer=buffer):
+            self.assertIs(view.obj, buffer)
+            data += view
+        self.assertEqual(data, self.lines_expected)
+        self.assertEqual(list(self.resp.iter_chunks()), [])
+
     def test_peek_0(self):
         p = self.resp.peek(0)
         self.assertLessEqual(0, len(p))
@@ -1550,6 +1591,31 @@ class HTTPResponseTest(TestCase):
         header = self.resp.getheader('No-Such-Header', default=42)
         self.assertEqual(header, 42)
 
+    def check_release_conn(self, body, read, expected, method=None):
+        released = []
+        resp = client.HTTPResponse(FakeSocket(body), method=method)
+        resp.begin()
+        resp.release_conn = released.append
+        read(resp)
+        resp.close()
+        self.assertEqual(released, [expected])
+        self.assertIsNone(resp.release_conn)
+
+    def test_release_conn(self):
+        body = 'HTTP/1.1 200 Ok\r\nContent-Length: 4\r\n\r\nText'
+        self.check_release_conn(body, lambda resp: resp.read(), True)
+        self.check_release_conn(body, lambda resp: resp.read(2), False)
+        self.check_release_conn(body, lambda resp: resp.readline(), True)
+        self.check_release_conn(body, lambda resp: None, True, method='HEAD'
+            )
+        self.check_release_conn(chunked_start + last_chunk + chunked_end,
+            lambda resp: resp.read(), True)
+        body = ('HTTP/1.1 200 Ok\r\nConnection: close\r\n' +
+            'Content-Length: 4\r\n\r\nText')
+        self.check_release_conn(body, lambda resp: resp.read(), False)
+        body = 'HTTP/1.0 200 Ok\r\n\r\nText'
+        self.check_release_conn(body, lambda resp: resp.read(), False)
+
 
 class TunnelTests(TestCase):
 
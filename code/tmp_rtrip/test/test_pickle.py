@@ -15,6 +15,7 @@ from test.pickletester import AbstractIdentityPersistentPicklerTests
 from test.pickletester import AbstractPicklerUnpicklerObjectTests
 from test.pickletester import AbstractDispatchTableTests
 from test.pickletester import BigmemPickleTests
+from test.pickletester import protocols
 try:
     import _pickle
     has_c_implementation = True
@@ -55,6 +56,152 @@ class PyPicklerTests(AbstractPickleTests):
         return u.load()
 
 
+class PyRecordsPicklerTests(PyPicklerTests):
+
+    def dumps(self, arg, proto=None):
+        f = io.BytesIO()
+        p = self.pickler(f, proto, records=True)
+        p.dump(arg)
+        f.seek(0)
+        return bytes(f.read())
+
+    def test_records(self):
+        records = [(i, i / 3, 'name%d' % i, -2 ** 70 + i) for i in range(2001)]
+        records.append((0, float('inf'), '\u20ac\udc80\n\\', 2 ** 63))
+        for proto in protocols[1:]:
+            with self.subTest(proto=proto):
+                data = self.dumps(records, proto)
+                self.assertLess(len(data), len(pickle._dumps(records, proto)))
+                self.assertEqual(self.loads(data), records)
+                self.assertEqual(pickle.loads(data), records)
+
+    def test_records_memo(self):
+        records = [(i, str(i)) for i in range(100)]
+        name = 'shared'
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                a, b, c, d = self.loads(self.dumps([records, name, records,
+                    name], proto))
+                self.assertEqual(a, records)
+                self.assertIs(a, c)
+                self.assertEqual(b, name)
+                self.assertIs(b, d)
+
+    def test_records_fallback(self):
+        pairs = [(i, i) for i in range(100)]
+        cases = [pairs[:10], pairs + [(1, 2.0)], pairs + [(1, 2, 3)], [(i,
+            True) for i in range(100)], pairs + [[1, 2]], [() for i in
+            range(100)]]
+        for records in cases:
+            for proto in protocols:
+                with self.subTest(proto=proto, records=records[-1]):
+                    self.assertEqual(self.dumps(records, proto), pickle.
+                        _dumps(records, proto))
+
+
+class PyOutOfBandTests(unittest.TestCase):
+    pickler = pickle._Pickler
+    unpickler = pickle._Unpickler
+
+    def dumps(self, obj, buffer_callback):
+        f = io.BytesIO()
+        self.pickler(f, 5, buffer_callback=buffer_callback).dump(obj)
+        return f.getvalue()
+
+    def loads(self, data, buffers=None):
+        return self.unpickler(io.BytesIO(data), buffers=buffers).load()
+
+    def test_out_of_band(self):
+        big = b'x' * 100000
+        arr = bytearray(b'y' * 70000)
+        obj = [big, arr, b'small', bytearray(b'short'), big]
+        buffers = []
+        data = self.dumps(obj, buffers.append)
+        self.assertEqual(len(buffers), 2)
+        self.assertLess(len(data), 1000)
+        self.assertEqual([b.raw().tobytes() for b in buffers], [big, arr])
+        res = self.loads(data, [big, arr])
+        self.assertEqual(res, obj)
+        self.assertIs(res[0], big)
+        self.assertIs(res[1], arr)
+        self.assertIs(res[4], res[0])
+        res = self.loads(data, [b.raw() for b in buffers])
+        self.assertEqual(res, obj)
+        self.assertIs(type(res[0]), bytes)
+        self.assertIs(type(res[1]), bytearray)
+
+    def test_in_band(self):
+        obj = [b'x' * 100000, bytearray(b'y' * 70000)]
+        calls = []
+        data = self.dumps(obj, lambda buf: calls.append(buf) or True)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.loads(data), obj)
+
+    def test_memoryview(self):
+        base = bytearray(range(256)) * 8
+        views = [memoryview(base), memoryview(base).cast('H', (32, 32)),
+            memoryview(base)[::2]]
+        for view in views:
+            with self.subTest(shape=view.shape, strides=view.strides):
+                buffers = []
+                res = self.loads(self.dumps(view, buffers.append), buffers)
+                self.assertIsInstance(res, memoryview)
+                self.assertEqual(res.format, view.format)
+                self.assertEqual(res.shape, view.shape)
+                self.assertEqual(res.tolist(), view.tolist())
+                res = self.loads(self.dumps(view, lambda buf: True))
+                self.assertEqual(res.tolist(), view.tolist())
+        buffers = []
+        res = self.loads(self.dumps(views[0], buffers.append), buffers)
+        res[0] = 42
+        self.assertEqual(base[0], 42)
+        with self.assertRaises(TypeError):
+            self.dumps(views[0], None)
+
+    def test_picklebuffer(self):
+        buf = pickle.PickleBuffer(b'abc')
+        self.assertEqual(buf.raw().tobytes(), b'abc')
+        buffers = []
+        data = self.dumps(buf, buffers.append)
+        self.assertEqual(len(buffers), 1)
+        other = bytearray(b'def')
+        self.assertIs(self.loads(data, [other]), other)
+        self.assertEqual(self.loads(self.dumps(buf, lambda b: True)), b'abc')
+        res = self.loads(self.dumps(pickle.PickleBuffer(bytearray(b'abc')),
+            lambda b: True))
+        self.assertEqual(res, bytearray(b'abc'))
+        self.assertIs(type(res), bytearray)
+        with self.assertRaises(BufferError):
+            pickle.PickleBuffer(memoryview(b'abcd')[::2]).raw()
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                data = pickle.dumps(buf, proto)
+                self.assertEqual(pickle.loads(data), b'abc')
+                self.assertEqual(self.loads(pickle._dumps(buf, proto)), b'abc')
+                res = pickle.loads(pickle.dumps(pickle.PickleBuffer(
+                    bytearray(b'abc')), proto))
+                self.assertEqual(res, bytearray(b'abc'))
+                self.assertIs(type(res), bytearray)
+
+    def test_buffer_errors(self):
+        data = self.dumps(b'x' * 100000, lambda buf: None)
+        with self.assertRaises(pickle.UnpicklingError):
+            self.loads(data)
+        with self.assertRaises(pickle.UnpicklingError):
+            self.loads(data, [])
+        for proto in protocols:
+            with self.assertRaises(ValueError):
+                self.pickler(io.BytesIO(), proto, buffer_callback=lambda
+                    buf: None)
+        self.assertEqual(data[:2], pickle.PROTO + b'\x05')
+        with self.assertRaises(ValueError):
+            pickle.loads(data)
+        forged = pickle.PROTO + b'\x04' + data[2:]
+        with self.assertRaises(pickle.UnpicklingError):
+            self.loads(forged, [b'x' * 100000])
+        self.assertEqual(pickle._loads(pickle._dumps([1, 2], 5)), [1, 2])
+
+
 class InMemoryPickleTests(AbstractPickleTests, AbstractUnpickleTests,
     BigmemPickleTests):
     pickler = pickle._Pickler
@@ -419,8 +566,9 @@ class CompatPickleTests(unittest.TestCase):
 
 def test_main():
     tests = [PickleTests, PyUnpicklerTests, PyPicklerTests,
-        PyPersPicklerTests, PyIdPersPicklerTests, PyDispatchTableTests,
-        PyChainDispatchTableTests, CompatPickleTests]
+        PyRecordsPicklerTests, PyOutOfBandTests, PyPersPicklerTests,
+        PyIdPersPicklerTests, PyDispatchTableTests, PyChainDispatchTableTests,
+        CompatPickleTests]
     if has_c_implementation:
         tests.extend([CUnpicklerTests, CPicklerTests, CPersPicklerTests,
             CIdPersPicklerTests, CDumpPickle_LoadPickle,
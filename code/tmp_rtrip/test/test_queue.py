@@ -187,6 +187,45 @@ class BaseQueueTestMixin(BlockingTestMixin):
         with self.assertRaises(queue.Empty):
             q.get_nowait()
 
+    def test_put_many_get_many(self):
+        q = self.type2test(QUEUE_SIZE)
+        q.put_many([3, 1, 2])
+        self.assertEqual(q.qsize(), 3)
+        self.assertEqual(sorted(q.get_many(2) + q.get_many()), [1, 2, 3])
+        with self.assertRaises(queue.Empty):
+            q.get_many(block=False)
+        with self.assertRaises(queue.Empty):
+            q.get_many(timeout=0.01)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        with self.assertRaises(queue.Full):
+            q.put_many(range(QUEUE_SIZE + 1), block=False)
+        self.assertTrue(qfull(q))
+        with self.assertRaises(queue.Full):
+            q.put_many([1], timeout=0.01)
+        self.assertEqual(len(q.get_many()), QUEUE_SIZE)
+        for i in range(QUEUE_SIZE):
+            q.task_done()
+        result = self.do_blocking_test(q.get_many, (), q.put_many, ([7, 8],)
+            )
+        self.assertIn(7, result)
+        q.put_many(range(QUEUE_SIZE))
+        self.do_blocking_test(q.put_many, ([1, 2],), q.get_many, (2,))
+        self.assertTrue(qfull(q))
+
+    def test_put_many_waits_for_consumers(self):
+        q = self.type2test(2)
+        consumed = []
+
+        def consumer():
+            for i in range(10):
+                consumed.append(q.get())
+        t = threading.Thread(target=consumer)
+        t.start()
+        q.put_many(range(10), timeout=10)
+        t.join(10)
+        self.assertEqual(sorted(consumed), list(range(10)))
+
     def test_shrinking_queue(self):
         q = self.type2test(3)
         q.put(1)
@@ -212,6 +251,74 @@ class PriorityQueueTest(BaseQueueTestMixin, unittest.TestCase):
     type2test = queue.PriorityQueue
 
 
+class SimpleQueueTest(BlockingTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.q = queue.SimpleQueue()
+
+    def test_basic(self):
+        q = self.q
+        self.assertTrue(q.empty())
+        q.put(1)
+        q.put_nowait(2)
+        q.put_many(iter([3, 4]))
+        self.assertEqual(q.qsize(), 4)
+        self.assertFalse(q.empty())
+        self.assertEqual(q.get(), 1)
+        self.assertEqual(q.get_nowait(), 2)
+        self.assertEqual(q.get_many(), [3, 4])
+        self.assertRaises(queue.Empty, q.get_nowait)
+        self.assertRaises(queue.Empty, q.get, True, 0.01)
+        self.assertRaises(queue.Empty, q.get_many, None, False)
+        self.assertRaises(ValueError, q.get, True, -1)
+        self.assertRaises(ValueError, q.get_many, 0)
+        q.put_many(range(5))
+        self.assertEqual(q.get_many(3), [0, 1, 2])
+        self.assertEqual(q.get_many(3), [3, 4])
+
+    def test_blocking(self):
+        q = self.q
+        self.assertEqual(self.do_blocking_test(q.get, (), q.put, ('a',)),
+            'a')
+        self.assertEqual(self.do_blocking_test(q.get, (True, 10), q.put,
+            ('b',)), 'b')
+        self.assertEqual(self.do_blocking_test(q.get_many, (), q.put_many,
+            (['c', 'd'],)), ['c', 'd'])
+        self.assertTrue(q.empty())
+        self.assertFalse(q._waiters)
+
+    def test_many_threads(self):
+        q = self.q
+        nthreads = 8
+        nitems = 1000
+        results = []
+
+        def producer(i):
+            for j in range(0, nitems, 10):
+                q.put(i * nitems + j)
+                q.put_many(range(i * nitems + j + 1, i * nitems + j + 10))
+
+        def consumer():
+            got = []
+            while True:
+                items = q.get_many(7, timeout=10)
+                got.extend(item for item in items if item is not None)
+                if None in items:
+                    q.put_many([None] * (items.count(None) - 1))
+                    results.extend(got)
+                    return
+        consumers = [threading.Thread(target=consumer) for i in range(
+            nthreads)]
+        producers = [threading.Thread(target=producer, args=(i,)) for i in
+            range(nthreads)]
+        with support.start_threads(consumers + producers):
+            for t in producers:
+                t.join()
+            for i in range(nthreads):
+                q.put(None)
+        self.assertEqual(sorted(results), list(range(nthreads * nitems)))
+
+
 class FailingQueueException(Exception):
     pass
 
@@ -3,6 +3,7 @@ import io
 import locale
 import re
 import sre_compile
+import sre_parse
 import string
 import sys
 import traceback
@@ -1782,6 +1783,163 @@ class ImplementationTest(unittest.TestCase):
         self.assertEqual(f('ababba'), [0, 0, 1, 2, 0, 1])
         self.assertEqual(f('abcabdac'), [0, 0, 0, 1, 2, 0, 1, 0])
 
+    def test_required_literals(self):
+
+        def f(pattern, flags=0):
+            p = sre_parse.parse(pattern, flags)
+            return sre_compile._required_literals(p, flags, pattern)
+        self.assertEqual(f('abc'), ('abc',))
+        self.assertEqual(f('.*ERROR.*timeout'), ('timeout', 'ERROR'))
+        self.assertEqual(f('ab(cd)ef'), ('abcdef',))
+        self.assertEqual(f('x(?:a|b)y'), ('x', 'y'))
+        self.assertEqual(f('(foo)+bar'), ('foo', 'bar'))
+        self.assertEqual(f('a(foo)*'), ('a',))
+        self.assertEqual(f('(?!foo)bar'), ('bar',))
+        self.assertEqual(f(b'\\d+ms'), (b'ms',))
+        self.assertEqual(f('foo', re.I), ())
+        self.assertEqual(f('(?i)foo'), ())
+        self.assertEqual(f('x(?i:foo)y'), ('x', 'y'))
+        self.assertEqual(f('foo|bar'), ())
+
+    def test_prefilter(self):
+        re.purge()
+        self.assertIsNone(re.search('.*ERROR.*timeout', 'ERROR: slow'))
+        self.assertEqual(re.search('.*ERROR.*timeout', 'x ERROR timeout').
+            group(), 'x ERROR timeout')
+        self.assertEqual(re.findall('ab+c', 'xyz'), [])
+        self.assertEqual(re.findall('ab+c', 'abbc ac abc'), ['abbc', 'abc'])
+        self.assertEqual(list(re.finditer(b'ab+c', b'xyz')), [])
+        self.assertEqual([m.span() for m in re.finditer(b'ab+c',
+            bytearray(b'abc'))], [(0, 3)])
+        self.assertEqual(re.findall(b'ab', memoryview(b'xab')), [b'ab'])
+        with self.assertRaises(TypeError):
+            re.search('abc', b'abc')
+        with self.assertRaises(TypeError):
+            re.findall(b'abc', 'abc')
+
+
+class CacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(re.set_cache_size, re.cache_info().maxsize)
+        re.purge()
+        self.addCleanup(re.purge)
+
+    def test_cache_info(self):
+        re.compile('abc')
+        re.compile('abc')
+        re.compile(b'abc')
+        info = re.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+        re.purge()
+        self.assertEqual(re.cache_info()[:2], (0, 0))
+
+    def test_lru_eviction(self):
+        re.set_cache_size(2)
+        p1 = re.compile('a')
+        p2 = re.compile('b')
+        self.assertIs(re.compile('a'), p1)
+        re.compile('c')
+        self.assertEqual(re.cache_info().currsize, 2)
+        self.assertIs(re.compile('a'), p1)
+        self.assertIsNot(re.compile('b'), p2)
+
+    def test_set_cache_size(self):
+        for c in 'abcd':
+            re.compile(c)
+        re.set_cache_size(1)
+        info = re.cache_info()
+        self.assertEqual(info.maxsize, 1)
+        self.assertEqual(info.currsize, 1)
+        re.set_cache_size(0)
+        p = re.compile('x')
+        self.assertIsNot(re.compile('x'), p)
+        self.assertEqual(re.cache_info().currsize, 0)
+        self.assertRaises(ValueError, re.set_cache_size, -1)
+        self.assertRaises(TypeError, re.set_cache_size, 1.5)
+
+    def test_dump_load_cache(self):
+        p1 = re.compile('(?P<word>\\w+)-(\\d+)', re.I)
+        p2 = re.compile(b'[a-z]+\\s')
+        f = io.BytesIO()
+        re.dump_cache(f)
+        re.purge()
+        f.seek(0)
+        self.assertEqual(re.load_cache(f), 2)
+        q1 = re.compile('(?P<word>\\w+)-(\\d+)', re.I)
+        q2 = re.compile(b'[a-z]+\\s')
+        self.assertEqual(q1, p1)
+        self.assertEqual(q2, p2)
+        self.assertEqual(q1.groupindex, p1.groupindex)
+        self.assertEqual(q1.match('ABC-12').group('word', 2), ('ABC', '12'))
+        self.assertEqual(q2.search(b'12 ab c').group(), b'ab ')
+
+    def test_load_cache_bad_magic(self):
+        import marshal
+        f = io.BytesIO(marshal.dumps((None, [('a', 0, None)])))
+        self.assertEqual(re.load_cache(f), 0)
+        self.assertEqual(re.load_cache(io.BytesIO()), 0)
+
+
+class RegexSetTests(unittest.TestCase):
+
+    def test_matches(self):
+        rs = re.RegexSet(['.*ERROR.*timeout', 'WARN', '\\d+ms', 'x|y'])
+        self.assertEqual(len(rs), 4)
+        self.assertEqual(rs.matches('ERROR: read timeout after 30ms'), [0, 2])
+        self.assertEqual(rs.matches('WARN x'), [1, 3])
+        self.assertEqual(rs.matches('nothing here'), [])
+        self.assertEqual(rs.matches('ERROR'), [])
+        self.assertEqual(rs.matches(''), [])
+
+    def test_search(self):
+        rs = re.RegexSet(['foo', 'o+', 'bar'])
+        self.assertEqual(rs.search('xbar foo'), 2)
+        self.assertEqual(rs.search('foo'), 0)
+        self.assertEqual(rs.search('oo'), 1)
+        self.assertIsNone(rs.search('xyz'))
+
+    def test_groups(self):
+        rs = re.RegexSet(['(a)(b)\\2', '(?P<x>c)(?P=x)', '(?P<x>d)(?(x)e|f)',
+            '(?<=(g))h'])
+        self.assertEqual(rs.matches('abb'), [0])
+        self.assertEqual(rs.matches('abc'), [])
+        self.assertEqual(rs.matches('cc'), [1])
+        self.assertEqual(rs.matches('de'), [2])
+        self.assertEqual(rs.matches('df'), [])
+        self.assertEqual(rs.matches('gh'), [3])
+        self.assertEqual(rs.search('cc abb'), 1)
+
+    def test_flags(self):
+        rs = re.RegexSet(['abc', '(?i)xyz', '^d'], re.M)
+        self.assertEqual(rs.matches('ABC XYZ\nd'), [1, 2])
+        rs = re.RegexSet(['abc', 'xyz'], re.I)
+        self.assertEqual(rs.matches('ABC XYZ'), [0, 1])
+        rs = re.RegexSet([b'ab', b'\\w+!'])
+        self.assertEqual(rs.matches(b'ab!'), [0, 1])
+        self.assertEqual(rs.matches(bytearray(b'ab')), [0])
+        self.assertRaises(TypeError, rs.matches, 'ab')
+        self.assertRaises(ValueError, re.RegexSet, ['a', '(?a)b'])
+        self.assertRaises(TypeError, re.RegexSet, ['a', b'b'])
+        self.assertRaises(ValueError, re.RegexSet, [])
+        self.assertRaises(re.error, re.RegexSet, ['a', '('])
+
+    def test_many_patterns(self):
+        patterns = ['item%d\\b' % i for i in range(300)]
+        rs = re.RegexSet(patterns)
+        self.assertEqual(rs.matches('item7 and item250'), [7, 250])
+        self.assertEqual(rs.search('item299 item3'), 299)
+
+    def test_matches_same_position(self):
+        patterns = ['abc', 'ab', 'a', 'c', '^b', '(?<=a)b', 'b$', 'x', '']
+        rs = re.RegexSet(patterns)
+        for string in ['zabc', 'ab', 'b', 'cab', '']:
+            with self.subTest(string=string):
+                self.assertEqual(rs.matches(string), [i for i, p in
+                    enumerate(patterns) if re.search(p, string)])
+
 
 class ExternalTests(unittest.TestCase):
 
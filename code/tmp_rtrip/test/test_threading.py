@@ -1014,6 +1014,14 @@ class BarrierTests(lock_tests.BarrierTests):
     barriertype = staticmethod(threading.Barrier)
 
 
+class RWLockTests(lock_tests.RWLockTests):
+    rwlocktype = staticmethod(threading.RWLock)
+
+
+class ShardedLockTests(lock_tests.ShardedLockTests):
+    shardedlocktype = staticmethod(threading.ShardedLock)
+
+
 class MiscTestCase(unittest.TestCase):
 
     def test__all__(self):
@@ -4,6 +4,7 @@ import email
 import urllib.parse
 import urllib.request
 import http.server
+import socketserver
 import unittest
 import hashlib
 from test import support
@@ -576,6 +577,145 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """Threaded HTTP/1.1 server counting the connections it accepts."""
+    daemon_threads = True
+    connections = 0
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        http.server.BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b'pooled' * 100
+        self.send_response(200)
+        if self.path == '/chunked':
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            self.wfile.write(b'6\r\npooled\r\n0\r\n\r\n')
+            return
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        elif self.path == '/drop':
+            self.close_connection = True
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+    do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipUnless(threading, 'Threading required for this test.')
+class ConnectionPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        super(ConnectionPoolTests, self).setUp()
+
+        def restore_environ(old_environ):
+            os.environ.clear()
+            os.environ.update(old_environ)
+        self.addCleanup(restore_environ, os.environ.copy())
+        os.environ['NO_PROXY'] = '*'
+        os.environ['no_proxy'] = '*'
+        self.server = KeepAliveServer(('127.0.0.1', 0), KeepAliveHandler)
+        thread = threading.Thread(target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.01})
+        thread.start()
+
+        def stop_server():
+            self.server.shutdown()
+            thread.join()
+            self.server.server_close()
+        self.addCleanup(stop_server)
+        self.url = 'http://127.0.0.1:%d/' % self.server.server_port
+        self.pool = urllib.request.HTTPConnectionPool()
+        self.opener = self.make_opener(self.pool)
+
+    def make_opener(self, pool):
+        self.addCleanup(pool.clear)
+        return urllib.request.build_opener(urllib.request.HTTPHandler(pool
+            =pool))
+
+    def urlopen(self, path='', opener=None):
+        opener = opener or self.opener
+        with opener.open(self.url + path, timeout=10) as f:
+            return f.read()
+
+    def test_reuse(self):
+        for path in ['', 'chunked', '']:
+            self.assertTrue(self.urlopen(path).startswith(b'pooled'))
+            self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_partial_read_not_reused(self):
+        with self.opener.open(self.url, timeout=10) as f:
+            self.assertEqual(f.read(6), b'pooled')
+        self.assertEqual(len(self.pool), 0)
+        self.urlopen()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_connection_close(self):
+        self.urlopen('close')
+        self.assertEqual(len(self.pool), 0)
+        self.urlopen()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_stale_connection_retried(self):
+        self.urlopen('drop')
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.urlopen(), b'pooled' * 100)
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_stale_connection_not_retried_for_post(self):
+        self.urlopen('drop')
+        req = urllib.request.Request(self.url, data=b'data', method='POST')
+        with self.assertRaises((urllib.error.URLError, ConnectionError)):
+            self.opener.open(req, timeout=10)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(self.pool), 0)
+        self.urlopen('drop')
+        req = urllib.request.Request(self.url, data=b'data', method='PUT')
+        with self.opener.open(req, timeout=10) as f:
+            self.assertEqual(f.read(), b'pooled' * 100)
+        self.assertEqual(self.server.connections, 3)
+
+    def test_idle_timeout(self):
+        self.pool.idle_timeout = -1
+        self.urlopen()
+        self.urlopen()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_max_per_host(self):
+        pool = urllib.request.HTTPConnectionPool(max_per_host=1, block=True)
+        opener = self.make_opener(pool)
+        f = opener.open(self.url, timeout=10)
+        self.assertRaises(urllib.error.URLError, opener.open, self.url,
+            timeout=0.1)
+        f.read()
+        f.close()
+        self.urlopen(opener=opener)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_clear(self):
+        self.urlopen()
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.urlopen()
+        self.assertEqual(self.server.connections, 2)
+
+
 threads_key = None
 
 
@@ -12,8 +12,8 @@ except ImportError:
 __all__ = ['get_ident', 'active_count', 'Condition', 'current_thread',
     'enumerate', 'main_thread', 'TIMEOUT_MAX', 'Event', 'Lock', 'RLock',
     'Semaphore', 'BoundedSemaphore', 'Thread', 'Barrier',
-    'BrokenBarrierError', 'Timer', 'ThreadError', 'setprofile', 'settrace',
-    'local', 'stack_size']
+    'BrokenBarrierError', 'RWLock', 'ShardedLock', 'Timer', 'ThreadError',
+    'setprofile', 'settrace', 'local', 'stack_size']
 _start_new_thread = _thread.start_new_thread
 _allocate_lock = _thread.allocate_lock
 _set_sentinel = _thread._set_sentinel
@@ -648,6 +648,235 @@ class BrokenBarrierError(RuntimeError):
     pass
 
 
+class _LockView:
+    """Lock-like view of one side of a reader-writer lock."""
+    __slots__ = 'acquire', 'release'
+
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, t, v, tb):
+        self.release()
+
+
+class RWLock:
+    """This class implements reader-writer lock objects.
+
+    Any number of threads may hold the lock for reading at the same time,
+    while holding it for writing excludes every other reader and writer.
+    The reader and writer attributes are lock-like objects, so the lock is
+    typically used as 'with rwlock.reader:' or 'with rwlock.writer:'.
+
+    If prefer_writers is true, new readers wait as long as a writer is
+    waiting, so that a steady stream of readers cannot starve writers.
+    Otherwise (the default) readers are admitted whenever no writer holds
+    the lock.  The lock is not reentrant: a thread holding it must not
+    acquire it again, for reading or for writing.
+
+    """
+
+    def __init__(self, prefer_writers=False):
+        self._lock = Lock()
+        self._can_read = Condition(self._lock)
+        self._can_write = Condition(self._lock)
+        self._prefer_writers = prefer_writers
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        self._read_acquires = self._write_acquires = 0
+        self._read_contended = self._write_contended = 0
+        self._read_wait_time = self._write_wait_time = 0.0
+        self.reader = _LockView(self.acquire_read, self.release_read)
+        self.writer = _LockView(self.acquire_write, self.release_write)
+
+    def __repr__(self):
+        return '<%s.%s readers=%d writer=%r waiting_writers=%d>' % (self.
+            __class__.__module__, self.__class__.__qualname__, self.
+            _readers, self._writer, self._waiting_writers)
+
+    def _read_ready(self):
+        return self._writer is None and not (self._prefer_writers and self
+            ._waiting_writers)
+
+    def _write_ready(self):
+        return self._writer is None and not self._readers
+
+    def acquire_read(self, blocking=True, timeout=None):
+        """Acquire the lock for reading.
+
+        Blocks while a writer holds the lock (or, with prefer_writers, is
+        waiting for it).  'blocking' and 'timeout' have the same meaning as
+        for Semaphore.acquire(); return true if the lock was acquired.
+
+        """
+        if not blocking and timeout is not None:
+            raise ValueError("can't specify timeout for non-blocking acquire")
+        with self._lock:
+            if not self._read_ready():
+                if not blocking:
+                    return False
+                self._read_contended += 1
+                start = _time()
+                try:
+                    if not self._can_read.wait_for(self._read_ready, timeout):
+                        return False
+                finally:
+                    self._read_wait_time += _time() - start
+            self._readers += 1
+            self._read_acquires += 1
+            return True
+
+    def release_read(self):
+        """Release a read lock acquired with acquire_read()."""
+        with self._lock:
+            if not self._readers:
+                raise RuntimeError('cannot release un-acquired lock')
+            self._readers -= 1
+            if not self._readers:
+                self._can_write.notify()
+
+    def acquire_write(self, blocking=True, timeout=None):
+        """Acquire the lock for writing.
+
+        Blocks until no other thread holds the lock for reading or
+        writing.  'blocking' and 'timeout' have the same meaning as for
+        Semaphore.acquire(); return true if the lock was acquired.
+
+        """
+        if not blocking and timeout is not None:
+            raise ValueError("can't specify timeout for non-blocking acquire")
+        with self._lock:
+            if not self._write_ready():
+                if not blocking:
+                    return False
+                self._write_contended += 1
+                self._waiting_writers += 1
+                start = _time()
+                acquired = False
+                try:
+                    acquired = self._can_write.wait_for(self._write_ready,
+                        timeout)
+                finally:
+                    self._waiting_writers -= 1
+                    self._write_wait_time += _time() - start
+                    if not acquired and not self._waiting_writers:
+                        self._can_read.notify_all()
+                if not acquired:
+                    return False
+            self._writer = get_ident()
+            self._write_acquires += 1
+            return True
+
+    def release_write(self):
+        """Release a write lock acquired with acquire_write().
+
+        Only the thread which acquired it can release it.
+
+        """
+        with self._lock:
+            if self._writer != get_ident():
+                raise RuntimeError('cannot release un-acquired lock')
+            self._writer = None
+            self._can_write.notify()
+            self._can_read.notify_all()
+
+    def stats(self):
+        """Return a dict of counters describing the use of the lock.
+
+        'read_acquires' and 'write_acquires' count successful acquisitions,
+        'read_contended' and 'write_contended' the acquisitions which had to
+        wait, and 'read_wait_time' and 'write_wait_time' the total number of
+        seconds spent waiting.  'readers' and 'waiting_writers' give the
+        current state.
+
+        """
+        with self._lock:
+            return {'read_acquires': self._read_acquires, 'write_acquires':
+                self._write_acquires, 'read_contended': self.
+                _read_contended, 'write_contended': self._write_contended,
+                'read_wait_time': self._read_wait_time, 'write_wait_time':
+                self._write_wait_time, 'readers': self._readers,
+                'waiting_writers': self._waiting_writers}
+
+
+class _ShardLock:
+    """Lock wrapper counting acquisitions and contention of one shard."""
+
+    def __init__(self, lock):
+        self._lock = lock
+        self.acquires = 0
+        self.contended = 0
+        self.wait_time = 0.0
+
+    def acquire(self, blocking=True, timeout=-1):
+        if self._lock.acquire(False):
+            self.acquires += 1
+            return True
+        if not blocking:
+            return False
+        start = _time()
+        if not self._lock.acquire(True, timeout):
+            return False
+        self.acquires += 1
+        self.contended += 1
+        self.wait_time += _time() - start
+        return True
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, t, v, tb):
+        self.release()
+
+
+class ShardedLock:
+    """This class implements a fixed set of locks selected by key.
+
+    Indexing with a key returns the lock of the shard the key hashes to,
+    so 'with locks[key]:' only serializes threads working on keys of the
+    same shard, while memory use stays bounded however many keys are
+    seen.  'shards' is the number of locks and 'lock_factory' creates
+    each of them; it defaults to Lock and may be RLock.
+
+    The counters updated by the shards are only modified while the shard
+    is held, so stats() is exact without any extra locking.
+
+    """
+
+    def __init__(self, shards=16, lock_factory=Lock):
+        if shards < 1:
+            raise ValueError('shards must be at least 1')
+        self._shards = [_ShardLock(lock_factory()) for i in range(shards)]
+
+    def __len__(self):
+        return len(self._shards)
+
+    def __getitem__(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def stats(self):
+        """Return a dict of counters describing the use of the shards.
+
+        'acquires', 'contended' and 'wait_time' are totals over all shards
+        of the acquisitions, of those which had to wait, and of the seconds
+        spent waiting; 'shard_acquires' and 'shard_contended' list the
+        counts per shard, which shows whether a few keys are hot.
+
+        """
+        shards = self._shards
+        return {'acquires': sum(s.acquires for s in shards), 'contended':
+            sum(s.contended for s in shards), 'wait_time': sum(s.wait_time for
+            s in shards), 'shard_acquires': [s.acquires for s in shards],
+            'shard_contended': [s.contended for s in shards]}
+
+
 _counter = _count().__next__
 _counter()
 
@@ -69,6 +69,7 @@ f = urllib.request.urlopen('http://www.python.org/')
 import base64
 import bisect
 import email
+import functools
 import hashlib
 import http.client
 import io
@@ -78,6 +79,7 @@ import re
 import socket
 import string
 import sys
+import threading
 import time
 import collections
 import tempfile
@@ -98,9 +100,9 @@ __all__ = ['Request', 'OpenerDirector', 'BaseHandler',
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler',
     'AbstractDigestAuthHandler', 'HTTPDigestAuthHandler',
-    'ProxyDigestAuthHandler', 'HTTPHandler', 'FileHandler', 'FTPHandler',
-    'CacheFTPHandler', 'DataHandler', 'UnknownHandler',
-    'HTTPErrorProcessor', 'urlopen', 'install_opener', 'build_opener',
+    'ProxyDigestAuthHandler', 'HTTPConnectionPool', 'HTTPHandler',
+    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
+    'UnknownHandler', 'HTTPErrorProcessor', 'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies', 'urlretrieve',
     'urlcleanup', 'URLopener', 'FancyURLopener']
 __version__ = '%d.%d' % sys.version_info[:2]
@@ -1013,10 +1015,109 @@ class ProxyDigestAuthHandler(BaseHandler, AbstractDigestAuthHandler):
         return retry
 
 
+_STALE_CONNECTION_ERRORS = (BrokenPipeError, ConnectionResetError,
+    ConnectionAbortedError)
+_IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS',
+    'TRACE'])
+
+
+def _timeout_value(timeout):
+    if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+        return socket.getdefaulttimeout()
+    return timeout
+
+
+class HTTPConnectionPool:
+    """Keep HTTP connections open so that later requests can reuse them.
+
+    Pass an instance to HTTPHandler or HTTPSHandler to send requests
+    over persistent connections.  A connection goes back to the pool
+    when its response has been read to the end and closed; responses
+    closed early, or after which the server closes the connection, are
+    not reused.  At most max_per_host idle connections are kept for each
+    host and connections left idle for more than idle_timeout seconds
+    are closed.  If block is true, max_per_host also limits the number
+    of connections to a host in use at the same time, and a request
+    waits for one to be released, at most for the request timeout.
+
+    The pool is thread-safe and can be shared between handlers.
+    """
+
+    def __init__(self, max_per_host=10, idle_timeout=60.0, block=False):
+        if max_per_host <= 0:
+            raise ValueError('max_per_host must be greater than 0')
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.block = block
+        self._cond = threading.Condition()
+        self._idle = {}
+        self._in_use = collections.Counter()
+
+    def __len__(self):
+        """Return the number of idle connections."""
+        with self._cond:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def _acquire(self, key, timeout):
+        stale = []
+        try:
+            with self._cond:
+                endtime = None
+                if self.block and timeout is not None:
+                    endtime = time.monotonic() + timeout
+                while True:
+                    idle = self._idle.get(key)
+                    deadline = time.monotonic() - self.idle_timeout
+                    while idle:
+                        conn, released = idle.pop()
+                        if released < deadline or conn.sock is None:
+                            stale.append(conn)
+                            continue
+                        self._in_use[key] += 1
+                        return conn
+                    if not self.block or self._in_use[key] < self.max_per_host:
+                        self._in_use[key] += 1
+                        return None
+                    if endtime is None:
+                        self._cond.wait()
+                    else:
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0:
+                            raise URLError(
+                                'timed out waiting for a pooled connection')
+                        self._cond.wait(remaining)
+        finally:
+            for conn in stale:
+                conn.close()
+
+    def _release(self, key, conn, reusable):
+        with self._cond:
+            self._in_use[key] -= 1
+            if self._in_use[key] <= 0:
+                del self._in_use[key]
+            if reusable and conn.sock is not None:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_per_host:
+                    idle.append((conn, time.monotonic()))
+                    conn = None
+            self._cond.notify()
+        if conn is not None:
+            conn.close()
+
+    def clear(self):
+        """Close all the idle connections."""
+        with self._cond:
+            conns = [conn for idle in self._idle.values() for conn, _ in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+
 class AbstractHTTPHandler(BaseHandler):
 
-    def __init__(self, debuglevel=0):
+    def __init__(self, debuglevel=0, pool=None):
         self._debuglevel = debuglevel
+        self._pool = pool
 
     def set_http_debuglevel(self, level):
         self._debuglevel = level
@@ -1068,27 +1169,17 @@ class AbstractHTTPHandler(BaseHandler):
         host = req.host
         if not host:
             raise URLError('no host given')
+        if self._pool is not None:
+            return self._do_open_pooled(http_class, req, **http_conn_args)
         h = http_class(host, timeout=req.timeout, **http_conn_args)
         h.set_debuglevel(self._debuglevel)
-        headers = dict(req.unredirected_hdrs)
-        headers.update(dict((k, v) for k, v in req.headers.items() if k not in
-            headers))
+        headers = self._request_headers(req)
         headers['Connection'] = 'close'
-        headers = dict((name.title(), val) for name, val in headers.items())
+        tunnel_headers = self._tunnel_headers(req, headers)
         if req._tunnel_host:
-            tunnel_headers = {}
-            proxy_auth_hdr = 'Proxy-Authorization'
-            if proxy_auth_hdr in headers:
-                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
-                del headers[proxy_auth_hdr]
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
         try:
-            try:
-                h.request(req.get_method(), req.selector, req.data, headers,
-                    encode_chunked=req.has_header('Transfer-encoding'))
-            except OSError as err:
-                raise URLError(err)
-            r = h.getresponse()
+            r = self._send_request(h, req, headers)
         except:
             h.close()
             raise
@@ -1099,8 +1190,78 @@ class AbstractHTTPHandler(BaseHandler):
         r.msg = r.reason
         return r
 
+    def _request_headers(self, req):
+        headers = dict(req.unredirected_hdrs)
+        headers.update(dict((k, v) for k, v in req.headers.items() if k not in
+            headers))
+        return dict((name.title(), val) for name, val in headers.items())
+
+    def _tunnel_headers(self, req, headers):
+        tunnel_headers = {}
+        if req._tunnel_host:
+            proxy_auth_hdr = 'Proxy-Authorization'
+            if proxy_auth_hdr in headers:
+                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
+                del headers[proxy_auth_hdr]
+        return tunnel_headers
+
+    def _send_request(self, h, req, headers):
+        try:
+            h.request(req.get_method(), req.selector, req.data, headers,
+                encode_chunked=req.has_header('Transfer-encoding'))
+        except OSError as err:
+            raise URLError(err)
+        return h.getresponse()
+
+    def _do_open_pooled(self, http_class, req, **http_conn_args):
+        """Like do_open(), but take the connection from self._pool and
+        give it back once the response has been read."""
+        pool = self._pool
+        headers = self._request_headers(req)
+        tunnel_headers = self._tunnel_headers(req, headers)
+        key = http_class, req.host, req._tunnel_host, tuple(sorted(
+            tunnel_headers.items())), tuple(sorted(http_conn_args.items()))
+        h = pool._acquire(key, _timeout_value(req.timeout))
+        reused = h is not None
+        replayable = req.get_method() in _IDEMPOTENT_METHODS and (req.data is
+            None or isinstance(req.data, (bytes, bytearray)))
+        while True:
+            if h is None:
+                h = http_class(req.host, timeout=req.timeout, **http_conn_args)
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            else:
+                h.timeout = req.timeout
+                h.sock.settimeout(_timeout_value(req.timeout))
+            h.set_debuglevel(self._debuglevel)
+            try:
+                r = self._send_request(h, req, headers)
+            except BaseException as exc:
+                err = exc.reason if isinstance(exc, URLError) else exc
+                if reused and replayable and isinstance(err,
+                    _STALE_CONNECTION_ERRORS):
+                    h.close()
+                    h = None
+                    reused = False
+                    continue
+                pool._release(key, h, False)
+                raise
+            break
+        if r.will_close:
+            pool._release(key, h, False)
+        else:
+            r.release_conn = functools.partial(pool._release, key, h)
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
 
 class HTTPHandler(AbstractHTTPHandler):
+    """Handle http URLs.
+
+    If pool is an HTTPConnectionPool, requests reuse its persistent
+    connections instead of opening a new connection every time.
+    """
 
     def http_open(self, req):
         return self.do_open(http.client.HTTPConnection, req)
@@ -1112,8 +1273,9 @@ if hasattr(http.client, 'HTTPSConnection'):
 
     class HTTPSHandler(AbstractHTTPHandler):
 
-        def __init__(self, debuglevel=0, context=None, check_hostname=None):
-            AbstractHTTPHandler.__init__(self, debuglevel)
+        def __init__(self, debuglevel=0, context=None, check_hostname=None,
+            pool=None):
+            AbstractHTTPHandler.__init__(self, debuglevel, pool)
             self._context = context
             self._check_hostname = check_hostname
 